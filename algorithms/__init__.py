@@ -1,6 +1,29 @@
-from .algorithm import Algorithm
-from .astar import AStarAlgorithm
-from .bfs import BFSAlgorithm
-from .dfs import LimitedDFSAlgorithm
-from .genetic_algorithm import GeneticAlgorithm
-from .decision_tree import DecisionTreeAlgorithm
+import importlib
+
+from .algorithm import Algorithm
+from .game_state import CompactState, StateModel
+from .race_map import RaceMap
+from .registry import (ALGORITHMS, LazyAlgorithms, algorithm_names, algorithm_params,
+                       create_algorithm, get_algorithm_class, is_deterministic, register_algorithm)
+
+# Algoritma sınıfları ve numpy gerektiren yardımcılar ilk erişimde içe aktarılır (PEP 562)
+_LAZY_EXPORTS = {
+    "AStarAlgorithm": ".astar",
+    "SafeAStarAlgorithm": ".astar",
+    "BFSAlgorithm": ".bfs",
+    "SafeBFSAlgorithm": ".bfs",
+    "LimitedDFSAlgorithm": ".dfs",
+    "GeneticAlgorithm": ".genetic_algorithm",
+    "DecisionTreeAlgorithm": ".decision_tree",
+    "CooperativeGhostPlanner": ".cooperative",
+    "AdversarialSearchAlgorithm": ".adversarial",
+    "MonteCarloTreeSearchAlgorithm": ".mcts",
+    "TiledGrid": ".maze_grid",
+    "DynamicMaze": ".dynamic_maze",
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,290 @@
+import time
+
+from .algorithm import Algorithm
+from .game_state import PLAYING, UNREACHABLE, WON, StateModel
+
+WIN_SCORE = 1000000
+LOSS_SCORE = -1000000
+
+# Geçiş tablosu kayıt türleri
+EXACT, LOWER, UPPER = 0, 1, 2
+
+class _SearchTimeout(Exception):
+    """Süre doldu; son tamamlanan derinliğin sonucu kullanılır"""
+
+class _Search:
+    """
+    Tek bir aramanın durumu
+
+    Aynı örnek birden çok ajan için kullanılabilir ve zamanlayıcı aramaları
+    iç içe sürdürebilir; bu yüzden süre, düğüm sayacı ve model her aramada ayrı
+    tutulur.
+    """
+    __slots__ = ('model', 'table', 'deadline', 'nodes')
+
+    def __init__(self, model, table, deadline):
+        self.model = model
+        self.table = table        # Kökteki sıranın geçiş tablosu
+        self.deadline = deadline
+        self.nodes = 0
+
+class AdversarialSearchAlgorithm(Algorithm):
+    """
+    Hayaletleri hesaba katan çekişmeli arama (alfa-beta veya expectimax)
+
+    Sıra tabanlı oyun ağacı: önce Pac-Man, sonra hayaletler sırayla hamle yapar;
+    bir tur tüm ajanların bir hamlesidir. Arama, hamle başına süre sınırı dolana
+    kadar derinliği bir tur artırarak (iterative deepening) tekrarlanır. Geçiş
+    tablosu hem tekrarlanan durumları hem de önceki derinliğin en iyi hamlesini
+    saklar; hamleler labirent mesafelerine göre sıralanır.
+
+    mode='expectimax' iken hayaletler, greed olasılıkla Pac-Man'e en kısa yoldan
+    yaklaşan, kalan olasılıkla rastgele hamle yapan stokastik ajanlar sayılır.
+    """
+
+    replan_each_tick = True  # Yalnızca bir sonraki hamle döndürülür
+    single_move = True
+
+    def __init__(self, maze, mode='alphabeta', time_limit_ms=20, max_depth=12, greed=0.8,
+                 table_size=200000):
+        """
+        Parametreler:
+        - mode: 'alphabeta' veya 'expectimax'
+        - time_limit_ms: Hamle başına arama süresi
+        - max_depth: En fazla arama derinliği (tur)
+        - greed: Expectimax'ta hayaletin en kısa yoldan kovalama olasılığı
+        - table_size: Geçiş tablosundaki en fazla kayıt
+        """
+        super().__init__(maze)
+        if mode not in ('alphabeta', 'expectimax'):
+            raise ValueError(f"Bilinmeyen mod: {mode}")
+        self.mode = mode
+        self.time_limit_ms = time_limit_ms
+        self.max_depth = max_depth
+        self.greed = greed
+        self.table_size = table_size
+        self.model = None
+        self.version = None  # Geçiş tablolarının dayandığı labirent sürümü
+        # Kökteki sıra -> {(durum anahtarı, sıra): (derinlik, değer, tür, en iyi hamle)}
+        self.tables = {}
+        self.last_depth = 0  # Son aramada tamamlanan derinlik
+
+    def find_path(self, start, goal, **kwargs):
+        """Çekişmeli aramayla bir sonraki hamleyi bulur: [start, sonraki konum]"""
+        return self.run_plan(self.plan(start, goal, **kwargs))
+
+    def plan(self, start, goal, **kwargs):
+        """
+        Derinleşen aramayı üreteç olarak çalıştırır; her tamamlanan derinlikten
+        sonra o derinliğin en iyi hamlesini ara sonuç olarak verir
+
+        Parametreler:
+        - kwargs: pacman, ghosts, coins; hayalet için is_ghost ve current_ghost_index
+        """
+        pacman = kwargs.get('pacman')
+        if pacman is None:
+            return []
+        ghosts = kwargs.get('ghosts', [])
+        coins = kwargs.get('coins', [])
+
+        state = self.model.state_from_views(pacman, ghosts, coins) if self.model is not None else None
+        if state is None:
+            # Yeni oyun ya da yeni coin yerleşimi: bit düzeni değişti
+            self.model, state = StateModel.from_views(self.maze, pacman, ghosts, coins)
+            self.tables = {}
+        if self.version != self.model.kernel.version:
+            # Duvarlar değişti: saklanan değerler ve en iyi hamleler geçersiz
+            self.version = self.model.kernel.version
+            self.tables = {}
+        model = self.model
+
+        turn = kwargs.get('current_ghost_index', 0) + 1 if kwargs.get('is_ghost') else 0
+        if turn and turn > len(state.ghosts):
+            return []
+
+        search = _Search(model, self.tables.setdefault(turn, {}),
+                         time.perf_counter() + self.time_limit_ms / 1000.0)
+        best_move = None
+        self.last_depth = 0
+        try:
+            for depth in range(1, self.max_depth + 1):
+                best_move = self._search_root(search, state, depth, turn)
+                self.last_depth = depth
+                yield [start, model.position(best_move)]
+        except _SearchTimeout:
+            pass
+        finally:
+            self.call_stats.nodes_expanded += search.nodes
+            if len(search.table) > self.table_size:
+                search.table.clear()
+
+        if best_move is None:
+            # İlk derinlik bile bitmedi: sıralamadaki ilk hamle
+            best_move = self._ordered_moves(search, state, turn, None)[0]
+        return [start, model.position(best_move)]
+
+    def _search_root(self, search, state, depth, turn):
+        """Kökteki hamleleri değerlendirir ve en iyisini döndürür"""
+        maximizing = turn == 0
+        entry = search.table.get((state.key(), turn))
+        moves = self._ordered_moves(search, state, turn, entry[3] if entry else None)
+        alpha, beta = LOSS_SCORE - 1, WIN_SCORE + 1
+        best_move, best_value = moves[0], None
+        for move in moves:
+            child, next_turn, next_depth = self._apply(search, state, turn, move, depth)
+            value = self._search(search, child, next_depth, next_turn, alpha, beta, 1)
+            if best_value is None or (value > best_value if maximizing else value < best_value):
+                best_move, best_value = move, value
+            if self.mode == 'alphabeta':
+                if maximizing:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+        search.table[(state.key(), turn)] = (depth, best_value, EXACT, best_move)
+        return best_move
+
+    @staticmethod
+    def _apply(search, state, turn, move, depth):
+        """Sıradaki ajanın hamlesini uygular; (yeni durum, sonraki sıra, kalan derinlik)"""
+        if turn == 0:
+            child = search.model.move_pacman(state, move)
+        else:
+            child = search.model.move_ghost(state, turn - 1, move)
+        next_turn = turn + 1
+        if next_turn > len(state.ghosts):
+            return child, 0, depth - 1
+        return child, next_turn, depth
+
+    def _search(self, search, state, depth, turn, alpha, beta, ply):
+        """Alfa-beta / expectimax özyinelemesi; değer Pac-Man'in bakış açısından"""
+        search.nodes += 1
+        if not search.nodes & 255 and time.perf_counter() > search.deadline:
+            raise _SearchTimeout()
+
+        if state.status != PLAYING:
+            # Erken kazanç ve geç kayıp tercih edilir
+            return WIN_SCORE - ply if state.status == WON else LOSS_SCORE + ply
+        if depth == 0 and turn == 0:
+            return self.evaluate(state, search.model)
+
+        key = (state.key(), turn)
+        entry = search.table.get(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry[3]
+            if entry[0] >= depth:
+                self.call_stats.cache_hits += 1
+                value, kind = entry[1], entry[2]
+                if kind == EXACT:
+                    return value
+                if kind == LOWER and value >= beta:
+                    return value
+                if kind == UPPER and value <= alpha:
+                    return value
+
+        moves = self._ordered_moves(search, state, turn, tt_move)
+        if turn and self.mode == 'expectimax':
+            value, best_move = self._chance_node(search, state, depth, turn, moves, ply)
+            kind = EXACT
+        else:
+            value, best_move, kind = self._minimax_node(search, state, depth, turn, moves, alpha, beta, ply)
+
+        if entry is None or entry[0] <= depth:
+            search.table[key] = (depth, value, kind, best_move)
+        return value
+
+    def _minimax_node(self, search, state, depth, turn, moves, alpha, beta, ply):
+        """Pac-Man (maks.) ya da hayalet (min.) düğümü, alfa-beta budamalı"""
+        original_alpha, original_beta = alpha, beta
+        maximizing = turn == 0
+        best_value = LOSS_SCORE - 1 if maximizing else WIN_SCORE + 1
+        best_move = moves[0]
+        for move in moves:
+            child, next_turn, next_depth = self._apply(search, state, turn, move, depth)
+            value = self._search(search, child, next_depth, next_turn, alpha, beta, ply + 1)
+            if maximizing:
+                if value > best_value:
+                    best_value, best_move = value, move
+                alpha = max(alpha, value)
+            else:
+                if value < best_value:
+                    best_value, best_move = value, move
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= original_alpha:
+            kind = UPPER
+        elif best_value >= original_beta:
+            kind = LOWER
+        else:
+            kind = EXACT
+        return best_value, best_move, kind
+
+    def _chance_node(self, search, state, depth, turn, moves, ply):
+        """Stokastik hayalet düğümü: hamlelerin olasılık ağırlıklı ortalaması"""
+        dist = search.model.distances(state.pacman)
+        closest = min(dist[move] for move in moves)
+        chasing = [move for move in moves if dist[move] == closest]
+        expected = 0.0
+        best_move, best_value = moves[0], None
+        for move in moves:
+            probability = (1 - self.greed) / len(moves)
+            if move in chasing:
+                probability += self.greed / len(chasing)
+            child, next_turn, next_depth = self._apply(search, state, turn, move, depth)
+            value = self._search(search, child, next_depth, next_turn, LOSS_SCORE - 1, WIN_SCORE + 1, ply + 1)
+            expected += probability * value
+            if best_value is None or value < best_value:
+                best_move, best_value = move, value
+        return expected, best_move
+
+    @staticmethod
+    def _ordered_moves(search, state, turn, tt_move):
+        """
+        Sıradaki ajanın hamleleri, umut verici olanlar önce
+
+        Pac-Man için: coin toplayan, sonra en yakın coine labirent mesafesi kısa
+        olan hamleler; hayaletler için Pac-Man'e labirent mesafesi kısa olanlar.
+        Geçiş tablosundaki en iyi hamle her zaman ilk sıradadır.
+        """
+        model = search.model
+        if turn == 0:
+            cell = state.pacman
+            ranked = sorted(model.moves[cell], key=lambda move: (
+                not model.coin_mask[move] & state.coins,
+                model.nearest_coin_distance(state, move)
+            ))
+        else:
+            dist = model.distances(state.pacman)
+            ranked = sorted(model.moves[state.ghosts[turn - 1]], key=dist.__getitem__)
+        if tt_move is not None and tt_move in ranked and ranked[0] != tt_move:
+            ranked.remove(tt_move)
+            ranked.insert(0, tt_move)
+        return ranked
+
+    def evaluate(self, state, model=None):
+        """
+        Sonlanmamış bir durumun Pac-Man açısından değeri
+
+        Toplanan coinler ödüllendirilir; en yakın coine ve hayaletlere olan labirent
+        mesafeleri sırasıyla yakınlık ödülü ve tehlike cezası olarak eklenir.
+
+        Parametreler:
+        - model: Durumun ait olduğu StateModel (varsayılan: son aramanın modeli)
+        """
+        if model is None:
+            model = self.model
+        value = 100 * state.score
+        if state.coins:
+            value -= 2 * min(model.nearest_coin_distance(state), 50)
+        dist = model.distances(state.pacman)
+        for ghost in state.ghosts:
+            d = dist[ghost]
+            if d == UNREACHABLE:
+                continue
+            if d <= 1:
+                value -= 400
+            elif d == 2:
+                value -= 50
+        return value
@@ -1,29 +1,146 @@
-from abc import ABC, abstractmethod
-
-class Algorithm(ABC):
-    """Tüm algoritmaların temel sınıfı"""
-    
-    def __init__(self, maze):
-        self.maze = maze
-    
-    @abstractmethod
-    def find_path(self, start, goal, **kwargs):
-        """
-        start: Başlangıç pozisyonu (x, y)
-        goal: Hedef pozisyonu (x, y)
-        kwargs: Ekstra parametreler (coin'ler, hayaletler gibi)
-        
-        Dönüş: Hareketleri içeren bir liste [(x1, y1), (x2, y2), ...]
-        """
-        pass
-    
-    def get_neighbors(self, pos):
-        """Belirli bir pozisyonun geçerli komşularını döndürür"""
-        neighbors = []
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Aşağı, Sağ, Yukarı, Sol
-            new_x, new_y = pos[0] + dx, pos[1] + dy
-            if (0 <= new_x < len(self.maze[0]) and 
-                0 <= new_y < len(self.maze) and 
-                self.maze[new_y][new_x] == 0):  # Duvar değilse
-                neighbors.append((new_x, new_y))
+import functools
+import time
+from abc import ABC, abstractmethod
+
+from .metrics import AlgorithmMetrics, CallStats
+
+def _instrumented(find_path):
+    """find_path'i süre, iş sayaçları ve yol uzunluğu ölçümüyle sarar"""
+    @functools.wraps(find_path)
+    def wrapper(self, start, goal, **kwargs):
+        metrics = self.metrics
+        if metrics is None or self._measuring:
+            # Ölçüm kapalı ya da üst sınıfın find_path'i içinden çağrıldı
+            return find_path(self, start, goal, **kwargs)
+        
+        stats = self.call_stats
+        stats.reset()
+        self._measuring = True
+        started = time.perf_counter_ns()
+        try:
+            path = find_path(self, start, goal, **kwargs)
+        finally:
+            self._measuring = False
+        metrics.record(time.perf_counter_ns() - started, len(path) if path else 0, stats)
+        return path
+    return wrapper
+
+def _instrumented_plan(plan):
+    """
+    plan üretecini find_path ile aynı ölçümle sarar
+    
+    Süre yalnızca üretecin içinde geçen zamandır (duraklamalar sayılmaz); plan
+    bitince tek bir çağrı olarak kaydedilir. Her üretecin kendi sayaçları vardır;
+    çalıştığı sürece self.call_stats onlara işaret eder, böylece aynı örneğin
+    birden çok duraklatılmış planı (ör. zaman bütçeli modda) birbirini bozmaz.
+    """
+    @functools.wraps(plan)
+    def wrapper(self, start, goal, **kwargs):
+        metrics = self.metrics
+        if metrics is None or self._measuring:
+            return (yield from plan(self, start, goal, **kwargs))
+        
+        stats = CallStats()
+        inner = plan(self, start, goal, **kwargs)
+        elapsed = 0
+        while True:
+            outer_stats = self.call_stats
+            self.call_stats = stats
+            self._measuring = True
+            started = time.perf_counter_ns()
+            try:
+                partial = next(inner)
+            except StopIteration as stop:
+                path = stop.value
+                break
+            finally:
+                elapsed += time.perf_counter_ns() - started
+                self._measuring = False
+                self.call_stats = outer_stats
+            yield partial
+        metrics.record(elapsed, len(path) if path else 0, stats)
+        return path
+    return wrapper
+
+class Algorithm(ABC):
+    """Tüm algoritmaların temel sınıfı"""
+    
+    collect_metrics = True  # Yeni örneklerde ölçüm varsayılan olarak açık mı
+    deterministic = False   # Aynı labirent ve girdilerle her zaman aynı yolu mu döndürür
+    replan_each_tick = False  # Pac-Man olarak her adımdan sonra yeniden mi planlanır
+    single_move = False     # Yalnızca tüm oyun durumuna bağlı bir sonraki hamleyi mi döndürür
+    _measuring = False
+    
+    def __init__(self, maze):
+        self.maze = maze
+        self.call_stats = CallStats()  # Geçerli çağrının iş sayaçları
+        self.metrics = AlgorithmMetrics() if self.collect_metrics else None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Alt sınıfın find_path'i ve plan'ı ölçüm sarmalayıcılarıyla değiştirilir
+        find_path = cls.__dict__.get('find_path')
+        if find_path is not None and not getattr(find_path, '__isabstractmethod__', False):
+            cls.find_path = _instrumented(find_path)
+        plan = cls.__dict__.get('plan')
+        if plan is not None:
+            cls.plan = _instrumented_plan(plan)
+    
+    def enable_metrics(self, enabled=True):
+        """find_path ve plan ölçümünü açar ya da kapatır (kapalıyken ek yük tek bir kontroldür)"""
+        if not enabled:
+            self.metrics = None
+        elif self.metrics is None:
+            self.metrics = AlgorithmMetrics()
+    
+    @abstractmethod
+    def find_path(self, start, goal, **kwargs):
+        """
+        start: Başlangıç pozisyonu (x, y)
+        goal: Hedef pozisyonu (x, y)
+        kwargs: Ekstra parametreler (coin'ler, hayaletler gibi)
+        
+        Dönüş: Hareketleri içeren bir liste [(x1, y1), (x2, y2), ...]
+        """
+        pass
+    
+    def plan(self, start, goal, **kwargs):
+        """
+        find_path'in devam ettirilebilir (anytime) sürümü
+        
+        Üreteç olarak çalışır: arama sürerken o ana kadarki en iyi yolu yield eder
+        (henüz hamle yoksa None), arama bitince nihai yolu return eder.
+        Varsayılan uygulama find_path'i tek parçada çalıştırır.
+        """
+        return self.find_path(start, goal, **kwargs)
+        yield  # Metodu üreteç yapar
+    
+    @staticmethod
+    def run_plan(plan):
+        """Bir plan üretecini sonuna kadar çalıştırır ve nihai yolu döndürür"""
+        while True:
+            try:
+                next(plan)
+            except StopIteration as stop:
+                return stop.value if stop.value is not None else []
+    
+    def fallback_path(self, start, goal):
+        """Hazır hamle yokken kullanılan ucuz yedek: hedefe en çok yaklaştıran komşu"""
+        best_pos = None
+        best_dist = abs(start[0] - goal[0]) + abs(start[1] - goal[1])
+        for pos in self.get_neighbors(start):
+            dist = abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
+            if dist < best_dist:
+                best_pos, best_dist = pos, dist
+        return [start, best_pos] if best_pos else [start]
+    
+    def get_neighbors(self, pos):
+        """Belirli bir pozisyonun geçerli komşularını döndürür"""
+        neighbors = []
+        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Aşağı, Sağ, Yukarı, Sol
+            new_x, new_y = pos[0] + dx, pos[1] + dy
+            if (0 <= new_x < len(self.maze[0]) and 
+                0 <= new_y < len(self.maze) and 
+                self.maze[new_y][new_x] == 0):  # Duvar değilse
+                neighbors.append((new_x, new_y))
         return neighbors
\ No newline at end of file
@@ -1,44 +1,61 @@
-import heapq
-from .algorithm import Algorithm
-
-class AStarAlgorithm(Algorithm):
-    """A* Arama Algoritması Sınıfı"""
-    
-    def __init__(self, maze):
-        super().__init__(maze)
-    
-    def heuristic(self, a, b):
-        """Manhattan mesafesi hesaplar (x1-x2) + (y1-y2)"""
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-    
-    def find_path(self, start, goal, **kwargs):
-        """A* algoritması kullanarak başlangıç noktasından hedef noktasına bir yol bulur"""
-        frontier = []
-        heapq.heappush(frontier, (0, start))
-        came_from = {start: None}
-        cost_so_far = {start: 0}
-        
-        while frontier:
-            current = heapq.heappop(frontier)[1]
-            
-            if current == goal:
-                break
-                
-            for next_pos in self.get_neighbors(current):
-                new_cost = cost_so_far[current] + 1
-                if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
-                    cost_so_far[next_pos] = new_cost
-                    priority = new_cost + self.heuristic(goal, next_pos)
-                    heapq.heappush(frontier, (priority, next_pos))
-                    came_from[next_pos] = current
-        
-        # Yolu oluştur
-        path = []
-        current = goal
-        while current is not None:
-            path.append(current)
-            current = came_from.get(current)
-        path.reverse()
-        
-        # Geçerli bir yol mu kontrol et
-        return path if path and path[0] == start else []
\ No newline at end of file
+from .algorithm import Algorithm
+from .race_map import pacman_race_map
+from .search_kernel import SearchKernel
+
+class AStarAlgorithm(Algorithm):
+    """A* Arama Algoritması Sınıfı"""
+    
+    deterministic = True
+    
+    def __init__(self, maze, yield_every=64):
+        super().__init__(maze)
+        self.yield_every = yield_every  # plan() kaç düğüm genişletmede bir ara sonuç verir
+        self.kernel = SearchKernel.for_maze(maze)  # Labirent başına paylaşılan arama çekirdeği
+    
+    def heuristic(self, a, b):
+        """Manhattan mesafesi hesaplar (x1-x2) + (y1-y2)"""
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+    
+    def find_path(self, start, goal, **kwargs):
+        """A* algoritması kullanarak başlangıç noktasından hedef noktasına bir yol bulur"""
+        return self.run_plan(self.kernel.astar(start, goal, stats=self.call_stats))
+    
+    def plan(self, start, goal, **kwargs):
+        """
+        A* aramasını üreteç olarak çalıştırır
+        
+        Her yield_every genişletmede bir, hedefe en yakın genişletilmiş düğüme giden
+        yolu ara sonuç olarak verir; arama bitince tam yolu döndürür.
+        """
+        return (yield from self.kernel.astar(start, goal, self.yield_every, stats=self.call_stats))
+
+class SafeAStarAlgorithm(AStarAlgorithm):
+    """
+    Hayalet yarış haritasını kenar maliyeti katmanı olarak kullanan A*
+    
+    Pac-Man için planlarken hayaletlerin Pac-Man'den önce varabildiği hücrelere
+    unsafe_cost, Pac-Man'in danger_radius adımdan az önde olduğu hücrelere daha
+    küçük bir ek maliyet eklenir. Harita her tik yeniden kurulduğu için yol da
+    her tik yeniden planlanır. Hayalet çağrılarında düz A* gibi davranır.
+    """
+    
+    replan_each_tick = True
+    
+    def __init__(self, maze, yield_every=64, danger_radius=3, unsafe_cost=20):
+        super().__init__(maze, yield_every)
+        self.danger_radius = danger_radius
+        self.unsafe_cost = unsafe_cost
+    
+    def find_path(self, start, goal, **kwargs):
+        """Yarış haritasının maliyet katmanıyla A* araması"""
+        return self.run_plan(self._search(start, goal, 0, kwargs))
+    
+    def plan(self, start, goal, **kwargs):
+        """Maliyet katmanlı A* aramasını üreteç olarak çalıştırır"""
+        return (yield from self._search(start, goal, self.yield_every, kwargs))
+    
+    def _search(self, start, goal, yield_every, kwargs):
+        race = pacman_race_map(self.maze, start, kwargs, self.danger_radius, self.unsafe_cost,
+                               self.call_stats)
+        return self.kernel.astar(start, goal, yield_every, stats=self.call_stats,
+                                 extra_cost=race.cost if race is not None else None)
@@ -1,28 +1,54 @@
-from collections import deque
-from .algorithm import Algorithm
-
-class BFSAlgorithm(Algorithm):
-    """Breadth-First Search (Genişlik Öncelikli Arama) Algoritması Sınıfı"""
-    
-    def __init__(self, maze):
-        super().__init__(maze)
-    
-    def find_path(self, start, goal, **kwargs):
-        """BFS algoritması kullanarak başlangıç noktasından hedef noktasına bir yol bulur"""
-        # Kuyruk tabanlı arama: (konum, o konuma ulaşmak için izlenen yol)
-        frontier = deque([(start, [start])])
-        visited = {start}
-        
-        while frontier:
-            current, path = frontier.popleft()
-            
-            if current == goal:
-                return path
-                
-            for next_pos in self.get_neighbors(current):
-                if next_pos not in visited:
-                    visited.add(next_pos)
-                    new_path = path + [next_pos]
-                    frontier.append((next_pos, new_path))
-        
-        return []  # Yol bulunamadıysa boş liste döndür
\ No newline at end of file
+from .algorithm import Algorithm
+from .race_map import pacman_race_map
+from .search_kernel import SearchKernel
+
+class BFSAlgorithm(Algorithm):
+    """Breadth-First Search (Genişlik Öncelikli Arama) Algoritması Sınıfı"""
+    
+    deterministic = True
+    
+    def __init__(self, maze, yield_every=64):
+        super().__init__(maze)
+        self.yield_every = yield_every  # plan() kaç düğüm genişletmede bir ara sonuç verir
+        self.kernel = SearchKernel.for_maze(maze)  # Labirent başına paylaşılan arama çekirdeği
+    
+    def find_path(self, start, goal, **kwargs):
+        """BFS algoritması kullanarak başlangıç noktasından hedef noktasına bir yol bulur"""
+        return self.run_plan(self.kernel.bfs(start, goal, stats=self.call_stats))
+    
+    def plan(self, start, goal, **kwargs):
+        """
+        BFS aramasını üreteç olarak çalıştırır
+        
+        Ara sonuç olarak hedefe Manhattan mesafesi en küçük olan ziyaret edilmiş
+        düğüme giden yolu verir; arama bitince tam yolu (veya boş listeyi) döndürür.
+        """
+        return (yield from self.kernel.bfs(start, goal, self.yield_every, stats=self.call_stats))
+
+class SafeBFSAlgorithm(BFSAlgorithm):
+    """
+    Hayalet yarış haritasını O(1) güvenlik sorgusu olarak kullanan BFS
+    
+    Pac-Man için planlarken hayaletlerin Pac-Man'den önce varabildiği hücrelere
+    girilmez; güvenli yol yoksa düz BFS yoluna dönülür. Yol her tik yeniden
+    planlanır. Hayalet çağrılarında düz BFS gibi davranır.
+    """
+    
+    replan_each_tick = True
+    
+    def find_path(self, start, goal, **kwargs):
+        """Güvensiz hücrelerden kaçınan BFS araması"""
+        return self.run_plan(self._search(start, goal, 0, kwargs))
+    
+    def plan(self, start, goal, **kwargs):
+        """Güvensiz hücrelerden kaçınan BFS aramasını üreteç olarak çalıştırır"""
+        return (yield from self._search(start, goal, self.yield_every, kwargs))
+    
+    def _search(self, start, goal, yield_every, kwargs):
+        race = pacman_race_map(self.maze, start, kwargs, stats=self.call_stats)
+        if race is not None:
+            path = yield from self.kernel.bfs(start, goal, yield_every, stats=self.call_stats,
+                                              blocked=race.unsafe_cells())
+            if path:
+                return path
+        return (yield from self.kernel.bfs(start, goal, yield_every, stats=self.call_stats))
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+import struct
+import numpy as np
+
+MODEL_MAGIC = b'PACDTREE'
+MODEL_VERSION = 1
+UNKNOWN_MAZE = 'unknown'  # maze_hash of models whose training maze was not recorded
+_ALIGN = 64
+_ARRAYS = [
+    ('feature', '<i4'),
+    ('threshold', '<f8'),
+    ('left', '<i4'),
+    ('right', '<i4'),
+    ('value', '<i4'),
+]
+
+class ModelFormatError(ValueError):
+    """Raised when a model file cannot be used"""
+
+def _align(offset):
+    """Round offset up to the next multiple of _ALIGN"""
+    return -(-offset // _ALIGN) * _ALIGN
+
+def maze_hash(maze):
+    """Short content hash of a maze grid (shape and cell values)"""
+    grid = np.ascontiguousarray(np.asarray(maze, dtype=np.uint8))
+    digest = hashlib.sha256(repr(grid.shape).encode('ascii'))
+    digest.update(grid.tobytes())
+    return digest.hexdigest()[:16]
+
+def schema_hash(feature_names):
+    """Short hash of the ordered feature names a model expects"""
+    return hashlib.sha256('\n'.join(feature_names).encode('utf-8')).hexdigest()[:16]
+
+class CompiledTree:
+    """
+    Compiled decision tree: the trained sklearn tree flattened into NumPy arrays
+
+    Node i is a leaf when feature[i] < 0. Otherwise a row goes to left[i] if
+    row[feature[i]] <= threshold[i] and to right[i] otherwise. value[i] holds
+    the predicted class label of node i. Inference needs neither sklearn nor
+    pickle.
+    """
+
+    def __init__(self, feature, threshold, left, right, value):
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.value = np.asarray(value, dtype=np.int32)
+        self.metadata = {}
+
+        # Plain Python lists for single-row traversal (NumPy scalar indexing is slow)
+        self._feature = self.feature.tolist()
+        self._threshold = self.threshold.tolist()
+        self._left = self.left.tolist()
+        self._right = self.right.tolist()
+        self._value = self.value.tolist()
+
+        self.max_depth = self._compute_depth()
+
+    @classmethod
+    def from_sklearn(cls, classifier):
+        """Build a compiled tree from a fitted sklearn DecisionTreeClassifier"""
+        tree = classifier.tree_
+        is_leaf = tree.children_left < 0
+        feature = np.where(is_leaf, -1, tree.feature)
+        threshold = np.where(is_leaf, 0.0, tree.threshold)
+        # Same rule as classifier.predict: class with the largest count/probability
+        value = classifier.classes_[np.argmax(tree.value[:, 0, :], axis=1)]
+        return cls(feature, threshold, tree.children_left, tree.children_right, value)
+
+    def _compute_depth(self):
+        """Longest root-to-leaf path (number of splits)"""
+        depth = 0
+        stack = [(0, 0)] if self._feature else []
+        while stack:
+            node, d = stack.pop()
+            if self._feature[node] < 0:
+                depth = max(depth, d)
+            else:
+                stack.append((self._left[node], d + 1))
+                stack.append((self._right[node], d + 1))
+        return depth
+
+    def predict_one(self, row):
+        """Predict the class label of a single feature row"""
+        feature = self._feature
+        threshold = self._threshold
+        node = 0
+        while feature[node] >= 0:
+            if row[feature[node]] <= threshold[node]:
+                node = self._left[node]
+            else:
+                node = self._right[node]
+        return self._value[node]
+
+    def predict(self, X):
+        """
+        Predict class labels for many rows at once
+
+        All rows descend the tree together, one level per iteration, so the
+        cost is max_depth vectorized steps regardless of the number of rows.
+        """
+        # sklearn casts inputs to float32 before comparing with thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        nodes = np.zeros(len(X), dtype=np.intp)
+        rows = np.arange(len(X))
+
+        for _ in range(self.max_depth):
+            active = self.feature[nodes] >= 0
+            if not active.any():
+                break
+            idx = rows[active]
+            current = nodes[idx]
+            go_left = X[idx, self.feature[current]] <= self.threshold[current]
+            nodes[idx] = np.where(go_left, self.left[current], self.right[current])
+
+        return self.value[nodes]
+
+    def save(self, filepath, maze_digest=None, schema_digest=None):
+        """
+        Save the tree in the versioned, memory-mappable model format
+
+        Layout: MODEL_MAGIC, a little-endian uint32 header length, a JSON
+        header (format version, maze and feature schema hashes, array dtypes
+        and offsets), then the raw node arrays, each aligned to _ALIGN bytes.
+
+        The file is written under a temporary name and then renamed over
+        filepath, so readers that memory-mapped the old model keep a valid file.
+        """
+        arrays = {name: np.ascontiguousarray(getattr(self, name), dtype=dtype)
+                  for name, dtype in _ARRAYS}
+        layout = {}
+        offset = 0
+        for name, dtype in _ARRAYS:
+            layout[name] = {'dtype': dtype, 'offset': offset, 'length': len(arrays[name])}
+            offset = _align(offset + arrays[name].nbytes)
+
+        header = json.dumps({
+            'version': MODEL_VERSION,
+            'maze_hash': maze_digest,
+            'feature_schema': schema_digest,
+            'num_nodes': len(self.feature),
+            'arrays': layout,
+        }).encode('utf-8')
+
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(MODEL_MAGIC)
+                f.write(struct.pack('<I', len(header)))
+                f.write(header)
+                f.write(b'\0' * (_align(f.tell()) - f.tell()))
+                data_start = f.tell()
+                for name, _ in _ARRAYS:
+                    f.seek(data_start + layout[name]['offset'])
+                    f.write(arrays[name].tobytes())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, filepath, schema_digest=None):
+        """
+        Load a model saved with save(); the node arrays are memory-mapped
+
+        Raises ModelFormatError for a foreign, truncated or corrupt file, an
+        unsupported format version or (when schema_digest is given) a
+        different feature schema. The stored header is available as
+        tree.metadata.
+        """
+        with open(filepath, 'rb') as f:
+            if f.read(len(MODEL_MAGIC)) != MODEL_MAGIC:
+                raise ModelFormatError(f"{filepath} is not a decision tree model file")
+            try:
+                (header_len,) = struct.unpack('<I', f.read(4))
+                metadata = json.loads(f.read(header_len).decode('utf-8'))
+            except (struct.error, ValueError) as e:
+                raise ModelFormatError(f"{filepath} has a corrupt header: {e}") from e
+        if not isinstance(metadata, dict):
+            raise ModelFormatError(f"{filepath} has a corrupt header")
+
+        if metadata.get('version') != MODEL_VERSION:
+            raise ModelFormatError(
+                f"Unsupported model format version {metadata.get('version')} "
+                f"(expected {MODEL_VERSION})")
+        if schema_digest is not None and metadata.get('feature_schema') != schema_digest:
+            raise ModelFormatError("Model was trained with a different feature schema")
+
+        data_start = _align(len(MODEL_MAGIC) + 4 + header_len)
+        try:
+            layout = {name: (np.dtype(metadata['arrays'][name]['dtype']),
+                             int(metadata['arrays'][name]['offset']),
+                             int(metadata['arrays'][name]['length']))
+                      for name, _ in _ARRAYS}
+        except (KeyError, TypeError, ValueError) as e:
+            raise ModelFormatError(f"{filepath} has a corrupt array layout: {e}") from e
+
+        buffer = np.memmap(filepath, dtype=np.uint8, mode='r')
+        arrays = {}
+        for name, (dtype, offset, length) in layout.items():
+            start = data_start + offset
+            end = start + length * dtype.itemsize
+            if offset < 0 or length < 0 or end > len(buffer):
+                raise ModelFormatError(f"{filepath} is truncated: array {name!r} ends at byte "
+                                       f"{end}, file has {len(buffer)}")
+            arrays[name] = buffer[start:end].view(dtype)
+
+        tree = cls(arrays['feature'], arrays['threshold'], arrays['left'],
+                   arrays['right'], arrays['value'])
+        tree.metadata = metadata
+        return tree
@@ -0,0 +1,208 @@
+import heapq
+
+from .algorithm import Algorithm
+from .search_kernel import SearchKernel
+
+class ReservationTable:
+    """
+    Ajanların planlarının uzay-zaman rezervasyonları
+
+    Hücre rezervasyonu (hücre, t) aynı tikte iki ajanın aynı hücrede olmasını,
+    kenar rezervasyonu (a, b, t) iki ajanın aynı adımda yer değiştirmesini
+    engeller. Zaman mutlak tik sayısıdır; her ajan yeniden planlarken yalnızca
+    kendi kayıtlarını bırakır.
+    """
+
+    def __init__(self):
+        self.cells = {}   # (hücre, t) -> ajan
+        self.edges = {}   # (a, b, t) -> ajan; t'de a'dan çıkıp t + 1'de b'ye varış
+        self._owned = {}  # ajan -> (hücre anahtarları, kenar anahtarları)
+
+    def reserve_path(self, agent, cells, start_time):
+        """cells[k] hücresini start_time + k tikinde ajana ayırır"""
+        cell_keys, edge_keys = self._owned.setdefault(agent, ([], []))
+        for step, cell in enumerate(cells):
+            key = (cell, start_time + step)
+            self.cells[key] = agent
+            cell_keys.append(key)
+            if step:
+                key = (cells[step - 1], cell, start_time + step - 1)
+                self.edges[key] = agent
+                edge_keys.append(key)
+
+    def release(self, agent):
+        """Ajanın tüm rezervasyonlarını bırakır"""
+        cell_keys, edge_keys = self._owned.pop(agent, ((), ()))
+        for key in cell_keys:
+            if self.cells.get(key) == agent:
+                del self.cells[key]
+        for key in edge_keys:
+            if self.edges.get(key) == agent:
+                del self.edges[key]
+
+    def is_free(self, cell, time, agent):
+        """Hücre o tikte başka bir ajana ayrılmamış mı"""
+        owner = self.cells.get((cell, time))
+        return owner is None or owner == agent
+
+    def can_move(self, source, target, time, agent):
+        """Ajan time'da source'tan target'a geçebilir mi (karşı yönde geçen yoksa)"""
+        owner = self.edges.get((target, source, time))
+        return owner is None or owner == agent
+
+    def clear(self):
+        self.cells.clear()
+        self.edges.clear()
+        self._owned.clear()
+
+    def __len__(self):
+        return len(self.cells)
+
+class CooperativeGhostPlanner(Algorithm):
+    """
+    Rezervasyon tablosuyla ortak hayalet planlayıcısı (pencereli ortak A*)
+
+    Her hayalet, önce planlanmış hayaletlerin tuttuğu (hücre, tik) ve kenar
+    rezervasyonlarına girmeden, horizon adımlık bir uzay-zaman A* araması yapar
+    ve kendi yolunu tabloya yazar. Pencere sonundaki kalan mesafe Pac-Man'den
+    yapılan BFS ile tam olarak bilinir; bu yüzden sezgisel kesindir.
+
+    Planlar kayan pencere boyunca yeniden kullanılır: hayalet planındaki hücrede
+    olduğu, plan replan_every tikten eski olmadığı ve Pac-Man plan hedefinden
+    retarget_distance'tan fazla uzaklaşmadığı sürece arama yapılmaz. Duvarlar
+    değişirse yalnızca değişen hücrelerden geçen planlar bırakılır ve hedefin
+    mesafe alanı etkilenen bölgede onarılır. Pac-Man için çağrıldığında düz A*
+    gibi davranır.
+    """
+
+    deterministic = True
+
+    def __init__(self, maze, horizon=8, replan_every=4, retarget_distance=2):
+        """
+        Parametreler:
+        - horizon: Uzay-zaman aramasının pencere uzunluğu (adım)
+        - replan_every: Bir planın en fazla kaç tik kullanılacağı
+        - retarget_distance: Pac-Man'in plan hedefinden bu Manhattan mesafesinden
+          fazla uzaklaşması planı geçersiz kılar
+        """
+        super().__init__(maze)
+        self.horizon = horizon
+        self.replan_every = replan_every
+        self.retarget_distance = retarget_distance
+        self.kernel = SearchKernel.for_maze(maze)
+        self.table = ReservationTable()
+        self.plans = {}  # hayalet -> (başlangıç tiki, hücreler, hedef hücre)
+        self.now = 0     # Planlayıcının tik sayacı
+        self._last_agent = None
+        self._goal = None        # Mesafe alanının hesaplandığı hedef hücre
+        self._goal_dist = None
+        self._version = self.kernel.version  # Planların ve alanın dayandığı labirent sürümü
+
+    def find_path(self, start, goal, **kwargs):
+        """
+        Hayalet için rezervasyonlara uyan yolu döndürür: [konum, sonraki, ...]
+
+        Hayaletler her tik sırayla (current_ghost_index) çağrılır; sıra başa
+        dönünce planlayıcının saati bir tik ilerler.
+        """
+        if not kwargs.get('is_ghost'):
+            return self.run_plan(self.kernel.astar(start, goal, stats=self.call_stats))
+
+        agent = kwargs.get('current_ghost_index', 0)
+        if self._last_agent is not None and agent <= self._last_agent:
+            self.now += 1
+        self._last_agent = agent
+
+        kernel = self.kernel
+        if self._version != kernel.version:
+            self._apply_wall_changes()
+        start_i, goal_i = kernel.index(start), kernel.index(goal)
+        if start_i < 0 or goal_i < 0:
+            return []
+
+        plan = self.plans.get(agent)
+        if plan is not None:
+            plan_start, cells, plan_goal = plan
+            step = self.now - plan_start
+            if step < self.replan_every and step < len(cells) - 1 and cells[step] == start_i and \
+                    abs(kernel.xs[goal_i] - kernel.xs[plan_goal]) + \
+                    abs(kernel.ys[goal_i] - kernel.ys[plan_goal]) <= self.retarget_distance:
+                self.call_stats.cache_hits += 1
+                return [kernel.position(cell) for cell in cells[step:]]
+
+        self.table.release(agent)
+        cells = self._space_time_search(agent, start_i, goal_i)
+        self.table.reserve_path(agent, cells, self.now)
+        self.plans[agent] = (self.now, cells, goal_i)
+        return [kernel.position(cell) for cell in cells]
+
+    def reset(self):
+        """Planları, rezervasyonları ve saati sıfırlar (ör. yeni oyun)"""
+        self.table.clear()
+        self.plans.clear()
+        self.now = 0
+        self._last_agent = None
+
+    def _apply_wall_changes(self):
+        """Değişen hücrelerden geçen planları bırakır, hedefin mesafe alanını onarır"""
+        kernel = self.kernel
+        changed = kernel.changes_since(self._version)
+        self._version = kernel.version
+        for agent, (_, cells, _) in list(self.plans.items()):
+            if not changed.isdisjoint(cells):
+                self.table.release(agent)
+                del self.plans[agent]
+        if self._goal_dist is not None:
+            kernel.repair_distance_field(self._goal_dist, [self._goal], changed, self.call_stats)
+
+    def _space_time_search(self, agent, start, goal):
+        """
+        horizon adımlık uzay-zaman A*; bekleme de bir hamledir
+
+        Pac-Man'in hücresi (hedef) rezervasyonlardan muaftır. Pencere sonuna
+        varan düğümlerin maliyeti geçen adım artı kalan gerçek mesafedir.
+
+        Dönüş: Başlangıçtan itibaren hücre listesi (hamle yoksa yalnızca başlangıç)
+        """
+        if self._goal != goal:
+            self._goal = goal
+            self._goal_dist = self.kernel.distance_field([goal], self.call_stats)
+        dist = self._goal_dist
+        if dist[start] is None:
+            return [start]
+
+        table, neighbors, now = self.table, self.kernel.neighbors, self.now
+        parent = {(start, 0): None}
+        heap = [(dist[start], dist[start], 0, start)]
+        expanded = 0
+        frontier_peak = 1
+        end = (start, 0)
+        while heap:
+            if len(heap) > frontier_peak:
+                frontier_peak = len(heap)
+            _, h, t, cell = heapq.heappop(heap)
+            if h == 0 or t == self.horizon:
+                end = (cell, t)
+                break
+            expanded += 1
+            for nxt in neighbors(cell) + [cell]:
+                node = (nxt, t + 1)
+                if node in parent or dist[nxt] is None:
+                    continue
+                if nxt != goal and not table.is_free(nxt, now + t + 1, agent):
+                    continue
+                if not table.can_move(cell, nxt, now + t, agent):
+                    continue
+                parent[node] = (cell, t)
+                heapq.heappush(heap, (t + 1 + dist[nxt], dist[nxt], t + 1, nxt))
+
+        self.call_stats.nodes_expanded += expanded
+        self.call_stats.frontier_peak = max(self.call_stats.frontier_peak, frontier_peak)
+
+        cells = []
+        node = end
+        while node is not None:
+            cells.append(node[0])
+            node = parent[node]
+        cells.reverse()
+        return cells
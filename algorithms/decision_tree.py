@@ -1,389 +1,504 @@
-from .algorithm import Algorithm
-import numpy as np
-import os
-import pickle
-from sklearn.tree import DecisionTreeClassifier, export_graphviz
-
-class DecisionTreeAlgorithm(Algorithm):
-    """Decision Tree Algorithm for Pac-Man"""
-    
-    def __init__(self, maze):
-        super().__init__(maze)
-        self.classifier = None
-        self.features = [
-            "goal_distance_x",
-            "goal_distance_y",
-            "closest_ghost_distance",
-            "closest_ghost_direction_x",
-            "closest_ghost_direction_y",
-            "can_move_up",
-            "can_move_right",
-            "can_move_down",
-            "can_move_left"
-        ]
-        
-        # Try to load a pre-trained model if it exists
-        self.load_model()
-        
-    def load_model(self, filepath=None):
-        """Load a trained model from disk"""
-        if filepath is None:
-            # Proje kök dizinini temel alan mutlak yol
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            filepath = os.path.join(base_dir, 'dt-model', 'pacman_decision_tree.pkl')
-        
-        try:
-            if os.path.exists(filepath):
-                with open(filepath, 'rb') as f:
-                    self.classifier = pickle.load(f)
-                print(f"Karar ağacı modeli yüklendi: {filepath}")
-                return True
-            else:
-                print(f"Model dosyası bulunamadı: {filepath}")
-        except Exception as e:
-            print(f"Model yükleme hatası: {e}")
-        return False
-    
-    def save_model(self, filepath=None):
-        """Save the trained model to disk"""
-        if filepath is None:
-            # Proje kök dizinini temel alan mutlak yol
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            filepath = os.path.join(base_dir, 'dt-model', 'pacman_decision_tree.pkl')
-            
-            # Dizin yoksa oluştur
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
-        if self.classifier:
-            try:
-                with open(filepath, 'wb') as f:
-                    pickle.dump(self.classifier, f)
-                print(f"Karar ağacı modeli kaydedildi: {filepath}")
-                return True
-            except Exception as e:
-                print(f"Model kaydetme hatası: {e}")
-        return False
-    
-    def train(self, training_data):
-        """
-        Train the decision tree classifier with generated data
-        
-        Parameters:
-        - training_data: List of (features, action) pairs
-        """
-        if not training_data:
-            print("Eğitim verisi yok!")
-            return False
-            
-        # Extract features and labels
-        X = np.array([item[0] for item in training_data])
-        y = np.array([item[1] for item in training_data])
-        
-        print(f"Karar ağacı eğitiliyor... {len(X)} örnek kullanılıyor.")
-        
-        # Create and train the classifier
-        self.classifier = DecisionTreeClassifier(max_depth=5, random_state=42)
-        self.classifier.fit(X, y)
-        
-        # Save the trained model
-        self.save_model()
-        
-        print("Karar ağacı eğitimi tamamlandı.")
-        return True
-    
-    def generate_features(self, current_pos, goal_pos, ghosts, coins, maze=None):
-        """
-        Generate features for the decision tree
-        
-        Parameters:
-        - current_pos: Pac-Man's current position (x, y)
-        - goal_pos: Target position (x, y) (usually nearest coin)
-        - ghosts: List of ghost positions [(x, y), ...]
-        - coins: List of coin positions [(x, y), ...]
-        - maze: 2D grid representation of the maze (optional)
-        
-        Returns:
-        - features: List of numerical features
-        """
-        if maze is None:
-            maze = self.maze
-            
-        # Calculate distances to goal
-        goal_distance_x = goal_pos[0] - current_pos[0]
-        goal_distance_y = goal_pos[1] - current_pos[1]
-        
-        # Find closest ghost
-        closest_ghost_distance = float('inf')
-        closest_ghost_direction_x = 0
-        closest_ghost_direction_y = 0
-        
-        for ghost_pos in ghosts:
-            ghost_distance = abs(ghost_pos[0] - current_pos[0]) + abs(ghost_pos[1] - current_pos[1])
-            if ghost_distance < closest_ghost_distance:
-                closest_ghost_distance = ghost_distance
-                closest_ghost_direction_x = ghost_pos[0] - current_pos[0]
-                closest_ghost_direction_y = ghost_pos[1] - current_pos[1]
-        
-        # If no ghosts, set default values
-        if closest_ghost_distance == float('inf'):
-            closest_ghost_distance = 99  # Large value
-        
-        # Check valid moves (walls)
-        valid_moves = [0, 0, 0, 0]  # [UP, RIGHT, DOWN, LEFT]
-        directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-        
-        for i, (dx, dy) in enumerate(directions):
-            new_x, new_y = current_pos[0] + dx, current_pos[1] + dy
-            if (0 <= new_x < len(maze[0]) and 
-                0 <= new_y < len(maze) and 
-                maze[new_y][new_x] == 0):  # Not a wall
-                valid_moves[i] = 1
-        
-        # Compile all features
-        features = [
-            goal_distance_x,
-            goal_distance_y,
-            closest_ghost_distance,
-            closest_ghost_direction_x,
-            closest_ghost_direction_y,
-            valid_moves[0],  # Can move UP
-            valid_moves[1],  # Can move RIGHT
-            valid_moves[2],  # Can move DOWN
-            valid_moves[3]   # Can move LEFT
-        ]
-        
-        return features
-    
-    def generate_training_data(self, num_samples=1000, astar_algo=None):
-        """
-        Generate training data by simulating different scenarios
-        and using A* algorithm as a 'teacher'
-        
-        Parameters:
-        - num_samples: Number of samples to generate
-        - astar_algo: A* algorithm instance (optional)
-        
-        Returns:
-        - training_data: List of (features, action) pairs
-        """
-        if astar_algo is None:
-            from .astar import AStarAlgorithm
-            astar_algo = AStarAlgorithm(self.maze)
-        
-        training_data = []
-        print(f"Eğitim verisi oluşturuluyor... {num_samples} örnek hedefleniyor.")
-        
-        # Grid dimensions
-        height = len(self.maze)
-        width = len(self.maze[0]) if height > 0 else 0
-        
-        for _ in range(num_samples):
-            # Generate random pacman position
-            while True:
-                pacman_x = np.random.randint(1, width-1)
-                pacman_y = np.random.randint(1, height-1)
-                if self.maze[pacman_y][pacman_x] == 0:  # Not a wall
-                    break
-            pacman_pos = (pacman_x, pacman_y)
-            
-            # Generate random goal position (coin)
-            while True:
-                goal_x = np.random.randint(1, width-1)
-                goal_y = np.random.randint(1, height-1)
-                if self.maze[goal_y][goal_x] == 0 and (goal_x, goal_y) != pacman_pos:
-                    break
-            goal_pos = (goal_x, goal_y)
-            
-            # Generate random ghost positions (1-3 ghosts)
-            ghost_positions = []
-            for _ in range(np.random.randint(1, 4)):
-                while True:
-                    ghost_x = np.random.randint(1, width-1)
-                    ghost_y = np.random.randint(1, height-1)
-                    if (self.maze[ghost_y][ghost_x] == 0 and 
-                        (ghost_x, ghost_y) != pacman_pos and 
-                        (ghost_x, ghost_y) != goal_pos and
-                        not any((gx, gy) == (ghost_x, ghost_y) for gx, gy in ghost_positions)):
-                        break
-                ghost_positions.append((ghost_x, ghost_y))
-            
-            # Get A* path
-            astar_path = astar_algo.find_path(pacman_pos, goal_pos)
-            
-            # If A* found a path
-            if len(astar_path) > 1:
-                next_pos = astar_path[1]
-                
-                # Determine action based on next position
-                # 0: UP, 1: RIGHT, 2: DOWN, 3: LEFT
-                dx = next_pos[0] - pacman_pos[0]
-                dy = next_pos[1] - pacman_pos[1]
-                
-                if dx == 0 and dy == -1:
-                    action = 0  # UP
-                elif dx == 1 and dy == 0:
-                    action = 1  # RIGHT
-                elif dx == 0 and dy == 1:
-                    action = 2  # DOWN
-                elif dx == -1 and dy == 0:
-                    action = 3  # LEFT
-                else:
-                    continue  # Invalid move, skip this sample
-                
-                # Generate features for this scenario
-                features = self.generate_features(
-                    pacman_pos, goal_pos, ghost_positions, [], self.maze
-                )
-                
-                # Add to training data
-                training_data.append((features, action))
-        
-        print(f"Toplam {len(training_data)} örnek oluşturuldu.")
-        return training_data
-    
-    def save_training_data(self, training_data, filepath=None):
-        """Save the training data to a CSV file for analysis"""
-        if filepath is None:
-            # Proje kök dizinini temel alan mutlak yol
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            filepath = os.path.join(base_dir, 'dt-model', 'pacman_training_data.csv')
-            
-            # Dizin yoksa oluştur
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            
-        try:
-            with open(filepath, 'w') as f:
-                # Write header
-                header = ','.join(self.features + ['action'])
-                f.write(header + '\n')
-                
-                # Write data
-                for features, action in training_data:
-                    line = ','.join(map(str, features + [action]))
-                    f.write(line + '\n')
-            print(f"Eğitim verileri kaydedildi: {filepath}")
-            return True
-        except Exception as e:
-            print(f"Eğitim verisi kaydetme hatası: {e}")
-            return False
-    
-    def find_path(self, start, goal, **kwargs):
-        """
-        Use the trained decision tree to determine Pac-Man's next move
-        
-        Parameters:
-        - start: Pac-Man's current position (x, y)
-        - goal: Target position (x, y) (usually nearest coin)
-        - kwargs: Additional parameters including ghosts and coins
-        
-        Returns:
-        - path: A list containing [current_pos, next_pos]
-        """
-        # Extract needed information from kwargs
-        ghosts = kwargs.get('ghosts', [])
-        coins = kwargs.get('coins', [])
-        
-        # If classifier isn't trained, train it
-        if self.classifier is None:
-            print("Karar ağacı modelini eğitiyorum...")
-            from astar import AStarAlgorithm
-            astar = AStarAlgorithm(self.maze)
-            training_data = self.generate_training_data(num_samples=2000, astar_algo=astar)
-            self.train(training_data)
-            self.save_training_data(training_data)
-            self.export_tree_visualization()
-        
-        # Convert game objects to positions
-        ghost_positions = [(ghost.x, ghost.y) for ghost in ghosts]
-        
-        # Ensure we have a valid goal
-        if goal == start:
-            # If we're at the goal already, find another one
-            min_dist = float('inf')
-            best_coin = None
-            for coin in coins:
-                coin_pos = (coin.x, coin.y)
-                dist = abs(start[0] - coin_pos[0]) + abs(start[1] - coin_pos[1])
-                if dist < min_dist and coin_pos != start:
-                    min_dist = dist
-                    best_coin = coin_pos
-            
-            if best_coin:
-                goal = best_coin
-        
-        # Generate features for current state
-        features = self.generate_features(start, goal, ghost_positions, [])
-        
-        # Debugging output for valid moves
-        valid_moves = features[5:9]
-        if sum(valid_moves) == 0:
-            print(f"Uyarı: {start} konumunda geçerli hareket yok!")
-            return [start]  # Can't move
-        
-        try:
-            # Predict action using the classifier
-            action = int(self.classifier.predict([features])[0])
-            
-            # Convert action to next position
-            directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]  # UP, RIGHT, DOWN, LEFT
-            
-            # Ensure action is in valid range
-            if action < 0 or action >= len(directions):
-                print(f"Uyarı: Geçersiz aksiyon tahmin edildi: {action}")
-                # Find a valid move instead
-                for i, is_valid in enumerate(valid_moves):
-                    if is_valid:
-                        action = i
-                        break
-            
-            dx, dy = directions[action]
-            next_pos = (start[0] + dx, start[1] + dy)
-            
-            # Check if the move is valid (not a wall)
-            if (0 <= next_pos[0] < len(self.maze[0]) and 
-                0 <= next_pos[1] < len(self.maze) and 
-                self.maze[next_pos[1]][next_pos[0]] == 0):
-                print(f"Tahmin edilen hareket: {start} -> {next_pos} (Aksiyon: {action})")
-                # ÖNEMLİ: Dönüş değerini [mevcut, sonraki] formatında döndür
-                return [start, next_pos]
-            else:
-                print(f"Uyarı: Tahmin edilen {next_pos} konumu geçerli değil!")
-                # Fallback to a valid move
-                for i, is_valid in enumerate(valid_moves):
-                    if is_valid:
-                        dx, dy = directions[i]
-                        next_pos = (start[0] + dx, start[1] + dy)
-                        print(f"Alternatif hareket: {start} -> {next_pos} (Aksiyon: {i})")
-                        return [start, next_pos]
-        except Exception as e:
-            print(f"Karar ağacı tahmin hatası: {e}")
-        
-        # Default fallback: if we get here, something went wrong
-        print("Uyarı: Varsayılan harekete döndüm.")
-        return [start]
-    
-    def export_tree_visualization(self, filepath=None):
-        """Export the decision tree visualization to a DOT file"""
-        if filepath is None:
-            # Proje kök dizinini temel alan mutlak yol
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            filepath = os.path.join(base_dir, 'dt-model', 'pacman_decision_tree.dot')
-            
-            # Dizin yoksa oluştur
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            
-        if self.classifier:
-            try:
-                export_graphviz(
-                    self.classifier,
-                    out_file=filepath,
-                    feature_names=self.features,
-                    class_names=['UP', 'RIGHT', 'DOWN', 'LEFT'],
-                    filled=True,
-                    rounded=True
-                )
-                print(f"Karar ağacı görseli aktarıldı: {filepath}")
-                return True
-            except Exception as e:
-                print(f"Ağaç görselleştirme hatası: {e}")
+from .algorithm import Algorithm
+from .compiled_tree import UNKNOWN_MAZE, CompiledTree, ModelFormatError, maze_hash, schema_hash
+import numpy as np
+import os
+import pickle
+
+# Loaded models shared by every DecisionTreeAlgorithm in the process: absolute path -> CompiledTree
+_MODEL_CACHE = {}
+
+def batch_features(static, positions, goals, ghosts, ghost_mask=None):
+    """
+    Vectorized decision tree features for many states
+    
+    Module-level so that dataset workers can use it without building a
+    DecisionTreeAlgorithm. static is the table from compute_static_features;
+    the other arguments are as in DecisionTreeAlgorithm.generate_features_batch.
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    goals = np.asarray(goals, dtype=np.int64)
+    ghosts = np.asarray(ghosts, dtype=np.int64).reshape(len(positions), -1, 2)
+    n = len(positions)
+    
+    features = np.empty((n, 9), dtype=np.int64)
+    features[:, 0:2] = goals - positions
+    
+    if ghosts.shape[1] > 0:
+        diff = ghosts - positions[:, None, :]
+        dist = np.abs(diff).sum(axis=2)
+        if ghost_mask is not None:
+            dist = np.where(ghost_mask, dist, np.iinfo(np.int64).max)
+        # argmin picks the first of equally close ghosts, like the scalar loop
+        closest = np.argmin(dist, axis=1)
+        rows = np.arange(n)
+        has_ghost = dist[rows, closest] != np.iinfo(np.int64).max
+        features[:, 2] = np.where(has_ghost, dist[rows, closest], 99)
+        features[:, 3:5] = np.where(has_ghost[:, None], diff[rows, closest], 0)
+    else:
+        features[:, 2] = 99
+        features[:, 3:5] = 0
+    
+    features[:, 5:9] = static[positions[:, 1], positions[:, 0]]
+    return features
+
+class DecisionTreeAlgorithm(Algorithm):
+    """Decision Tree Algorithm for Pac-Man"""
+    
+    def __init__(self, maze):
+        super().__init__(maze)
+        self.classifier = None  # sklearn model, only present after training in this process
+        self._tree = None       # Compiled tree used for inference, loaded on first use
+        self._load_attempted = False
+        self.features = [
+            "goal_distance_x",
+            "goal_distance_y",
+            "closest_ghost_distance",
+            "closest_ghost_direction_x",
+            "closest_ghost_direction_y",
+            "can_move_up",
+            "can_move_right",
+            "can_move_down",
+            "can_move_left"
+        ]
+        
+        # Wall checks are computed once per maze; a DynamicMaze notifies us so
+        # that only the rows next to a changed cell are patched
+        self.static_features = self.compute_static_features(maze)
+        self._static_rows = self.static_features.tolist()
+        subscribe = getattr(maze, 'subscribe', None)
+        if subscribe is not None:
+            subscribe(self._wall_changed)
+        self.maze_digest = maze_hash(maze)
+        self.schema_digest = schema_hash(self.features)
+    
+    @property
+    def tree(self):
+        """Compiled tree; the model file is loaded lazily on the first query"""
+        if self._tree is None and not self._load_attempted:
+            self._load_attempted = True
+            self.load_model()
+        return self._tree
+    
+    @tree.setter
+    def tree(self, value):
+        self._tree = value
+        
+    def load_model(self, filepath=None):
+        """
+        Load a trained model from disk
+        
+        The versioned .dtm model is memory-mapped and cached per process, so
+        every Game in a simulation sweep shares a single copy. If only the
+        legacy pickle exists, it is unpickled once, compiled and saved as .dtm;
+        the pickle does not record its training maze, so the converted model's
+        maze hash is UNKNOWN_MAZE.
+        """
+        if filepath is None:
+            # Proje kök dizinini temel alan mutlak yol
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            filepath = os.path.join(base_dir, 'dt-model', 'pacman_decision_tree.dtm')
+        
+        compiled_path = os.path.abspath(os.path.splitext(filepath)[0] + '.dtm')
+        pickle_path = os.path.splitext(filepath)[0] + '.pkl'
+        
+        if compiled_path in _MODEL_CACHE:
+            self.tree = _MODEL_CACHE[compiled_path]
+            return True
+        
+        try:
+            if os.path.exists(compiled_path):
+                tree = CompiledTree.load(compiled_path, schema_digest=self.schema_digest)
+                trained_on = tree.metadata.get('maze_hash')
+                if trained_on == UNKNOWN_MAZE:
+                    print(f"Uyarı: Modelin eğitildiği labirent bilinmiyor: {compiled_path}")
+                elif trained_on != self.maze_digest:
+                    print(f"Uyarı: Model farklı bir labirent için eğitilmiş: {compiled_path}")
+                print(f"Karar ağacı modeli yüklendi: {compiled_path}")
+            elif os.path.exists(pickle_path):
+                with open(pickle_path, 'rb') as f:
+                    self.classifier = pickle.load(f)
+                tree = CompiledTree.from_sklearn(self.classifier)
+                tree.save(compiled_path, UNKNOWN_MAZE, self.schema_digest)
+                tree.metadata = {'maze_hash': UNKNOWN_MAZE, 'feature_schema': self.schema_digest}
+                print(f"Karar ağacı modeli yüklendi ve derlendi: {pickle_path} -> {compiled_path}")
+            else:
+                print(f"Model dosyası bulunamadı: {compiled_path}")
+                return False
+        except ModelFormatError as e:
+            print(f"Model dosyası kullanılamıyor: {e}")
+            return False
+        except Exception as e:
+            print(f"Model yükleme hatası: {e}")
+            return False
+        
+        _MODEL_CACHE[compiled_path] = tree
+        self.tree = tree
+        return True
+    
+    def save_model(self, filepath=None):
+        """Save the trained model to disk (sklearn pickle plus the compiled .dtm)"""
+        if filepath is None:
+            # Proje kök dizinini temel alan mutlak yol
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            filepath = os.path.join(base_dir, 'dt-model', 'pacman_decision_tree.pkl')
+            
+            # Dizin yoksa oluştur
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        
+        if self.classifier:
+            try:
+                with open(filepath, 'wb') as f:
+                    pickle.dump(self.classifier, f)
+                compiled_path = os.path.abspath(os.path.splitext(filepath)[0] + '.dtm')
+                self.tree.save(compiled_path, self.maze_digest, self.schema_digest)
+                _MODEL_CACHE[compiled_path] = self.tree
+                print(f"Karar ağacı modeli kaydedildi: {filepath}")
+                return True
+            except Exception as e:
+                print(f"Model kaydetme hatası: {e}")
+        return False
+    
+    def train(self, training_data):
+        """
+        Train the decision tree classifier with generated data
+        
+        Parameters:
+        - training_data: List of (features, action) pairs
+        """
+        if not training_data:
+            print("Eğitim verisi yok!")
+            return False
+            
+        # Extract features and labels
+        X = np.array([item[0] for item in training_data])
+        y = np.array([item[1] for item in training_data])
+        return self.train_arrays(X, y)
+    
+    def train_arrays(self, X, y):
+        """
+        Train the decision tree classifier from feature and label arrays
+        
+        Parameters:
+        - X: Feature array of shape (N, 9)
+        - y: Action labels of shape (N,)
+        """
+        # sklearn is only needed for training
+        from sklearn.tree import DecisionTreeClassifier
+        
+        print(f"Karar ağacı eğitiliyor... {len(X)} örnek kullanılıyor.")
+        
+        # Create and train the classifier
+        self.classifier = DecisionTreeClassifier(max_depth=5, random_state=42)
+        self.classifier.fit(X, y)
+        self.tree = CompiledTree.from_sklearn(self.classifier)
+        
+        # Save the trained model
+        self.save_model()
+        
+        print("Karar ağacı eğitimi tamamlandı.")
+        return True
+    
+    @staticmethod
+    def compute_static_features(maze):
+        """
+        Precompute the per-cell wall features
+        
+        Returns an int8 array of shape (height, width, 4) whose last axis holds
+        [can_move_up, can_move_right, can_move_down, can_move_left].
+        """
+        walls = np.asarray(maze, dtype=np.int8) != 0
+        height, width = walls.shape
+        
+        # Pad with walls so that moves off the grid count as blocked
+        padded = np.ones((height + 2, width + 2), dtype=bool)
+        padded[1:-1, 1:-1] = walls
+        
+        static = np.empty((height, width, 4), dtype=np.int8)
+        static[:, :, 0] = ~padded[:-2, 1:-1]   # UP
+        static[:, :, 1] = ~padded[1:-1, 2:]    # RIGHT
+        static[:, :, 2] = ~padded[2:, 1:-1]    # DOWN
+        static[:, :, 3] = ~padded[1:-1, :-2]   # LEFT
+        return static
+    
+    def _wall_changed(self, x, y, wall):
+        """Maze notification: update the moves of the four cells next to (x, y)"""
+        height, width = self.static_features.shape[:2]
+        value = 0 if wall else 1
+        # (dx, dy, feature): the neighbour at (x + dx, y + dy) moves into (x, y) with feature
+        for dx, dy, feature in ((0, 1, 0), (-1, 0, 1), (0, -1, 2), (1, 0, 3)):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                self.static_features[ny, nx, feature] = value
+                self._static_rows[ny][nx][feature] = value
+    
+    def generate_features(self, current_pos, goal_pos, ghosts, coins, maze=None):
+        """
+        Generate features for the decision tree
+        
+        Parameters:
+        - current_pos: Pac-Man's current position (x, y)
+        - goal_pos: Target position (x, y) (usually nearest coin)
+        - ghosts: List of ghost positions [(x, y), ...]
+        - coins: List of coin positions [(x, y), ...]
+        - maze: 2D grid representation of the maze (optional)
+        
+        Arrays of states are also accepted: with current_pos and goal_pos of
+        shape (N, 2) and ghosts of shape (N, G, 2) the call is forwarded to
+        generate_features_batch and an (N, 9) array is returned.
+        
+        Returns:
+        - features: List of numerical features
+        """
+        if isinstance(current_pos, np.ndarray) and current_pos.ndim == 2:
+            return self.generate_features_batch(current_pos, goal_pos, ghosts, maze=maze)
+        
+        if maze is None or maze is self.maze:
+            static_rows = self._static_rows
+        else:
+            static_rows = self.compute_static_features(maze).tolist()
+            
+        # Calculate distances to goal
+        x, y = current_pos
+        goal_distance_x = goal_pos[0] - x
+        goal_distance_y = goal_pos[1] - y
+        
+        # Find closest ghost (99 and no direction if there are no ghosts)
+        closest_ghost_distance = 99
+        closest_ghost_direction_x = 0
+        closest_ghost_direction_y = 0
+        best = float('inf')
+        
+        for ghost_x, ghost_y in ghosts:
+            ghost_distance = abs(ghost_x - x) + abs(ghost_y - y)
+            if ghost_distance < best:
+                best = closest_ghost_distance = ghost_distance
+                closest_ghost_direction_x = ghost_x - x
+                closest_ghost_direction_y = ghost_y - y
+        
+        # Compile all features (valid moves come from the precomputed table)
+        return [
+            goal_distance_x,
+            goal_distance_y,
+            closest_ghost_distance,
+            closest_ghost_direction_x,
+            closest_ghost_direction_y
+        ] + static_rows[y][x]
+    
+    def generate_features_batch(self, positions, goals, ghosts, ghost_mask=None, maze=None):
+        """
+        Vectorized feature generation for many states at once
+        
+        Parameters:
+        - positions: Pac-Man positions, int array of shape (N, 2) as (x, y)
+        - goals: Goal positions, int array of shape (N, 2)
+        - ghosts: Ghost positions, int array of shape (N, G, 2)
+        - ghost_mask: Optional bool array (N, G); False marks padding slots
+        - maze: Optional maze; defaults to self.maze
+        
+        Returns:
+        - features: int array of shape (N, 9), same layout as generate_features
+        """
+        if maze is None or maze is self.maze:
+            static = self.static_features
+        else:
+            static = self.compute_static_features(maze)
+        return batch_features(static, positions, goals, ghosts, ghost_mask)
+    
+    def generate_training_data(self, num_samples=1000, astar_algo=None):
+        """
+        Generate training data by simulating different scenarios
+        
+        Labels are the optimal first moves towards the goal, read from
+        precomputed per-goal BFS distance fields (the same moves an A* teacher
+        would produce, without running a search per sample).
+        
+        Parameters:
+        - num_samples: Number of samples to generate
+        - astar_algo: Unused, kept for backwards compatibility
+        
+        Returns:
+        - training_data: List of (features, action) pairs
+        """
+        from .dt_dataset import generate_samples
+        
+        print(f"Eğitim verisi oluşturuluyor... {num_samples} örnek hedefleniyor.")
+        X, y = generate_samples(self.maze, num_samples, seed=np.random.randint(2**31))
+        training_data = list(zip(X.tolist(), y.tolist()))
+        print(f"Toplam {len(training_data)} örnek oluşturuldu.")
+        return training_data
+    
+    def retrain(self, num_samples=1000000, num_workers=None, seed=None, filepath=None):
+        """
+        Regenerate a large dataset on disk in parallel and retrain the model
+        
+        Parameters:
+        - num_samples: Number of samples to generate
+        - num_workers: Number of worker processes (default: CPU count)
+        - seed: Seed for reproducible datasets
+        - filepath: Output .npy file (default: dt-model/pacman_training_data.npy)
+        """
+        from .dt_dataset import generate_dataset
+        
+        if filepath is None:
+            # Proje kök dizinini temel alan mutlak yol
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            filepath = os.path.join(base_dir, 'dt-model', 'pacman_training_data.npy')
+            
+            # Dizin yoksa oluştur
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        
+        print(f"Eğitim verisi oluşturuluyor... {num_samples} örnek hedefleniyor.")
+        data = generate_dataset(self.maze, num_samples, filepath, num_workers=num_workers, seed=seed)
+        print(f"Eğitim verileri kaydedildi: {filepath}")
+        return self.train_arrays(data[:, :-1], data[:, -1])
+    
+    def save_training_data(self, training_data, filepath=None):
+        """Save the training data to a CSV file for analysis"""
+        if filepath is None:
+            # Proje kök dizinini temel alan mutlak yol
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            filepath = os.path.join(base_dir, 'dt-model', 'pacman_training_data.csv')
+            
+            # Dizin yoksa oluştur
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            
+        try:
+            with open(filepath, 'w') as f:
+                # Write header
+                header = ','.join(self.features + ['action'])
+                f.write(header + '\n')
+                
+                # Write data
+                for features, action in training_data:
+                    line = ','.join(map(str, features + [action]))
+                    f.write(line + '\n')
+            print(f"Eğitim verileri kaydedildi: {filepath}")
+            return True
+        except Exception as e:
+            print(f"Eğitim verisi kaydetme hatası: {e}")
+            return False
+    
+    def find_path(self, start, goal, **kwargs):
+        """
+        Use the trained decision tree to determine Pac-Man's next move
+        
+        Parameters:
+        - start: Pac-Man's current position (x, y)
+        - goal: Target position (x, y) (usually nearest coin)
+        - kwargs: Additional parameters including ghosts and coins
+        
+        Returns:
+        - path: A list containing [current_pos, next_pos]
+        """
+        # Extract needed information from kwargs
+        ghosts = kwargs.get('ghosts', [])
+        coins = kwargs.get('coins', [])
+        
+        # Metrics: an already loaded model counts as a cache hit
+        if self._tree is not None:
+            self.call_stats.cache_hits += 1
+        
+        # If no model is available, train one
+        if self.tree is None:
+            print("Karar ağacı modelini eğitiyorum...")
+            training_data = self.generate_training_data(num_samples=2000)
+            self.train(training_data)
+            self.save_training_data(training_data)
+            self.export_tree_visualization()
+        
+        # Convert game objects to positions
+        ghost_positions = [(ghost.x, ghost.y) for ghost in ghosts]
+        
+        # Ensure we have a valid goal
+        if goal == start:
+            # If we're at the goal already, find another one
+            min_dist = float('inf')
+            best_coin = None
+            for coin in coins:
+                coin_pos = (coin.x, coin.y)
+                dist = abs(start[0] - coin_pos[0]) + abs(start[1] - coin_pos[1])
+                if dist < min_dist and coin_pos != start:
+                    min_dist = dist
+                    best_coin = coin_pos
+            
+            if best_coin:
+                goal = best_coin
+        
+        # Generate features for current state
+        features = self.generate_features(start, goal, ghost_positions, [])
+        
+        # Debugging output for valid moves
+        valid_moves = features[5:9]
+        if sum(valid_moves) == 0:
+            print(f"Uyarı: {start} konumunda geçerli hareket yok!")
+            return [start]  # Can't move
+        
+        try:
+            # Predict action by walking the compiled tree
+            action = self.tree.predict_one(features)
+            self.call_stats.nodes_expanded += 1  # One model evaluation
+            
+            # Convert action to next position
+            directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]  # UP, RIGHT, DOWN, LEFT
+            
+            # Ensure action is in valid range
+            if action < 0 or action >= len(directions):
+                print(f"Uyarı: Geçersiz aksiyon tahmin edildi: {action}")
+                # Find a valid move instead
+                for i, is_valid in enumerate(valid_moves):
+                    if is_valid:
+                        action = i
+                        break
+            
+            dx, dy = directions[action]
+            next_pos = (start[0] + dx, start[1] + dy)
+            
+            # Check if the move is valid (not a wall)
+            if (0 <= next_pos[0] < len(self.maze[0]) and 
+                0 <= next_pos[1] < len(self.maze) and 
+                self.maze[next_pos[1]][next_pos[0]] == 0):
+                print(f"Tahmin edilen hareket: {start} -> {next_pos} (Aksiyon: {action})")
+                # ÖNEMLİ: Dönüş değerini [mevcut, sonraki] formatında döndür
+                return [start, next_pos]
+            else:
+                print(f"Uyarı: Tahmin edilen {next_pos} konumu geçerli değil!")
+                # Fallback to a valid move
+                for i, is_valid in enumerate(valid_moves):
+                    if is_valid:
+                        dx, dy = directions[i]
+                        next_pos = (start[0] + dx, start[1] + dy)
+                        print(f"Alternatif hareket: {start} -> {next_pos} (Aksiyon: {i})")
+                        return [start, next_pos]
+        except Exception as e:
+            print(f"Karar ağacı tahmin hatası: {e}")
+        
+        # Default fallback: if we get here, something went wrong
+        print("Uyarı: Varsayılan harekete döndüm.")
+        return [start]
+    
+    def export_tree_visualization(self, filepath=None):
+        """Export the decision tree visualization to a DOT file"""
+        if filepath is None:
+            # Proje kök dizinini temel alan mutlak yol
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            filepath = os.path.join(base_dir, 'dt-model', 'pacman_decision_tree.dot')
+            
+            # Dizin yoksa oluştur
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            
+        if self.classifier:
+            try:
+                from sklearn.tree import export_graphviz
+                export_graphviz(
+                    self.classifier,
+                    out_file=filepath,
+                    feature_names=self.features,
+                    class_names=['UP', 'RIGHT', 'DOWN', 'LEFT'],
+                    filled=True,
+                    rounded=True
+                )
+                print(f"Karar ağacı görseli aktarıldı: {filepath}")
+                return True
+            except Exception as e:
+                print(f"Ağaç görselleştirme hatası: {e}")
         return False
\ No newline at end of file
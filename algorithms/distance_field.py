@@ -0,0 +1,80 @@
+import numpy as np
+
+UNREACHABLE = -1
+
+# Hareket kodları (karar ağacı etiketleriyle aynı sıra): 0: YUKARI, 1: SAĞ, 2: AŞAĞI, 3: SOL
+MOVES = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+
+def wall_mask(maze):
+    """Labirenti bool duvar maskesine çevirir (True = duvar)"""
+    return np.asarray(maze) != 0
+
+def bfs_distance_fields(maze, sources):
+    """
+    Birden çok kaynak için aynı anda BFS mesafe alanı hesaplar
+
+    Her kaynak için ayrı bir alan üretilir; tüm alanlar katman katman, vektörel
+    olarak birlikte genişletilir.
+
+    Parametreler:
+    - maze: 2D labirent (veya wall_mask çıktısı)
+    - sources: (B, 2) boyutlu (x, y) kaynak dizisi
+
+    Dönüş: (B, yükseklik, genişlik) int32 dizisi; ulaşılamayan hücreler UNREACHABLE
+    """
+    walls = maze if isinstance(maze, np.ndarray) and maze.dtype == bool else wall_mask(maze)
+    free = ~walls
+    sources = np.asarray(sources, dtype=np.intp).reshape(-1, 2)
+    batch = len(sources)
+    height, width = walls.shape
+
+    dist = np.full((batch, height, width), UNREACHABLE, dtype=np.int32)
+    frontier = np.zeros((batch, height, width), dtype=bool)
+    frontier[np.arange(batch), sources[:, 1], sources[:, 0]] = True
+    dist[frontier] = 0
+    visited = frontier.copy()
+
+    step = 0
+    while frontier.any():
+        step += 1
+        # Sınırdaki hücrelerin dört komşusu
+        reached = np.zeros_like(frontier)
+        reached[:, 1:, :] |= frontier[:, :-1, :]
+        reached[:, :-1, :] |= frontier[:, 1:, :]
+        reached[:, :, 1:] |= frontier[:, :, :-1]
+        reached[:, :, :-1] |= frontier[:, :, 1:]
+        reached &= free
+        reached &= ~visited
+
+        dist[reached] = step
+        visited |= reached
+        frontier = reached
+
+    return dist
+
+def first_move_labels(dist):
+    """
+    Mesafe alanlarından her hücre için hedefe doğru ilk hamleyi çıkarır
+
+    Parametreler:
+    - dist: bfs_distance_fields çıktısı (B, yükseklik, genişlik); kaynak = hedef
+
+    Dönüş: Aynı boyutta int8 dizisi; mesafeyi bir azaltan hamlenin kodu
+    (eşitlikte MOVES sırasındaki ilk hamle), hamle yoksa -1
+    """
+    batch, height, width = dist.shape
+    padded = np.full((batch, height + 2, width + 2), UNREACHABLE, dtype=dist.dtype)
+    padded[:, 1:-1, 1:-1] = dist
+    neighbors = [
+        padded[:, :-2, 1:-1],   # YUKARI
+        padded[:, 1:-1, 2:],    # SAĞ
+        padded[:, 2:, 1:-1],    # AŞAĞI
+        padded[:, 1:-1, :-2],   # SOL
+    ]
+
+    labels = np.full(dist.shape, -1, dtype=np.int8)
+    target = dist - 1
+    # Ters sırada yaz ki eşitlikte küçük kodlu hamle kalsın
+    for code in reversed(range(len(MOVES))):
+        labels[(neighbors[code] == target) & (dist > 0)] = code
+    return labels
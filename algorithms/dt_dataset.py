@@ -0,0 +1,170 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+from .decision_tree import DecisionTreeAlgorithm, batch_features
+from .distance_field import bfs_distance_fields, first_move_labels, wall_mask
+
+NUM_COLUMNS = 10  # 9 features + action label
+MAX_TABLE_BYTES = 1 << 30  # FirstMoveTable grows with the square of the free cells
+
+class FirstMoveTable:
+    """
+    Optimal first move from every free cell towards every free goal
+
+    Built from one BFS distance field per goal, so labelling a sample is a
+    single array lookup instead of an A* search. The table has one int8 per
+    (goal, start) pair of free cells; only goal_batch distance fields are
+    alive at a time. With path set, the labels are written to a .npy file
+    that worker processes open read-only via FirstMoveTable.open.
+
+    The table takes F * F bytes for F free cells (about 1.6 GB for an open
+    200x200 maze), so mazes needing more than max_bytes are rejected with a
+    ValueError rather than exhausting memory or disk.
+    """
+
+    def __init__(self, maze, goal_batch=256, path=None, max_bytes=MAX_TABLE_BYTES):
+        walls = self._index(maze)
+        num_free = len(self.free_xy)
+        if num_free * num_free > max_bytes:
+            raise ValueError(f"first-move table for {num_free} free cells needs "
+                             f"{num_free * num_free} bytes, over the {max_bytes} byte limit; "
+                             f"use a smaller maze")
+
+        # labels[g, s]: action from free cell s towards free cell g, -1 if none
+        shape = (num_free, num_free)
+        if path is None:
+            self.labels = np.empty(shape, dtype=np.int8)
+        else:
+            self.labels = np.lib.format.open_memmap(path, mode='w+', dtype=np.int8, shape=shape)
+        for start in range(0, num_free, goal_batch):
+            goals = self.free_xy[start:start + goal_batch]
+            dist = bfs_distance_fields(walls, goals)
+            moves = first_move_labels(dist).reshape(len(goals), -1)
+            self.labels[start:start + len(goals)] = moves[:, self.free_flat]
+        if path is not None:
+            self.labels.flush()
+
+    @classmethod
+    def open(cls, maze, path):
+        """Open a table written with path= as a read-only memory map"""
+        table = cls.__new__(cls)
+        table._index(maze)
+        table.labels = np.load(path, mmap_mode='r')
+        if table.labels.shape != (len(table.free_xy),) * 2:
+            raise ValueError(f"{path} does not match the maze")
+        return table
+
+    def _index(self, maze):
+        walls = wall_mask(maze)
+        self.height, self.width = walls.shape
+        ys, xs = np.nonzero(~walls)
+        self.free_xy = np.column_stack([xs, ys])  # (F, 2) as (x, y)
+        self.free_flat = ys * self.width + xs
+        return walls
+
+def _distinct_cells(rng, num_free, n, k):
+    """Draw k distinct free-cell indices per row, uniformly without replacement"""
+    cells = np.empty((n, k), dtype=np.int64)
+    for j in range(k):
+        pick = rng.integers(0, num_free - j, n)
+        # Skip over the cells already taken in this row, smallest first
+        for taken in np.sort(cells[:, :j], axis=1).T:
+            pick += pick >= taken
+        cells[:, j] = pick
+    return cells
+
+def sample_batch(table, static, rng, n, max_ghosts=3):
+    """
+    Draw n random scenarios and label them
+
+    Pac-Man, the goal and 1..max_ghosts ghosts are placed on distinct free
+    cells, so the maze needs at least max_ghosts + 2 of them. Returns an
+    int16 array of shape (m, NUM_COLUMNS) with m <= n; scenarios whose goal
+    is unreachable are dropped.
+    """
+    num_free = len(table.free_xy)
+    if num_free < max_ghosts + 2:
+        raise ValueError(f"{num_free} free cells cannot hold Pac-Man, a goal and {max_ghosts} ghosts")
+    cells = _distinct_cells(rng, num_free, n, max_ghosts + 2)
+    pacman, goal, ghosts = cells[:, 0], cells[:, 1], cells[:, 2:]
+
+    num_ghosts = rng.integers(1, max_ghosts + 1, n)
+    ghost_mask = np.arange(max_ghosts) < num_ghosts[:, None]
+
+    actions = table.labels[goal, pacman]
+    valid = actions >= 0
+
+    features = batch_features(static, table.free_xy[pacman], table.free_xy[goal],
+                              table.free_xy[ghosts], ghost_mask)
+    rows = np.column_stack([features, actions])[valid]
+    return rows.astype(np.int16)
+
+def generate_samples(maze, num_samples, seed=None, max_ghosts=3):
+    """Generate num_samples labelled rows in memory; returns (X, y)"""
+    table = FirstMoveTable(maze)
+    static = DecisionTreeAlgorithm.compute_static_features(maze)
+    rng = np.random.default_rng(seed)
+
+    chunks, total = [], 0
+    while total < num_samples:
+        rows = sample_batch(table, static, rng, num_samples - total, max_ghosts)
+        chunks.append(rows)
+        total += len(rows)
+    data = np.concatenate(chunks)
+    return data[:, :-1], data[:, -1]
+
+def _write_shard(job):
+    """Worker: fill rows [start, start + count) of the output file chunk by chunk"""
+    maze, out_path, labels_path, start, count, seed_seq, chunk_size, max_ghosts = job
+    table = FirstMoveTable.open(maze, labels_path)
+    static = DecisionTreeAlgorithm.compute_static_features(maze)
+    rng = np.random.default_rng(seed_seq)
+
+    out = np.load(out_path, mmap_mode='r+')
+    written = 0
+    while written < count:
+        rows = sample_batch(table, static, rng, min(chunk_size, count - written), max_ghosts)
+        out[start + written:start + written + len(rows)] = rows
+        written += len(rows)
+    out.flush()
+    del out, table
+    return written
+
+def generate_dataset(maze, num_samples, out_path, num_workers=None, seed=None,
+                     chunk_size=65536, max_ghosts=3):
+    """
+    Generate a training set on disk, sharded across processes
+
+    Rows are streamed into a preallocated .npy file (int16, NUM_COLUMNS
+    columns, last column is the action), each worker writing its own slice
+    with an independent seed from SeedSequence(seed).spawn(). The first-move
+    table is built once, next to out_path, shared read-only by the workers
+    and removed afterwards; see FirstMoveTable for its size limit.
+
+    Returns the dataset as a read-only memory map.
+    """
+    maze = np.asarray(maze, dtype=np.uint8)
+    out = np.lib.format.open_memmap(out_path, mode='w+', dtype=np.int16,
+                                    shape=(num_samples, NUM_COLUMNS))
+    del out
+    labels_path = os.path.splitext(out_path)[0] + '.moves.npy'
+    FirstMoveTable(maze, path=labels_path)
+
+    num_workers = num_workers or os.cpu_count() or 1
+    num_shards = max(1, min(num_workers, -(-num_samples // chunk_size)))
+    seeds = np.random.SeedSequence(seed).spawn(num_shards)
+    bounds = np.linspace(0, num_samples, num_shards + 1).astype(np.int64)
+    jobs = [(maze, out_path, labels_path, int(bounds[i]), int(bounds[i + 1] - bounds[i]),
+             seeds[i], chunk_size, max_ghosts) for i in range(num_shards)]
+
+    try:
+        if num_shards == 1:
+            _write_shard(jobs[0])
+        else:
+            with ProcessPoolExecutor(max_workers=num_shards) as executor:
+                list(executor.map(_write_shard, jobs))
+    finally:
+        os.remove(labels_path)
+
+    return np.load(out_path, mmap_mode='r')
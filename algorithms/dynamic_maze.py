@@ -0,0 +1,154 @@
+import weakref
+
+import numpy as np
+
+from .maze_grid import wall_test
+
+class DynamicMaze:
+    """
+    Duvarları çalışma anında değişebilen (kapı, yıkılabilir duvar), sürümlü labirent
+
+    Bir ızgarayı (iç içe liste ya da TiledGrid) sarar ve aynı arayüzü sunar:
+    maze[y][x], len(maze), satırlar üzerinde döngü ve np.asarray(maze). Duvarlar
+    yalnızca set_wall ile değiştirilmelidir; her gerçek değişiklik sürümü bir
+    artırır, günlüğe yazılır ve abonelere (ör. SearchKernel) bildirilir. Abonelere
+    zayıf başvuru tutulur; labirent onları yaşatmaz. Günlük kendiliğinden
+    kısalmaz: okuyanı kalmayan kayıtlar compact ile atılır.
+    """
+
+    def __init__(self, grid):
+        """
+        Parametreler:
+        - grid: Sarılacak ızgara (yerinde değiştirilir)
+        """
+        self.grid = grid
+        self._is_wall = wall_test(grid)
+        self.version = 0
+        self._log = []       # (x, y, wall) değişiklikleri, sırayla
+        self._log_base = 0   # Günlüğün ilk kaydının sürümü
+        self._origin = {}    # Kaydı atılmış hücrelerin ilk değeri: (x, y) -> duvar mı
+        self._listeners = []
+        self._array = None   # np.asarray(maze) önbelleği; duvar değişince atılır
+
+    def set_wall(self, x, y, wall=True):
+        """
+        (x, y) hücresini duvar yapar (wall=False ise açar) ve abonelere bildirir
+
+        Dönüş: Hücre değiştiyse True
+        """
+        value = 1 if wall else 0
+        if self._is_wall(x, y) == bool(wall):
+            return False
+        if hasattr(self.grid, 'set_cell'):
+            self.grid.set_cell(x, y, value)
+        else:
+            self.grid[y][x] = value
+        self.version += 1
+        self._log.append((x, y, bool(wall)))
+        self._array = None
+
+        alive = []
+        for ref in self._listeners:
+            listener = ref()
+            if listener is not None:
+                listener(x, y, bool(wall))
+                alive.append(ref)
+        self._listeners = alive
+        return True
+
+    def is_wall(self, x, y):
+        return self._is_wall(x, y)
+
+    def changes_since(self, version):
+        """version'dan sonraki değişiklikler: [(x, y, wall), ...]"""
+        if version < self._log_base:
+            raise ValueError(f"Sürüm {version} günlükte yok (ilk kayıt {self._log_base})")
+        return self._log[version - self._log_base:]
+
+    def revert(self, version=None):
+        """
+        Labirenti version'daki (None ise ilk) haline döndürür (ör. yeni oyun)
+
+        Her hücrenin o sürümdeki değeri, sonrasındaki ilk değişikliğinin tersidir;
+        günlükten atılmış hücrelerin ilk değeri ayrıca saklanır. Yalnızca hâlâ
+        farklı olan hücreler değiştirilir. Geri alma da bir değişikliktir: sürüm
+        artar, günlüğe yazılır ve aboneler bilgilendirilir.
+        """
+        if version is None:
+            original = dict(self._origin)
+            version = self._log_base
+        else:
+            original = {}
+        for x, y, wall in self.changes_since(version):
+            original.setdefault((x, y), not wall)
+        for (x, y), wall in original.items():
+            self.set_wall(x, y, wall)
+
+    def compact(self, version=None):
+        """
+        version'dan (None ise güncel sürümden) önceki günlük kayıtlarını atar
+
+        Sonrasında changes_since yalnızca version ve sonrası için çağrılabilir.
+        Atılan hücrelerin ilk değerleri revert() için saklanır; bu tablo
+        zaman içinde değil, değişmiş farklı hücre sayısıyla büyür.
+        """
+        if version is None:
+            version = self.version
+        if version > self.version:
+            raise ValueError(f"Sürüm {version} henüz yok (güncel {self.version})")
+        dropped = version - self._log_base
+        if dropped <= 0:
+            return
+        for x, y, wall in self._log[:dropped]:
+            self._origin.setdefault((x, y), not wall)
+        del self._log[:dropped]
+        self._log_base = version
+
+    def sync(self, version, cells):
+        """
+        Başka bir kopyanın hücre durumlarını uygular ve sürümü ona eşitler (ör. işçi süreci)
+
+        Parametreler:
+        - version: Kaynak labirentin sürümü
+        - cells: [(x, y, wall), ...]; kaynakta değişmiş hücrelerin güncel durumu
+          (aynı durumdaki hücreler atlanır)
+        """
+        for x, y, wall in cells:
+            self.set_wall(x, y, wall)
+        self._log.clear()
+        self.version = self._log_base = version
+
+    def subscribe(self, listener):
+        """listener(x, y, wall) her değişiklikten sonra çağrılır"""
+        if hasattr(listener, '__self__'):
+            ref = weakref.WeakMethod(listener)
+        else:
+            ref = lambda listener=listener: listener
+        self._listeners.append(ref)
+
+    def __getitem__(self, key):
+        return self.grid[key]
+
+    def __len__(self):
+        return len(self.grid)
+
+    def __iter__(self):
+        return iter(self.grid)
+
+    def __array__(self, dtype=None, copy=None):
+        # Aynı sürüm için tek dizi kurulur; paylaşıldığından salt okunurdur
+        array = self._array
+        if array is None:
+            array = self._array = np.array(self.grid, dtype=np.uint8)
+            array.flags.writeable = False
+        if dtype is not None:
+            array = array.astype(dtype, copy=False)
+        return array.copy() if copy and array is self._array else array
+
+    def __getstate__(self):
+        # Aboneler ve eski günlük süreçlere aktarılmaz; sürüm korunur
+        return {'grid': self.grid, 'version': self.version}
+
+    def __setstate__(self, state):
+        self.__init__(state['grid'])
+        self.version = self._log_base = state['version']
@@ -0,0 +1,267 @@
+import weakref
+from collections import OrderedDict
+
+from .search_kernel import SearchKernel
+
+# Oyun durumu kodları
+PLAYING, WON, LOST = 0, 1, 2
+
+# Labirent başına hamle tabloları: çekirdek -> hücre başına gidilebilecek hücreler
+_MOVE_TABLES = weakref.WeakKeyDictionary()
+
+# Labirent başına labirent mesafesi tabloları: çekirdek -> {kaynak hücre: (sürüm, mesafe listesi)},
+# en son kullanılan sonda (LRU). Çekirdeğe abone olunmaz: duvar değişince yüzlerce
+# tabloyu hemen onarmak yerine her tablo sürümüyle saklanır ve yalnızca yeniden
+# kullanıldığında, o zamandan beri değişen hücreler için onarılır (distances).
+_DISTANCE_TABLES = weakref.WeakKeyDictionary()
+_MAX_DISTANCE_TABLES = 1024  # Labirent başına tutulan en fazla kaynak; dolunca en eskisi atılır
+
+# Ulaşılamayan hücrelerin mesafesi
+UNREACHABLE = 1 << 20
+
+class CompactState:
+    """
+    Oyunun ileri bakış (lookahead) için sıkıştırılmış durumu
+
+    Konumlar düz hücre indeksleridir (i = y * genişlik + x), hayaletler bir demet,
+    coinler ise StateModel.coin_cells sırasına göre bir bit kümesidir. Tüm alanlar
+    değişmez değerler olduğundan kopyalama ve geri yükleme O(1)'dir.
+    """
+    __slots__ = ('pacman', 'ghosts', 'coins', 'score', 'status')
+
+    def __init__(self, pacman, ghosts, coins, score=0, status=PLAYING):
+        self.pacman = pacman    # Pac-Man'in hücresi
+        self.ghosts = ghosts    # Hayalet hücreleri (demet)
+        self.coins = coins      # Kalan coinlerin bit kümesi
+        self.score = score
+        self.status = status    # PLAYING, WON veya LOST
+
+    def clone(self):
+        return CompactState(self.pacman, self.ghosts, self.coins, self.score, self.status)
+
+    def key(self):
+        """Durumu belirleyen alanlar (geçiş tabloları için anahtar)"""
+        return (self.pacman, self.ghosts, self.coins)
+
+    def __eq__(self, other):
+        return isinstance(other, CompactState) and self.key() == other.key() and self.status == other.status
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return (f"CompactState(pacman={self.pacman}, ghosts={self.ghosts}, coins={self.coins:#x}, "
+                f"score={self.score}, status={self.status})")
+
+class StateModel:
+    """
+    Bir labirent ve başlangıç coin yerleşimi için sabit tablolar ve geçiş fonksiyonu
+
+    Kurallar Game ile aynıdır: önce Pac-Man hareket edip coin toplar, sonra
+    hayaletler sırayla hareket eder ve her hamleden sonra çarpışma kontrol edilir.
+    Son coin toplandığı adımda hayaletlerin hamleleri yine uygulanır; yakalanmazsa
+    oyun kazanılır.
+    """
+
+    def __init__(self, maze, coin_positions):
+        """
+        Parametreler:
+        - maze: Oyun labirenti
+        - coin_positions: Coin konumları [(x, y), ...]; bit i, i. coin'i gösterir
+        """
+        self.kernel = SearchKernel.for_maze(maze)
+        self.width = self.kernel.width
+        self.coin_cells = [self.cell(pos) for pos in coin_positions]
+        self.coin_mask = [0] * self.kernel.size  # Hücre -> coin biti (coin yoksa 0)
+        for bit, cell in enumerate(self.coin_cells):
+            self.coin_mask[cell] |= 1 << bit
+        self.all_coins = (1 << len(self.coin_cells)) - 1
+
+        moves = _MOVE_TABLES.get(self.kernel)
+        if moves is None:
+            # Komşular (Aşağı, Sağ, Yukarı, Sol) ve en sonda yerinde kalma
+            moves = [tuple(self.kernel.neighbors(cell)) + (cell,) for cell in range(self.kernel.size)]
+            _MOVE_TABLES[self.kernel] = moves
+            self.kernel.subscribe(_repair_moves)
+        self.moves = moves
+        self._distances = _DISTANCE_TABLES.setdefault(self.kernel, OrderedDict())
+
+    @classmethod
+    def from_views(cls, maze, pacman, ghosts, coins):
+        """
+        Konum görünümlerinden (.x ve .y) model ve başlangıç durumu oluşturur
+
+        Dönüş: (StateModel, CompactState)
+        """
+        model = cls(maze, [(coin.x, coin.y) for coin in coins])
+        state = CompactState(
+            model.cell((pacman.x, pacman.y)),
+            tuple(model.cell((ghost.x, ghost.y)) for ghost in ghosts),
+            model.all_coins
+        )
+        return model, state
+
+    def state_from_views(self, pacman, ghosts, coins, score=0):
+        """
+        Konum görünümlerinden bu modelin bit düzeninde bir durum oluşturur
+
+        Oyun ilerledikçe coinler yalnızca azaldığından aynı model (ve ona bağlı
+        geçiş tabloları) tik'ler boyunca kullanılabilir.
+
+        Dönüş: CompactState; modelde olmayan bir coin varsa None
+        """
+        coin_mask = self.coin_mask
+        width = self.width
+        bits = 0
+        for coin in coins:
+            bit = coin_mask[coin.y * width + coin.x]
+            if not bit:
+                return None
+            bits |= bit
+        return CompactState(
+            pacman.y * width + pacman.x,
+            tuple(ghost.y * width + ghost.x for ghost in ghosts),
+            bits, score
+        )
+
+    def cell(self, pos):
+        """(x, y) konumunun düz indeksi"""
+        return pos[1] * self.width + pos[0]
+
+    def position(self, cell):
+        """Düz indeksin (x, y) konumu"""
+        return self.kernel.position(cell)
+
+    def coin_positions(self, state):
+        """Durumda kalan coinlerin konumları"""
+        coins = state.coins
+        return [self.kernel.position(cell) for bit, cell in enumerate(self.coin_cells) if coins >> bit & 1]
+
+    def coins_left(self, state):
+        return state.coins.bit_count()
+
+    def distances(self, cell):
+        """
+        cell'den tüm hücrelere labirent mesafesi (BFS; ulaşılamayanlar UNREACHABLE)
+
+        Tablolar labirent başına önbelleğe alınır (en son kullanılan _MAX_DISTANCE_TABLES
+        kaynak) ve modeller arasında paylaşılır; duvarlar değiştiyse tablo ilk
+        kullanımda yalnızca etkilenen bölgede onarılır.
+        """
+        kernel = self.kernel
+        entry = self._distances.get(cell)
+        if entry is not None:
+            self._distances.move_to_end(cell)
+            version, dist = entry
+            if version != kernel.version:
+                kernel.repair_distance_field(dist, [cell], kernel.changes_since(version),
+                                             unreachable=UNREACHABLE)
+                self._distances[cell] = (kernel.version, dist)
+        else:
+            if len(self._distances) >= _MAX_DISTANCE_TABLES:
+                self._distances.popitem(last=False)
+            neighbor_cache, neighbors = kernel.neighbor_cache, kernel.neighbors
+            dist = [UNREACHABLE] * kernel.size
+            dist[cell] = 0
+            frontier = [cell]
+            step = 0
+            while frontier:
+                step += 1
+                next_frontier = []
+                for current in frontier:
+                    following = neighbor_cache[current]
+                    if following is None:
+                        following = neighbors(current)
+                    for neighbor in following:
+                        if dist[neighbor] == UNREACHABLE:
+                            dist[neighbor] = step
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+            self._distances[cell] = (kernel.version, dist)
+        return dist
+
+    def nearest_coin_distance(self, state, cell=None):
+        """Hücreden (varsayılan: Pac-Man) kalan en yakın coine labirent mesafesi; coin yoksa 0"""
+        coins = state.coins
+        if not coins:
+            return 0
+        dist = self.distances(state.pacman if cell is None else cell)
+        coin_cells = self.coin_cells
+        nearest = UNREACHABLE
+        while coins:
+            low = coins & -coins
+            d = dist[coin_cells[low.bit_length() - 1]]
+            if d < nearest:
+                nearest = d
+            coins ^= low
+        return nearest
+
+    def move_pacman(self, state, to):
+        """
+        Ortak hamlenin yalnızca Pac-Man kısmını uygular (coin toplama dahil)
+
+        Sırayla move_ghost(0), move_ghost(1), ... ile birlikte step ile aynı
+        sonucu verir; sıra tabanlı aramalar içindir.
+        """
+        if state.status != PLAYING:
+            return state
+        coins, score = state.coins, state.score
+        bit = self.coin_mask[to] & coins
+        if bit:
+            coins ^= bit
+            score += 1
+        status = WON if not coins and not state.ghosts else PLAYING
+        return CompactState(to, state.ghosts, coins, score, status)
+
+    def move_ghost(self, state, index, to):
+        """Tek bir hayaletin hamlesini uygular; Pac-Man'i yakalarsa durum LOST olur"""
+        if state.status != PLAYING:
+            return state
+        ghosts = state.ghosts[:index] + (to,) + state.ghosts[index + 1:]
+        if to == state.pacman:
+            status = LOST
+        elif not state.coins and index == len(ghosts) - 1:
+            status = WON
+        else:
+            status = PLAYING
+        return CompactState(state.pacman, ghosts, state.coins, state.score, status)
+
+    def step(self, state, pacman_to, ghost_tos):
+        """
+        Bir ortak hamleyi (Pac-Man ve tüm hayaletler) uygular
+
+        Parametreler:
+        - state: Geçerli durum (değiştirilmez)
+        - pacman_to: Pac-Man'in gideceği hücre
+        - ghost_tos: Hayaletlerin gideceği hücreler (sırayla)
+
+        Dönüş: Yeni CompactState
+        """
+        if state.status != PLAYING:
+            return state
+
+        coins, score = state.coins, state.score
+        bit = self.coin_mask[pacman_to] & coins
+        if bit:
+            coins ^= bit
+            score += 1
+
+        ghosts = tuple(ghost_tos)
+        status = PLAYING
+        for index, ghost in enumerate(ghosts):
+            if ghost == pacman_to:
+                # Yakalandıktan sonra kalan hayaletler hareket etmez
+                ghosts = ghosts[:index + 1] + state.ghosts[index + 1:]
+                status = LOST
+                break
+        if status == PLAYING and not coins:
+            status = WON
+        return CompactState(pacman_to, ghosts, coins, score, status)
+
+def _repair_moves(kernel, cell):
+    """Çekirdek bildirimi: duvarı değişen hücrenin ve komşularının hamlelerini günceller"""
+    moves = _MOVE_TABLES.get(kernel)
+    if moves is None:
+        return
+    for changed in [cell] + kernel.grid_neighbors(cell):
+        moves[changed] = tuple(kernel.neighbors(changed)) + (changed,)
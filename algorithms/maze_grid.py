@@ -0,0 +1,157 @@
+import numpy as np
+
+DEFAULT_TILE = 64  # Karo kenarı (hücre)
+
+class _GridRow:
+    """TiledGrid'in tek bir satırı; maze[y][x] erişimi için hafif görünüm"""
+    __slots__ = ('_tiles', '_offset', '_tile', '_width')
+
+    def __init__(self, grid, y):
+        self._tile = grid.tile
+        self._tiles = grid.tiles[y // self._tile]
+        self._offset = y % self._tile
+        self._width = grid.width
+
+    def __getitem__(self, x):
+        if isinstance(x, slice):
+            return [self[i] for i in range(*x.indices(self._width))]
+        if x < 0:
+            x += self._width
+        if not 0 <= x < self._width:
+            raise IndexError("x labirent dışında")
+        tile = self._tile
+        return int(self._tiles[x // tile, self._offset, x % tile])
+
+    def __len__(self):
+        return self._width
+
+    def __iter__(self):
+        for x in range(self._width):
+            yield self[x]
+
+class TiledGrid:
+    """
+    Karolar (tile x tile) halinde saklanan uint8 labirent ızgarası
+
+    Hücreler (karo satırı, karo sütunu, tile, tile) boyutlu tek bir dizide
+    tutulur; dizi bellekte ya da dosyaya eşlenmiş (np.memmap) olabilir. Bir
+    karonun hücreleri bitişik olduğundan büyük haritalarda yalnızca dokunulan
+    karolar belleğe okunur. Hücre başına 1 bayt yer kaplar.
+
+    İç içe listelerle aynı arayüzü sunar: maze[y][x], len(maze), len(maze[0]),
+    satırlar üzerinde döngü ve np.asarray(maze); böylece algoritmalar ve Game
+    ızgarayı listeye çevirmeden kullanır. maze[y, x] biçimi de desteklenir.
+    """
+
+    def __init__(self, tiles, width, height, path=None, offset=0):
+        """
+        Parametreler:
+        - tiles: (karo satırı, karo sütunu, tile, tile) uint8 dizi
+        - width, height: Labirent boyutu (karoların kenar payı hariç)
+        - path, offset: Dosyaya eşlenmişse dosya ve karoların başladığı bayt
+        """
+        self.tiles = tiles
+        self.width = width
+        self.height = height
+        self.tile = tiles.shape[2]
+        self.path = path
+        self.offset = offset
+
+    @classmethod
+    def from_array(cls, array, tile=DEFAULT_TILE):
+        """2B dizi ya da iç içe listeden bellekte bir ızgara oluşturur"""
+        array = np.asarray(array, dtype=np.uint8)
+        if array.ndim != 2:
+            raise ValueError("Labirent 2 boyutlu olmalı")
+        height, width = array.shape
+        rows, cols = tile_shape(width, height, tile)[:2]
+        padded = np.ones((rows * tile, cols * tile), dtype=np.uint8)  # Kenar payı duvar
+        padded[:height, :width] = array
+        tiles = np.ascontiguousarray(padded.reshape(rows, tile, cols, tile).transpose(0, 2, 1, 3))
+        return cls(tiles, width, height)
+
+    @classmethod
+    def open(cls, path, width, height, tile=DEFAULT_TILE, offset=0, mode='c'):
+        """
+        Dosyadaki karoları belleğe eşler
+
+        mode: 'r' salt okunur, 'r+' dosyaya yazar, 'c' değişiklikler yalnızca
+        bellekte kalır (copy-on-write)
+        """
+        tiles = np.memmap(path, dtype=np.uint8, mode=mode, offset=offset,
+                          shape=tile_shape(width, height, tile))
+        return cls(tiles, width, height, path=path, offset=offset)
+
+    @property
+    def shape(self):
+        return (self.height, self.width)
+
+    @property
+    def nbytes(self):
+        """Karoların kapladığı bayt (dosyaya eşlenmişse dosyadaki boyut)"""
+        return self.tiles.nbytes
+
+    def cell(self, x, y):
+        """(x, y) hücresinin değeri"""
+        tile = self.tile
+        return int(self.tiles[y // tile, x // tile, y % tile, x % tile])
+
+    def is_wall(self, x, y):
+        """(x, y) duvar mı; maze[y][x] gibi satır görünümü oluşturmaz"""
+        tile = self.tile
+        return bool(self.tiles[y // tile, x // tile, y % tile, x % tile])
+
+    def set_cell(self, x, y, value):
+        """(x, y) hücresini değiştirir (eşlenmiş dosyada mode'a göre)"""
+        tile = self.tile
+        self.tiles[y // tile, x // tile, y % tile, x % tile] = value
+
+    def to_array(self):
+        """Tüm ızgaranın (yükseklik, genişlik) uint8 kopyası"""
+        rows, cols, tile, _ = self.tiles.shape
+        full = np.asarray(self.tiles).transpose(0, 2, 1, 3).reshape(rows * tile, cols * tile)
+        return np.ascontiguousarray(full[:self.height, :self.width])
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.to_array()
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            y, x = key
+            return self.cell(x, y)
+        if key < 0:
+            key += self.height
+        if not 0 <= key < self.height:
+            raise IndexError("y labirent dışında")
+        return _GridRow(self, key)
+
+    def __len__(self):
+        return self.height
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield _GridRow(self, y)
+
+    def __reduce__(self):
+        # Salt okunur eşlenmiş ızgaralar süreçlere dosya yoluyla aktarılır
+        if self.path is not None and getattr(self.tiles, 'mode', None) == 'r':
+            return (TiledGrid.open, (self.path, self.width, self.height, self.tile, self.offset, 'r'))
+        return (TiledGrid, (np.array(self.tiles), self.width, self.height))
+
+def wall_test(maze):
+    """
+    Labirent için is_wall(x, y) fonksiyonu
+
+    TiledGrid ve DynamicMaze'in kendi is_wall'u kullanılır; iç içe listelerde
+    maze[y][x] okunur. Tik başına çok sayıda hücreye bakan kod (çarpışma,
+    çizim) fonksiyonu bir kez alıp saklar.
+    """
+    is_wall = getattr(maze, 'is_wall', None)
+    if is_wall is not None:
+        return is_wall
+    return lambda x, y: maze[y][x] != 0
+
+def tile_shape(width, height, tile):
+    """Bir labirentin karo dizisinin boyutu (kenarlar bir tam karoya tamamlanır)"""
+    return (-(-height // tile), -(-width // tile), tile, tile)
@@ -0,0 +1,467 @@
+import math
+import time
+import weakref
+
+import numpy as np
+
+from .algorithm import Algorithm
+from .distance_field import UNREACHABLE, bfs_distance_fields
+from .game_state import LOST, PLAYING, WON, StateModel
+
+# Labirent başına rollout tabloları: çekirdek -> (mesafe matrisi, hamle dizisi)
+_ROLLOUT_TABLES = weakref.WeakKeyDictionary()
+_MAX_MATRIX_CELLS = 4096  # Bundan büyük labirentlerde mesafe yerine Manhattan kullanılır
+_BFS_CHUNK = 256          # Mesafe matrisi bu kadar kaynaklık parçalarla hesaplanır
+
+FAR = 1 << 14  # Ulaşılamayan hücrelerin rollout'taki mesafesi
+DANGER = 1000  # Rollout'ta hayaletin yanına giden hamlenin cezası
+
+def rollout_tables(model):
+    """
+    Modelin labirenti için rollout tabloları (labirent başına önbelleğe alınır)
+
+    Duvarlar değiştiğinde tablolar çekirdek bildirimiyle yerinde onarılır.
+
+    Dönüş: (dist, moves); dist hücreler arası labirent mesafesi matrisi (büyük
+    labirentlerde None), moves ise hücre başına hamleler, yerinde kalma ile
+    sabit genişliğe tamamlanmış (boyut, 5) dizi
+    """
+    kernel = model.kernel
+    tables = _ROLLOUT_TABLES.get(kernel)
+    if tables is None:
+        dist = None
+        if kernel.size <= _MAX_MATRIX_CELLS:
+            dist = np.full((kernel.size, kernel.size), FAR, dtype=np.int32)
+            _fill_rows(kernel, dist, np.flatnonzero(np.frombuffer(kernel.passable, dtype=np.uint8)))
+        tables = _ROLLOUT_TABLES[kernel] = (dist, _move_array(kernel))
+        kernel.subscribe(_repair_rollout_tables)
+    return tables
+
+def _move_array(kernel):
+    """Hücre başına hamleler (komşular ve yerinde kalma), en geniş satıra tamamlanmış"""
+    rows = [tuple(kernel.neighbors(cell)) + (cell,) for cell in range(kernel.size)]
+    width = max((len(row) for row in rows), default=1)
+    return np.array([row + (row[-1],) * (width - len(row)) for row in rows],
+                    dtype=np.intp).reshape(kernel.size, width)
+
+def _fill_rows(kernel, dist, cells):
+    """Mesafe matrisinin verilen kaynak satırlarını (ve simetrik sütunlarını) BFS ile doldurur"""
+    walls = ~np.frombuffer(kernel.passable, dtype=bool).reshape(kernel.height, kernel.width)
+    for begin in range(0, len(cells), _BFS_CHUNK):
+        chunk = cells[begin:begin + _BFS_CHUNK]
+        sources = np.stack([chunk % kernel.width, chunk // kernel.width], axis=1)
+        fields = bfs_distance_fields(walls, sources).reshape(len(chunk), -1)
+        dist[chunk] = np.where(fields == UNREACHABLE, FAR, fields)
+        dist[:, chunk] = dist[chunk].T
+
+def _repair_rollout_tables(kernel, cell):
+    """
+    Çekirdek bildirimi: duvarı değişen hücre için rollout tablolarını onarır
+
+    Açılan hücre c için yeni mesafeler min(d(s, v), d(s, c) + d(c, v)) olur ve
+    matris tek vektörel geçişte güncellenir. Kapanan hücrede yalnızca mesafesi
+    gerçekten değişen kaynak satırları BFS ile yeniden hesaplanır: s'den c
+    üzerinden en kısa yolla varılan bir komşunun c'den başka öncülü yoksa.
+    """
+    dist, moves = _ROLLOUT_TABLES[kernel]
+    for row in [cell] + kernel.grid_neighbors(cell):
+        targets = tuple(kernel.neighbors(row)) + (row,)
+        if len(targets) > moves.shape[1]:
+            moves = _move_array(kernel)  # Daha geniş bir satır oluştu
+            break
+        moves[row] = targets + (row,) * (moves.shape[1] - len(targets))
+    _ROLLOUT_TABLES[kernel] = (dist, moves)
+    if dist is None:
+        return
+
+    if kernel.passable[cell]:
+        neighbors = kernel.neighbors(cell)
+        through = np.full(kernel.size, FAR, dtype=np.int32)
+        if neighbors:
+            np.minimum(dist[:, neighbors].min(axis=1) + 1, FAR, out=through)
+        through[cell] = 0
+        dist[cell] = through
+        dist[:, cell] = through
+        for begin in range(0, kernel.size, _BFS_CHUNK):
+            block = dist[begin:begin + _BFS_CHUNK]
+            np.minimum(block, through[begin:begin + _BFS_CHUNK, None] + through[None, :], out=block)
+    else:
+        through = dist[:, cell]
+        affected = np.zeros(kernel.size, dtype=bool)
+        for neighbor in kernel.grid_neighbors(cell):
+            if not kernel.passable[neighbor]:
+                continue
+            level = dist[:, neighbor]
+            downstream = (level == through + 1) & (through < FAR)
+            supported = np.zeros(kernel.size, dtype=bool)
+            for other in kernel.neighbors(neighbor):
+                supported |= dist[:, other] == level - 1
+            affected |= downstream & ~supported
+        affected[cell] = False
+        dist[cell] = FAR
+        dist[:, cell] = FAR
+        _fill_rows(kernel, dist, np.flatnonzero(affected))
+
+class _Node:
+    """Arama ağacı düğümü; value Pac-Man açısından ödüllerin toplamı"""
+    __slots__ = ('state', 'turn', 'move', 'parent', 'children', 'untried', 'visits', 'value')
+
+    def __init__(self, state, turn, move, parent, untried):
+        self.state = state
+        self.turn = turn          # Sıradaki ajan: 0 Pac-Man, i + 1 i. hayalet
+        self.move = move          # Ebeveynden bu düğüme getiren hamle
+        self.parent = parent
+        self.children = {}        # hamle -> _Node
+        self.untried = untried    # Henüz açılmamış hamleler (sondaki önce denenir)
+        self.visits = 0
+        self.value = 0.0
+
+class _Context:
+    """
+    Bir model ve labirent sürümü için rollout dizileri ve saklanan alt ağaçlar
+
+    Aynı örnek birden çok ajan için kullanılabilir ve zamanlayıcı aramaları iç
+    içe sürdürebilir; her arama başladığı bağlamla biter, duvarlar ya da coin
+    yerleşimi değişince diğer aramalar yeni bir bağlam kurar.
+    """
+    __slots__ = ('model', 'version', 'dist', 'moves', 'coin_cells', 'coin_dist', 'cell_coin', 'roots')
+
+    def __init__(self, model):
+        kernel = model.kernel
+        self.model = model
+        self.version = kernel.version
+        self.dist, self.moves = rollout_tables(model)
+        self.coin_cells = np.array(model.coin_cells, dtype=np.intp)
+        # Hücre -> her coine labirent mesafesi, (boyut, coin sayısı)
+        self.coin_dist = np.full((kernel.size, len(self.coin_cells)), FAR, dtype=np.int32)
+        if self.dist is not None:
+            self.coin_dist[:] = self.dist[:, self.coin_cells]  # Matris simetrik
+        elif len(self.coin_cells):
+            sources = np.stack([self.coin_cells % kernel.width, self.coin_cells // kernel.width], axis=1)
+            fields = bfs_distance_fields(np.asarray(kernel.maze) != 0, sources).reshape(len(sources), -1)
+            self.coin_dist[:] = np.where(fields == UNREACHABLE, FAR, fields).T
+        self.cell_coin = np.full(kernel.size, -1, dtype=np.intp)
+        self.cell_coin[self.coin_cells] = np.arange(len(self.coin_cells))
+        self.roots = {}  # sıra -> önceki aramada yapılan hamlenin alt ağacı
+
+class MonteCarloTreeSearchAlgorithm(Algorithm):
+    """
+    UCT ile Monte Carlo ağaç araması
+
+    Ağaç çekişmeli aramayla aynı sıra tabanlı modeli kullanır: Pac-Man düğümleri
+    ödülü, hayalet düğümleri bir eksiğini en büyütmeye çalışır. Her yinelemede
+    leaf_batch yaprak seçilir ve her birinden batch_size oyun, hepsi tek bir NumPy
+    simülasyonunda vektörel olarak rollout_depth tur oynanır; bir yaprağın
+    oyunlarının ortalaması o yaprağın tek örneği sayılır. Rollout'ta Pac-Man (gürültülü)
+    en yakın coine giderken hayaletin yanına girmez; hayaletler greed olasılıkla
+    Pac-Man'e en kısa yoldan yaklaşır, kalan durumda rastgele hamle yapar.
+
+    Ödül kazanmada 1, yakalanmada 0; süre bitince toplanan coin oranıyla 0.1-0.9
+    arasındadır. reuse_tree açıkken yapılan hamlenin alt ağacı saklanır ve sonraki
+    çağrıda güncel durumla eşleşen düğüm yeni kök olur.
+    """
+
+    replan_each_tick = True  # Yalnızca bir sonraki hamle döndürülür
+    single_move = True
+
+    def __init__(self, maze, time_limit_ms=20, iterations=None, batch_size=16, rollout_depth=10,
+                 exploration=0.7, greed=0.8, rollout_noise=2.0, reuse_tree=True, leaf_batch=8,
+                 seed=None):
+        """
+        Parametreler:
+        - time_limit_ms: Hamle başına arama süresi
+        - iterations: Verilirse süre yerine hamle başına bu kadar yaprak (genişletme)
+        - batch_size: Bir yapraktan birlikte oynanan rollout sayısı
+        - rollout_depth: Bir rollout'un en fazla tur sayısı
+        - exploration: UCT keşif katsayısı
+        - greed: Rollout'ta hayaletin en kısa yoldan kovalama olasılığı
+        - rollout_noise: Rollout'ta Pac-Man hamle puanlarına eklenen rastgelelik
+        - reuse_tree: Ağaç, yapılan hamlenin alt ağacından sürdürülsün mü
+        - leaf_batch: Bir yinelemede seçilip birlikte rollout yapılan yaprak sayısı
+        - seed: Rollout rastgele sayı üretecinin tohumu
+        """
+        super().__init__(maze)
+        self.time_limit_ms = time_limit_ms
+        self.iterations = iterations
+        self.batch_size = batch_size
+        self.rollout_depth = rollout_depth
+        self.exploration = exploration
+        self.greed = greed
+        self.rollout_noise = rollout_noise
+        self.reuse_tree = reuse_tree
+        self.leaf_batch = leaf_batch
+        self.rng = np.random.default_rng(seed)
+        self.model = None
+        self.last_iterations = 0  # Son aramada genişletilen yaprak sayısı
+        self._context = None      # Son modelin rollout dizileri ve alt ağaçları
+
+    def find_path(self, start, goal, **kwargs):
+        """Ağaç aramasıyla bir sonraki hamleyi bulur: [start, sonraki konum]"""
+        return self.run_plan(self.plan(start, goal, **kwargs))
+
+    def plan(self, start, goal, **kwargs):
+        """
+        Aramayı üreteç olarak çalıştırır; her yinelemeden sonra o ana kadarki
+        en çok ziyaret edilen hamleyi ara sonuç olarak verir
+
+        Parametreler:
+        - kwargs: pacman, ghosts, coins; hayalet için is_ghost ve current_ghost_index
+        """
+        pacman = kwargs.get('pacman')
+        if pacman is None:
+            return []
+        ghosts = kwargs.get('ghosts', [])
+        coins = kwargs.get('coins', [])
+
+        context = self._context
+        state = context.model.state_from_views(pacman, ghosts, coins) if context is not None else None
+        if state is None:
+            # Yeni oyun ya da yeni coin yerleşimi: bit düzeni değişti
+            self.model, state = StateModel.from_views(self.maze, pacman, ghosts, coins)
+            context = None
+        if context is None or context.version != self.model.kernel.version:
+            # Yeni model ya da duvarlar değişti: ağaçtaki hamleler geçersiz olabilir
+            context = self._context = _Context(self.model)
+        model = context.model
+
+        turn = kwargs.get('current_ghost_index', 0) + 1 if kwargs.get('is_ghost') else 0
+        if turn and turn > len(state.ghosts):
+            return []
+
+        root = self._reuse_root(context, state, turn) if self.reuse_tree else None
+        if root is None:
+            root = _Node(state, turn, None, None, self._ordered_moves(model, state, turn))
+        else:
+            self.call_stats.cache_hits += root.visits
+
+        deadline = time.perf_counter() + self.time_limit_ms / 1000.0
+        count = 0
+        try:
+            while root.untried or root.children:
+                if self.iterations is not None:
+                    if count >= self.iterations:
+                        break
+                elif count and time.perf_counter() > deadline:
+                    break
+                count += self._iterate(context, root)
+                yield [start, model.position(self._best_move(root))]
+        finally:
+            self.last_iterations = count
+            self.call_stats.nodes_expanded += count
+
+        if not root.children:
+            return [start]
+        move = self._best_move(root)
+        context.roots[turn] = root.children[move] if self.reuse_tree else None
+        return [start, model.position(move)]
+
+    @staticmethod
+    def _reuse_root(context, state, turn):
+        """
+        Önceki aramanın sakladığı alt ağaçta güncel durumu arar
+
+        Diğer ajanların aradaki hamleleri en fazla bir tur olduğundan arama o
+        derinlikle sınırlıdır. Dönüş: Yeni kök (ebeveyni koparılmış) ya da None
+        """
+        previous = context.roots.pop(turn, None)
+        if previous is None:
+            return None
+        key = state.key()
+        level = [previous]
+        for _ in range(len(state.ghosts) + 2):
+            for node in level:
+                if node.turn == turn and node.state.key() == key:
+                    node.parent = None
+                    node.move = None
+                    return node
+            level = [child for node in level for child in node.children.values()]
+            if not level:
+                break
+        return None
+
+    def _iterate(self, context, root):
+        """
+        Bir UCT yinelemesi: leaf_batch yaprak seçilip genişletilir, hepsinden
+        birlikte rollout yapılır ve sonuçlar geri yayılır
+
+        Aynı yinelemede farklı yapraklar seçilsin diye seçilen yollara geçici
+        olarak sanal kayıp (seçen ajan için en kötü sonuç) eklenir.
+
+        Dönüş: Seçilen yaprak sayısı
+        """
+        leaves = []
+        for _ in range(self.leaf_batch):
+            node = root
+            while not node.untried and node.children:
+                node = self._select(node)
+            if node.untried:
+                move = node.untried.pop()
+                state, turn = self._apply(context.model, node.state, node.turn, move)
+                untried = self._ordered_moves(context.model, state, turn) if state.status == PLAYING else []
+                child = node.children[move] = _Node(state, turn, move, node, untried)
+                node = child
+            self._virtual_loss(node, 1)
+            leaves.append(node)
+
+        rewards = {}
+        pending = [leaf for leaf in leaves if leaf.state.status == PLAYING]
+        if pending:
+            for leaf, reward in zip(pending, self._rollout(context, pending)):
+                rewards[id(leaf)] = reward
+
+        for leaf in leaves:
+            self._virtual_loss(leaf, -1)
+            if leaf.state.status == PLAYING:
+                reward = rewards[id(leaf)]
+            else:
+                reward = 1.0 if leaf.state.status == WON else 0.0
+            node = leaf
+            while node is not None:
+                node.visits += 1
+                node.value += reward
+                node = node.parent
+        return len(leaves)
+
+    @staticmethod
+    def _virtual_loss(node, sign):
+        """Yaprağın yoluna sanal kayıp ekler (sign=1) ya da geri alır (sign=-1)"""
+        while node is not None:
+            node.visits += sign
+            if node.parent is not None and node.parent.turn:
+                node.value += sign  # Hayaletin seçtiği hamle için kayıp Pac-Man'in kazancıdır
+            node = node.parent
+
+    def _select(self, node):
+        """UCT: ajanın kendi açısından ortalama ödül ve keşif terimi en büyük çocuk"""
+        scale = self.exploration * math.sqrt(math.log(node.visits))
+        maximizing = node.turn == 0
+        best, best_score = None, None
+        for child in node.children.values():
+            mean = child.value / child.visits
+            score = (mean if maximizing else 1.0 - mean) + scale / math.sqrt(child.visits)
+            if best_score is None or score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _best_move(self, root):
+        """Kökte en çok ziyaret edilen hamle (eşitlikte ortalaması iyi olan)"""
+        sign = 1.0 if root.turn == 0 else -1.0
+        return max(root.children.values(),
+                   key=lambda child: (child.visits, sign * child.value / child.visits)).move
+
+    @staticmethod
+    def _apply(model, state, turn, move):
+        """Sıradaki ajanın hamlesini uygular; (yeni durum, sonraki sıra)"""
+        if turn == 0:
+            child = model.move_pacman(state, move)
+        else:
+            child = model.move_ghost(state, turn - 1, move)
+        return child, (turn + 1) % (len(state.ghosts) + 1)
+
+    @staticmethod
+    def _ordered_moves(model, state, turn):
+        """
+        Açılacak hamleler; umut verici olan listenin sonunda (önce açılır)
+
+        Pac-Man için coin toplayan ve en yakın coine yaklaştıran, hayaletler için
+        Pac-Man'e yaklaştıran hamleler önce denenir.
+        """
+        if turn == 0:
+            return sorted(model.moves[state.pacman], reverse=True, key=lambda move: (
+                not model.coin_mask[move] & state.coins,
+                model.nearest_coin_distance(state, move)
+            ))
+        dist = model.distances(state.pacman)
+        return sorted(model.moves[state.ghosts[turn - 1]], key=dist.__getitem__, reverse=True)
+
+    @staticmethod
+    def _distance(context, cells, targets):
+        """Hücreler arası mesafe (yayınlanan diziler); matris yoksa Manhattan"""
+        if context.dist is not None:
+            return context.dist.take(cells * context.dist.shape[1] + targets)
+        width = context.model.width
+        return np.abs(cells % width - targets % width) + np.abs(cells // width - targets // width)
+
+    def _rollout(self, context, leaves):
+        """
+        Her yapraktan batch_size oyunu tek bir vektörel simülasyonda oynar
+
+        Satırlar ajanları aynı sırayla hareket ettirir; sırası gelmemiş bir
+        yapraktan başlayan satırlar kendi ajanlarının sırasına kadar bekler.
+
+        Dönüş: Yaprak başına ortalama ödül (Pac-Man açısından, 0-1)
+        """
+        per_leaf = self.batch_size
+        count = per_leaf * len(leaves)
+        rng = self.rng
+        moves, coin_dist, cell_coin = context.moves, context.coin_dist, context.cell_coin
+        ghost_count = len(leaves[0].state.ghosts)
+        agents = ghost_count + 1
+        coin_count = len(context.coin_cells)
+        rows = np.arange(count)
+
+        pacman = np.repeat(np.array([leaf.state.pacman for leaf in leaves], dtype=np.intp), per_leaf)
+        ghosts = np.repeat(np.array([leaf.state.ghosts for leaf in leaves], dtype=np.intp)
+                           .reshape(len(leaves), ghost_count), per_leaf, axis=0)
+        alive = np.repeat(np.array([[leaf.state.coins >> bit & 1 for bit in range(coin_count)]
+                                    for leaf in leaves], dtype=bool).reshape(len(leaves), coin_count),
+                          per_leaf, axis=0)
+        eaten_penalty = np.where(alive, 0, FAR)  # Toplanan coinler en yakın coin aramasına girmez
+        remaining = alive.sum(axis=1)
+        status = np.zeros(count, dtype=np.int8)
+
+        turns = np.repeat(np.array([leaf.turn for leaf in leaves]), per_leaf)
+        first = int(turns.min())
+        joins = (turns - first) % agents  # Satırın ilk hamlesini yapacağı adım
+        last_join = int(joins.max())
+        plies = self.rollout_depth * agents + last_join
+
+        # Rastgele sayılar tek seferde üretilir
+        noise = rng.random((plies, count, moves.shape[1])) * self.rollout_noise
+        wander = rng.integers(0, moves.shape[1], (plies, count))
+        chasing = rng.random((plies, count)) < self.greed
+
+        playing = status == PLAYING
+        for ply in range(plies):
+            if ply <= last_join:
+                playing = (status == PLAYING) & (joins <= ply)
+            agent = (first + ply) % agents
+            if agent == 0:
+                options = moves[pacman]
+                score = noise[ply]
+                if coin_count:
+                    score = score + (coin_dist[options] + eaten_penalty[:, None, :]).min(axis=2)
+                if ghost_count:
+                    near = self._distance(context, options[:, :, None], ghosts[:, None, :]).min(axis=2) <= 1
+                    score = score + DANGER * near
+                pacman = np.where(playing, options[rows, score.argmin(axis=1)], pacman)
+
+                coin = cell_coin[pacman]
+                hit = playing & (coin >= 0)
+                hit[hit] = alive[rows[hit], coin[hit]]
+                if hit.any():
+                    alive[rows[hit], coin[hit]] = False
+                    eaten_penalty[rows[hit], coin[hit]] = FAR
+                    remaining -= hit
+                    if not ghost_count:
+                        status[hit & (remaining == 0)] = WON
+                        playing = status == PLAYING
+            else:
+                index = agent - 1
+                options = moves[ghosts[:, index]]
+                chase = self._distance(context, pacman[:, None], options).argmin(axis=1)
+                column = np.where(chasing[ply], chase, wander[ply])
+                moved = np.where(playing, options[rows, column], ghosts[:, index])
+                ghosts[:, index] = moved
+                caught = playing & (moved == pacman)
+                status[caught] = LOST
+                if index == ghost_count - 1:
+                    status[playing & ~caught & (remaining == 0)] = WON
+                playing &= status == PLAYING
+                if ply >= last_join and not playing.any():
+                    break
+
+        total = coin_count or 1
+        progress = (total - remaining) / total
+        reward = np.where(status == WON, 1.0, np.where(status == LOST, 0.0, 0.1 + 0.8 * progress))
+        return reward.reshape(len(leaves), per_leaf).mean(axis=1)
@@ -0,0 +1,101 @@
+class CallStats:
+    """
+    Tek bir find_path çağrısının iş sayaçları
+
+    Algoritmalar çağrı sırasında self.call_stats üzerindeki sayaçları artırır;
+    Algorithm temel sınıfı çağrı başında sıfırlar, sonunda metriklere ekler.
+    """
+    __slots__ = ('nodes_expanded', 'frontier_peak', 'cache_hits')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.nodes_expanded = 0  # Genişletilen düğüm / değerlendirilen aday sayısı
+        self.frontier_peak = 0   # Sınır (açık liste, kuyruk, popülasyon) en büyük boyutu
+        self.cache_hits = 0      # Önbellekten karşılanan işlemler
+
+class AlgorithmMetrics:
+    """
+    Bir algoritma örneğinin find_path çağrıları üzerinden biriken ölçümleri
+
+    Süreler time.perf_counter_ns ile nanosaniye olarak tutulur. Kayıt yalnızca
+    toplama ve karşılaştırma yapar; kapatmak için Algorithm.enable_metrics(False).
+    """
+    __slots__ = ('calls', 'total_ns', 'max_ns', 'nodes_expanded', 'frontier_peak',
+                 'path_length', 'cache_hits', 'last_ns', 'last_nodes', 'last_path_length')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Tüm sayaçları sıfırlar"""
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.nodes_expanded = 0
+        self.frontier_peak = 0
+        self.path_length = 0
+        self.cache_hits = 0
+        self.last_ns = 0
+        self.last_nodes = 0
+        self.last_path_length = 0
+
+    def record(self, elapsed_ns, path_length, stats):
+        """Bir çağrının sonucunu ekler"""
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.nodes_expanded += stats.nodes_expanded
+        if stats.frontier_peak > self.frontier_peak:
+            self.frontier_peak = stats.frontier_peak
+        self.path_length += path_length
+        self.cache_hits += stats.cache_hits
+        self.last_ns = elapsed_ns
+        self.last_nodes = stats.nodes_expanded
+        self.last_path_length = path_length
+
+    def merge(self, other):
+        """Başka bir ölçüm nesnesini bununla birleştirir (ör. ayrı oyunlardan)"""
+        self.calls += other.calls
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.nodes_expanded += other.nodes_expanded
+        self.frontier_peak = max(self.frontier_peak, other.frontier_peak)
+        self.path_length += other.path_length
+        self.cache_hits += other.cache_hits
+        return self
+
+    def summary(self):
+        """
+        Okunabilir özet
+
+        Dönüş: calls, total_ms, mean_ms, max_ms, nodes_expanded, nodes_per_call,
+        frontier_peak, mean_path_length ve cache_hits anahtarlı sözlük
+        """
+        calls = self.calls or 1
+        return {
+            'calls': self.calls,
+            'total_ms': self.total_ns / 1e6,
+            'mean_ms': self.total_ns / calls / 1e6,
+            'max_ms': self.max_ns / 1e6,
+            'nodes_expanded': self.nodes_expanded,
+            'nodes_per_call': self.nodes_expanded / calls,
+            'frontier_peak': self.frontier_peak,
+            'mean_path_length': self.path_length / calls,
+            'cache_hits': self.cache_hits,
+        }
+
+    def to_dict(self):
+        """JSON'a yazılabilir biçim (birleştirilebilir sayaçlar)"""
+        return {'calls': self.calls, 'total_ns': self.total_ns, 'max_ns': self.max_ns,
+                'nodes_expanded': self.nodes_expanded, 'frontier_peak': self.frontier_peak,
+                'path_length': self.path_length, 'cache_hits': self.cache_hits}
+
+    @classmethod
+    def from_dict(cls, data):
+        metrics = cls()
+        for name, value in data.items():
+            setattr(metrics, name, value)
+        return metrics
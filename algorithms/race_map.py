@@ -0,0 +1,110 @@
+import weakref
+
+from .search_kernel import SearchKernel
+
+# Labirent başına son yarış haritası: çekirdek -> RaceMap
+_RACE_MAPS = weakref.WeakKeyDictionary()
+
+class RaceMap:
+    """
+    Pac-Man ile hayaletler arasındaki yarışın hücre başına sonucu
+
+    Biri tüm hayaletlerden (çok kaynaklı), biri Pac-Man'den olmak üzere iki BFS
+    ile kurulur; maliyeti hayalet sayısından bağımsızdır. Pac-Man önce hareket
+    ettiğinden bir hücreye d adımda varan Pac-Man, oraya en az d + 1 adımda
+    varabilen hayaletlerden önce geçer: güvenli hücreler pacman < ghost olanlardır.
+
+    Planlayıcılar haritayı iki biçimde kullanabilir: is_safe/margin ile O(1)
+    sorgu (ör. BFS'te güvensiz hücreleri engel saymak) ya da cost listesiyle
+    kenar maliyeti katmanı (A*'da hücreye girme maliyetine eklenir).
+    """
+    __slots__ = ('kernel', 'key', 'version', 'pacman_dist', 'ghost_dist', 'safe', 'cost')
+
+    def __init__(self, kernel, pacman_cell, ghost_cells, danger_radius=3, unsafe_cost=20, stats=None):
+        """
+        Parametreler:
+        - kernel: Labirentin SearchKernel'i
+        - pacman_cell: Pac-Man'in hücre indeksi
+        - ghost_cells: Hayaletlerin hücre indeksleri
+        - danger_radius: Pac-Man'in bu kadar adımdan az önde olduğu hücreler tehlikeli sayılır
+        - unsafe_cost: Hayaletin önce varabildiği hücrelerin ek maliyeti
+        - stats: Verilirse BFS iş sayaçları eklenir (CallStats)
+        """
+        self.kernel = kernel
+        self.key = (pacman_cell, tuple(ghost_cells), danger_radius, unsafe_cost)
+        self.version = kernel.version  # Haritanın kurulduğu labirent sürümü
+        self.pacman_dist = kernel.distance_field([pacman_cell], stats)
+        self.ghost_dist = kernel.distance_field(ghost_cells, stats)
+
+        # Güvenli hücreler ve ek maliyetler (Pac-Man'in ulaşamadığı hücreler güvensiz)
+        self.safe = [False] * kernel.size
+        self.cost = [0] * kernel.size
+        for cell, (mine, theirs) in enumerate(zip(self.pacman_dist, self.ghost_dist)):
+            if mine is None:
+                self.cost[cell] = unsafe_cost
+            elif theirs is None or mine < theirs:
+                self.safe[cell] = True
+                if theirs is not None and theirs - mine < danger_radius:
+                    self.cost[cell] = danger_radius - (theirs - mine)
+            else:
+                self.cost[cell] = unsafe_cost
+
+    @classmethod
+    def for_positions(cls, maze, pacman, ghosts, danger_radius=3, unsafe_cost=20, stats=None):
+        """
+        Konumlar için yarış haritası; aynı tikte (aynı konumlar ve aynı labirent
+        sürümüyle) tekrar istenirse labirent başına saklanan harita döndürülür
+
+        Parametreler:
+        - pacman: Pac-Man'in (x, y) konumu
+        - ghosts: Hayaletlerin (x, y) konumları
+        """
+        kernel = SearchKernel.for_maze(maze)
+        key = (kernel.index(pacman), tuple(kernel.index(ghost) for ghost in ghosts), danger_radius, unsafe_cost)
+        race = _RACE_MAPS.get(kernel)
+        if race is not None and race.key == key and race.version == kernel.version:
+            if stats is not None:
+                stats.cache_hits += 1
+            return race
+        race = _RACE_MAPS[kernel] = cls(kernel, key[0], key[1], danger_radius, unsafe_cost, stats)
+        return race
+
+    def is_safe(self, pos):
+        """Pac-Man hücreye tüm hayaletlerden önce varabilir mi"""
+        cell = self.kernel.index(pos)
+        return cell >= 0 and self.safe[cell]
+
+    def margin(self, pos):
+        """Hayaletlerin en erken varışı ile Pac-Man'in varışı arasındaki fark (yoksa None)"""
+        cell = self.kernel.index(pos)
+        if cell < 0:
+            return None
+        mine, theirs = self.pacman_dist[cell], self.ghost_dist[cell]
+        if mine is None or theirs is None:
+            return None
+        return theirs - mine
+
+    def danger(self, pos):
+        """Hücrenin ek maliyeti (kenar maliyeti katmanındaki değer)"""
+        cell = self.kernel.index(pos)
+        return self.cost[cell] if cell >= 0 else 0
+
+    def unsafe_cells(self):
+        """Bool listesi: True olan hücrelere Pac-Man güvenle giremez"""
+        return [not safe for safe in self.safe]
+
+def pacman_race_map(maze, start, kwargs, danger_radius=3, unsafe_cost=20, stats=None):
+    """
+    find_path'e verilen ekstra parametrelerden Pac-Man için yarış haritası
+
+    Hayalet çağrılarında, hayalet yokken ya da start Pac-Man'in konumu değilse
+    None döndürür (ör. ileriye dönük planlar).
+    """
+    if kwargs.get('is_ghost'):
+        return None
+    pacman = kwargs.get('pacman')
+    ghosts = kwargs.get('ghosts')
+    if pacman is None or not ghosts or (pacman.x, pacman.y) != tuple(start):
+        return None
+    return RaceMap.for_positions(maze, start, [(ghost.x, ghost.y) for ghost in ghosts],
+                                 danger_radius, unsafe_cost, stats)
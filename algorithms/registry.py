@@ -0,0 +1,77 @@
+import importlib
+from collections.abc import Mapping
+
+# Algoritma adı -> (modül, sınıf adı, varsayılan parametreler)
+# Modüller (ve NumPy, scikit-learn gibi ağır bağımlılıkları) yalnızca algoritma
+# ilk kez seçildiğinde içe aktarılır.
+ALGORITHMS = {
+    "A*": (".astar", "AStarAlgorithm", {}),
+    "BFS": (".bfs", "BFSAlgorithm", {}),
+    "DFS": (".dfs", "LimitedDFSAlgorithm", {"max_depth": 10}),
+    "GA": (".genetic_algorithm", "GeneticAlgorithm", {
+        "population_size": 50, "chromosome_length": 20,
+        "mutation_rate": 0.1, "elite_size": 5, "generations": 5
+    }),
+    "DT": (".decision_tree", "DecisionTreeAlgorithm", {}),
+    "A*-safe": (".astar", "SafeAStarAlgorithm", {}),
+    "BFS-safe": (".bfs", "SafeBFSAlgorithm", {}),
+    "COOP": (".cooperative", "CooperativeGhostPlanner", {"horizon": 8, "replan_every": 4}),
+    "AB": (".adversarial", "AdversarialSearchAlgorithm", {"mode": "alphabeta", "time_limit_ms": 20}),
+    "EXP": (".adversarial", "AdversarialSearchAlgorithm", {"mode": "expectimax", "time_limit_ms": 20}),
+    "MCTS": (".mcts", "MonteCarloTreeSearchAlgorithm", {"time_limit_ms": 20, "batch_size": 32}),
+}
+
+def register_algorithm(name, module, class_name, **params):
+    """Kayıt defterine yeni bir algoritma ekler (modül adı mutlak veya algorithms'a göreli)"""
+    ALGORITHMS[name] = (module, class_name, params)
+
+def algorithm_names():
+    """Kayıtlı algoritma adlarını döndürür"""
+    return list(ALGORITHMS)
+
+def get_algorithm_class(name):
+    """Algoritma sınıfını döndürür; modülü gerekirse şimdi içe aktarır"""
+    module_name, class_name, _ = ALGORITHMS[name]
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, class_name)
+
+def algorithm_params(name):
+    """Algoritmanın kayıtlı varsayılan parametreleri"""
+    return dict(ALGORITHMS[name][2])
+
+def is_deterministic(name):
+    """Algoritma rastgelelik kullanmadan aynı girdilere aynı yolu mu döndürür"""
+    return name in ALGORITHMS and get_algorithm_class(name).deterministic
+
+def create_algorithm(name, maze, **params):
+    """Kayıtlı bir algoritmayı varsayılan parametreleriyle (params ile değiştirilebilir) oluşturur"""
+    defaults = ALGORITHMS[name][2]
+    return get_algorithm_class(name)(maze, **{**defaults, **params})
+
+class LazyAlgorithms(Mapping):
+    """Algoritma örneklerini ilk erişimde oluşturan salt okunur sözlük"""
+    
+    def __init__(self, maze):
+        self.maze = maze
+        self._instances = {}
+    
+    def __getitem__(self, name):
+        if name not in self._instances:
+            if name not in ALGORITHMS:
+                raise KeyError(name)
+            self._instances[name] = create_algorithm(name, self.maze)
+        return self._instances[name]
+    
+    def __contains__(self, name):
+        # Mapping'in varsayılanı __getitem__ çağırır; burada örnek oluşturmadan kontrol et
+        return name in ALGORITHMS
+    
+    def __iter__(self):
+        return iter(ALGORITHMS)
+    
+    def __len__(self):
+        return len(ALGORITHMS)
+    
+    def loaded(self):
+        """Şimdiye kadar oluşturulmuş algoritma örnekleri (ad -> örnek)"""
+        return dict(self._instances)
@@ -0,0 +1,549 @@
+import heapq
+from array import array
+from collections import OrderedDict
+
+_DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Aşağı, Sağ, Yukarı, Sol - get_neighbors ile aynı
+
+class SearchWorkspace:
+    """
+    Tek bir aramanın çalışma alanı: ebeveyn, maliyet ve ziyaret damgası dizileri
+
+    Diziler bir kez ayrılır. Her yeni arama yalnızca `generation` sayacını artırır;
+    damgası güncel nesle eşit olmayan hücreler ziyaret edilmemiş sayılır, böylece
+    sıfırlama O(1) olur.
+    """
+    __slots__ = ('parent', 'cost', 'stamp', 'closed', 'generation', 'queue', 'buckets', 'used_buckets')
+
+    def __init__(self, size):
+        self.parent = [-1] * size
+        self.cost = [0] * size
+        self.stamp = [0] * size    # stamp[i] == generation ise i bu aramada görüldü
+        self.closed = [0] * size   # closed[i] == generation ise i genişletildi
+        self.generation = 0
+        self.queue = [0] * size    # BFS için sabit boyutlu kuyruk
+        self.buckets = []          # A* için kova kuyruğu (Dial)
+        self.used_buckets = 0
+
+    def reset(self):
+        """Yeni arama için çalışma alanını O(1) sürede sıfırlar"""
+        self.generation += 1
+
+class SearchKernel:
+    """
+    Düz hücre indeksleri (i = y * genişlik + x) üzerinde çalışan arama çekirdeği
+
+    Komşuluk tablosu labirent başına bir kez oluşturulur ve A*, BFS ile DFS
+    tarafından (Pac-Man ve hayaletler için) paylaşılır. Tablolar hücre başına
+    Python nesnesi tutmaz: xs/ys birer array('i'), passable ve open_dirs birer
+    bytearray'dir. open_dirs[i] hücrenin açık komşu yönlerinin bit maskesidir
+    (bit d, _DIRECTIONS[d]); komşular i + offsets[open_dirs[i]] farklarıdır.
+    Labirent np.asarray ile okunabiliyorsa (ör. bellek eşlemeli TiledGrid)
+    tablolar NumPy ile vektörel kurulur. Aramaların sıcak döngüleri komşu
+    listelerini neighbor_cache'ten okur; bir hücrenin listesi ilk
+    genişletildiğinde oluşturulur, böylece büyük labirentlerde yalnızca
+    aramaların gezdiği bölge için liste tutulur. Çalışma alanları bir
+    havuzdan alınır; duraklatılmış (anytime) aramalar kendi alanlarını tuttuğu
+    için aynı anda birden çok arama çakışmadan yürüyebilir.
+
+    Labirent değişebiliyorsa (DynamicMaze) çekirdek ona abone olur: her duvar
+    değişikliğinde yalnızca hücrenin ve dört komşusunun tablosu güncellenir,
+    version artar ve değişen hücre günlüğe yazılır. Çekirdek üzerine kurulu
+    önbellekler version'ı saklayıp changes_since ile yalnızca etkilenen bölgeyi
+    onarır (repair_distance_field) ya da subscribe ile hemen bilgilendirilir.
+    """
+
+    _kernels = OrderedDict()  # id(maze) -> SearchKernel
+    _max_kernels = 16
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.height = len(maze)
+        self.width = len(maze[0]) if self.height > 0 else 0
+        self.size = self.width * self.height
+
+        # Yön maskesi -> açık komşuların düz indeks farkları (yön sırasıyla)
+        deltas = [dy * self.width + dx for dx, dy in _DIRECTIONS]
+        self.offsets = tuple(tuple(delta for d, delta in enumerate(deltas) if mask >> d & 1)
+                             for mask in range(16))
+        if hasattr(maze, '__array__'):
+            self._build_tables_numpy()
+        else:
+            self._build_tables()
+        self.neighbor_cache = [None] * self.size  # Hücre -> komşu listesi (ilk kullanımda)
+
+        self._free_workspaces = []
+
+        # Duvar değişiklikleri: sürüm, değişen hücreler ve çekirdeğin aboneleri
+        self.version = 0
+        self._changes = []
+        self._listeners = []
+        subscribe = getattr(maze, 'subscribe', None)
+        if subscribe is not None:
+            subscribe(self._wall_changed)
+
+    @classmethod
+    def for_maze(cls, maze):
+        """Labirent için paylaşılan çekirdeği döndürür (gerekirse oluşturur)"""
+        kernel = cls._kernels.get(id(maze))
+        if kernel is None or kernel.maze is not maze:
+            kernel = cls(maze)
+            cls._kernels[id(maze)] = kernel
+            # Simülasyonlar her oyunda yeni labirent oluşturur; en eskileri bırak
+            while len(cls._kernels) > cls._max_kernels:
+                cls._kernels.popitem(last=False)
+        else:
+            cls._kernels.move_to_end(id(maze))
+        return kernel
+
+    def index(self, pos):
+        """(x, y) konumunun düz indeksi; labirent dışındaysa -1"""
+        x, y = pos
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return -1
+
+    def _build_tables(self):
+        """Tabloları labirent satırlarından hücre hücre kurar (iç içe listeler için)"""
+        maze, width = self.maze, self.width
+        self.xs = array('i', range(width)) * self.height
+        self.ys = array('i', [y for y in range(self.height) for _ in range(width)])
+        self.passable = bytearray(cell == 0 for row in maze for cell in row[:width])
+        self.open_dirs = bytearray(self.size)
+        for cell in range(self.size):
+            self._update_open_dirs(cell)
+
+    def _build_tables_numpy(self):
+        """Tabloları labirent dizisinden NumPy ile vektörel kurar"""
+        import numpy as np
+
+        height, width = self.height, self.width
+        passable = np.asarray(self.maze).reshape(height, width) == 0
+        self.passable = bytearray(passable.tobytes())
+
+        cells = np.arange(self.size, dtype=np.intc)
+        xs, ys = cells % max(width, 1), cells // max(width, 1)
+        self.xs = array('i', xs.tobytes())
+        self.ys = array('i', ys.tobytes())
+
+        flat = passable.ravel()
+        open_dirs = np.zeros(self.size, dtype=np.uint8)
+        inside = [ys < height - 1, xs < width - 1, ys > 0, xs > 0]
+        for d, (dx, dy) in enumerate(_DIRECTIONS):
+            target = np.where(inside[d], cells + dy * width + dx, 0)
+            open_dirs |= ((inside[d] & flat & flat[target]) << d).astype(np.uint8)
+        self.open_dirs = bytearray(open_dirs.tobytes())
+
+    def position(self, cell):
+        """Hücre indeksinin (x, y) konumu"""
+        return self.xs[cell], self.ys[cell]
+
+    def grid_neighbors(self, cell):
+        """Hücrenin labirent içindeki dört komşusu (duvar olsalar da)"""
+        x, y = self.xs[cell], self.ys[cell]
+        cells = []
+        for dx, dy in _DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                cells.append(ny * self.width + nx)
+        return cells
+
+    def neighbors(self, cell):
+        """Hücrenin geçilebilir komşuları; liste neighbor_cache'e yazılır (değiştirilmemeli)"""
+        following = [cell + delta for delta in self.offsets[self.open_dirs[cell]]]
+        self.neighbor_cache[cell] = following
+        return following
+
+    def _update_open_dirs(self, cell):
+        """Hücrenin yön maskesini passable tablosundan yeniden hesaplar"""
+        mask = 0
+        if self.passable[cell]:
+            x, y = self.xs[cell], self.ys[cell]
+            for d, (dx, dy) in enumerate(_DIRECTIONS):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < self.width and 0 <= ny < self.height and self.passable[ny * self.width + nx]:
+                    mask |= 1 << d
+        self.open_dirs[cell] = mask
+
+    def _wall_changed(self, x, y, wall):
+        """Labirent bildirimi: hücrenin ve komşularının tablolarını günceller"""
+        cell = y * self.width + x
+        self.passable[cell] = not wall
+        # Tablolar yerinde yazılır; onları tutan duraklatılmış aramalar güncel hali görür
+        for changed in [cell] + self.grid_neighbors(cell):
+            self._update_open_dirs(changed)
+            self.neighbor_cache[changed] = None
+        self.version += 1
+        self._changes.append(cell)
+        for listener in self._listeners:
+            listener(self, cell)
+
+    def subscribe(self, listener):
+        """listener(kernel, cell) her duvar değişikliğinden sonra çağrılır"""
+        self._listeners.append(listener)
+
+    def changes_since(self, version):
+        """version'dan sonra duvarı değişen hücrelerin kümesi"""
+        return set(self._changes[version:])
+
+    def acquire(self, stats=None):
+        """Havuzdan sıfırlanmış bir çalışma alanı alır (havuzdan gelirse önbellek isabeti sayılır)"""
+        if self._free_workspaces:
+            workspace = self._free_workspaces.pop()
+            if stats is not None:
+                stats.cache_hits += 1
+        else:
+            workspace = SearchWorkspace(self.size)
+        workspace.reset()
+        return workspace
+
+    def release(self, workspace):
+        """Çalışma alanını havuza geri verir"""
+        # Erken biten A* aramasından kalan kova içeriklerini temizle
+        for i in range(workspace.used_buckets):
+            workspace.buckets[i].clear()
+        workspace.used_buckets = 0
+        self._free_workspaces.append(workspace)
+
+    def build_path(self, workspace, end):
+        """Ebeveyn dizisini izleyerek başlangıçtan end'e (x, y) yolunu oluşturur"""
+        path = []
+        xs, ys = self.xs, self.ys
+        parent = workspace.parent
+        while end != -1:
+            path.append((xs[end], ys[end]))
+            end = parent[end]
+        path.reverse()
+        return path
+
+    def astar(self, start, goal, yield_every=0, stats=None, extra_cost=None):
+        """
+        Kova (Dial) kuyruğuyla A* araması (üreteç)
+
+        Tüm kenar maliyetleri 1 ve Manhattan sezgiseli tutarlı olduğundan
+        f = g + h değerleri hiç azalmaz; kuyruk f değerine göre dizilmiş
+        listelerden oluşur ve heapq gerekmez.
+
+        yield_every > 0 ise her yield_every genişletmede bir, hedefe en yakın
+        genişletilmiş düğüme giden yolu yield eder. Nihai yolu (yol yoksa [])
+        return eder. stats (CallStats) verilirse iş sayaçları ona eklenir.
+        extra_cost (hücre başına negatif olmayan tamsayı listesi) verilirse bir
+        hücreye girmenin maliyeti 1 + extra_cost[hücre] olur; sezgisel yine tutarlıdır.
+        """
+        start_i = self.index(start)
+        goal_i = self.index(goal)
+        if start_i < 0 or not self.passable[start_i]:
+            return []
+        if start_i == goal_i:
+            return [start]
+
+        ws = self.acquire(stats)
+        expanded = 0
+        frontier_peak = 0
+        try:
+            gen = ws.generation
+            parent, cost, stamp, closed = ws.parent, ws.cost, ws.stamp, ws.closed
+            buckets = ws.buckets
+            neighbor_cache, neighbors = self.neighbor_cache, self.neighbors
+            xs, ys = self.xs, self.ys
+            gx, gy = goal
+
+            h0 = abs(xs[start_i] - gx) + abs(ys[start_i] - gy)
+            parent[start_i] = -1
+            cost[start_i] = 0
+            stamp[start_i] = gen
+            if not buckets:
+                buckets.append([])
+            buckets[0].append(start_i)
+            ws.used_buckets = max(ws.used_buckets, 1)
+
+            best, best_h = start_i, h0
+            level = 0  # Geçerli kova: f - h0
+            found = False
+            queued = 1  # Kovalardaki kayıt sayısı (eski kayıtlar dahil)
+
+            while level < ws.used_buckets:
+                bucket = buckets[level]
+                if not bucket:
+                    level += 1
+                    continue
+                if queued > frontier_peak:
+                    frontier_peak = queued
+                current = bucket.pop()
+                queued -= 1
+                if closed[current] == gen:
+                    continue  # Daha iyi maliyetle zaten genişletilmiş (eski kayıt)
+                if current == goal_i:
+                    found = True
+                    break
+                closed[current] = gen
+
+                h = abs(xs[current] - gx) + abs(ys[current] - gy)
+                if h < best_h:
+                    best, best_h = current, h
+
+                step_cost = cost[current] + 1
+                following = neighbor_cache[current]
+                if following is None:
+                    following = neighbors(current)
+                for nxt in following:
+                    new_cost = step_cost + extra_cost[nxt] if extra_cost is not None else step_cost
+                    if stamp[nxt] != gen or new_cost < cost[nxt]:
+                        stamp[nxt] = gen
+                        cost[nxt] = new_cost
+                        parent[nxt] = current
+                        f_level = new_cost + abs(xs[nxt] - gx) + abs(ys[nxt] - gy) - h0
+                        while len(buckets) <= f_level:
+                            buckets.append([])
+                        if f_level >= ws.used_buckets:
+                            ws.used_buckets = f_level + 1
+                        buckets[f_level].append(nxt)
+                        queued += 1
+
+                expanded += 1
+                if yield_every and expanded % yield_every == 0:
+                    yield self.build_path(ws, best)
+
+            return self.build_path(ws, goal_i) if found else []
+        finally:
+            self.release(ws)
+            if stats is not None:
+                stats.nodes_expanded += expanded
+                stats.frontier_peak = max(stats.frontier_peak, frontier_peak)
+
+    def bfs(self, start, goal, yield_every=0, stats=None, blocked=None):
+        """
+        Sabit boyutlu dizi kuyruğuyla BFS araması (üreteç)
+
+        yield_every > 0 ise ara sonuç olarak hedefe Manhattan mesafesi en küçük
+        olan genişletilmiş düğüme giden yolu verir. Nihai yolu (yol yoksa [])
+        return eder. stats (CallStats) verilirse iş sayaçları ona eklenir.
+        blocked (hücre başına bool listesi) verilirse True olan hücrelere girilmez.
+        """
+        start_i = self.index(start)
+        goal_i = self.index(goal)
+        if start_i < 0 or not self.passable[start_i]:
+            return []
+        if start_i == goal_i:
+            return [start]
+
+        ws = self.acquire(stats)
+        head = 0
+        frontier_peak = 0
+        try:
+            gen = ws.generation
+            parent, stamp, queue = ws.parent, ws.stamp, ws.queue
+            neighbor_cache, neighbors = self.neighbor_cache, self.neighbors
+            xs, ys = self.xs, self.ys
+            gx, gy = goal
+
+            parent[start_i] = -1
+            stamp[start_i] = gen
+            queue[0] = start_i
+            head, tail = 0, 1
+
+            best = start_i
+            best_dist = abs(xs[start_i] - gx) + abs(ys[start_i] - gy)
+
+            while head < tail:
+                if tail - head > frontier_peak:
+                    frontier_peak = tail - head
+                current = queue[head]
+                head += 1
+
+                dist = abs(xs[current] - gx) + abs(ys[current] - gy)
+                if dist < best_dist:
+                    best, best_dist = current, dist
+
+                following = neighbor_cache[current]
+                if following is None:
+                    following = neighbors(current)
+                for nxt in following:
+                    if stamp[nxt] != gen and (blocked is None or not blocked[nxt]):
+                        stamp[nxt] = gen
+                        parent[nxt] = current
+                        if nxt == goal_i:
+                            return self.build_path(ws, goal_i)
+                        queue[tail] = nxt
+                        tail += 1
+
+                if yield_every and head % yield_every == 0:
+                    yield self.build_path(ws, best)
+
+            return []
+        finally:
+            self.release(ws)
+            if stats is not None:
+                stats.nodes_expanded += head
+                stats.frontier_peak = max(stats.frontier_peak, frontier_peak)
+
+    def distance_field(self, sources, stats=None):
+        """
+        Çok kaynaklı BFS: her hücrenin en yakın kaynağa labirent mesafesi
+
+        Parametreler:
+        - sources: Kaynak hücre indeksleri (duvar ya da labirent dışı olanlar atlanır)
+
+        Dönüş: Hücre başına mesafe listesi; ulaşılamayan hücrelerde None
+        """
+        dist = [None] * self.size
+        ws = self.acquire(stats)
+        tail = 0
+        try:
+            queue = ws.queue
+            for source in sources:
+                if 0 <= source < self.size and self.passable[source] and dist[source] is None:
+                    dist[source] = 0
+                    queue[tail] = source
+                    tail += 1
+
+            neighbor_cache, neighbors = self.neighbor_cache, self.neighbors
+            head = 0
+            while head < tail:
+                current = queue[head]
+                head += 1
+                next_dist = dist[current] + 1
+                following = neighbor_cache[current]
+                if following is None:
+                    following = neighbors(current)
+                for nxt in following:
+                    if dist[nxt] is None:
+                        dist[nxt] = next_dist
+                        queue[tail] = nxt
+                        tail += 1
+            return dist
+        finally:
+            self.release(ws)
+            if stats is not None:
+                stats.nodes_expanded += tail
+
+    def repair_distance_field(self, dist, sources, cells, stats=None, unreachable=None):
+        """
+        Bir mesafe alanını duvarı değişen hücrelere göre yerinde onarır
+
+        Yalnızca mesafesi değişebilecek bölgeye dokunulur. Önce kapanan
+        hücrelerden başlayarak, mesafe sırasıyla, bir eksik mesafeli açık komşusu
+        (desteği) kalmayan hücreler geçersiz kılınır. Sonra geçersiz ve yeni
+        açılan hücreler komşularından tohumlanır ve mesafeler Dijkstra ile
+        yalnızca azaldıkları yere yayılır. Sonuç distance_field ile aynıdır.
+
+        Parametreler:
+        - dist: distance_field (ya da aynı biçimde) mesafe listesi; yerinde değişir
+        - sources: Alanın kaynak hücreleri
+        - cells: Duvarı değişen hücreler (changes_since çıktısı)
+        - unreachable: Ulaşılamayan hücrelerin değeri (distance_field için None)
+
+        Dönüş: dist
+        """
+        passable, neighbors = self.passable, self.neighbors
+        sources = {source for source in sources if 0 <= source < self.size and passable[source]}
+        touched = 0
+
+        # 1) Kapanan hücreler ve desteğini kaybeden hücreler geçersiz kılınır
+        heap = []
+        invalid = []
+        for cell in cells:
+            level = dist[cell]
+            if passable[cell] or level == unreachable:
+                continue
+            dist[cell] = unreachable
+            for nxt in self.grid_neighbors(cell):
+                if passable[nxt] and dist[nxt] == level + 1:
+                    heapq.heappush(heap, (level + 1, nxt))
+        while heap:
+            level, cell = heapq.heappop(heap)
+            if dist[cell] != level or cell in sources:
+                continue
+            touched += 1
+            if any(dist[nxt] == level - 1 for nxt in neighbors(cell)):
+                continue  # Aynı uzunlukta başka bir yol var
+            dist[cell] = unreachable
+            invalid.append(cell)
+            for nxt in neighbors(cell):
+                if dist[nxt] == level + 1:
+                    heapq.heappush(heap, (level + 1, nxt))
+
+        # 2) Geçersiz ve açılan hücreler komşularından tohumlanıp mesafeler yayılır
+        seeds = invalid + [cell for cell in cells if passable[cell]]
+        for cell in seeds:
+            if cell in sources:
+                best = 0
+            else:
+                best = unreachable
+                for nxt in neighbors(cell):
+                    if dist[nxt] != unreachable and (best == unreachable or dist[nxt] + 1 < best):
+                        best = dist[nxt] + 1
+            if best != unreachable and (dist[cell] == unreachable or best < dist[cell]):
+                dist[cell] = best
+                heapq.heappush(heap, (best, cell))
+        while heap:
+            level, cell = heapq.heappop(heap)
+            if dist[cell] != level:
+                continue
+            touched += 1
+            for nxt in neighbors(cell):
+                if dist[nxt] == unreachable or level + 1 < dist[nxt]:
+                    dist[nxt] = level + 1
+                    heapq.heappush(heap, (level + 1, nxt))
+
+        if stats is not None:
+            stats.nodes_expanded += touched
+        return dist
+
+    def dfs(self, start, goal, max_depth, stats=None):
+        """
+        Derinlik sınırlı DFS; düğümler yığına eklenirken ziyaret edilmiş sayılır
+
+        Komşular ters sırada yığına eklenir. Yol bulunamazsa None döndürür.
+        stats (CallStats) verilirse iş sayaçları ona eklenir.
+        """
+        start_i = self.index(start)
+        goal_i = self.index(goal)
+        if start_i < 0:
+            return None
+        if start_i == goal_i:
+            return [start]
+
+        ws = self.acquire(stats)
+        expanded = 0
+        frontier_peak = 0
+        try:
+            gen = ws.generation
+            parent, depth, stamp = ws.parent, ws.cost, ws.stamp
+            neighbor_cache, neighbors = self.neighbor_cache, self.neighbors
+
+            parent[start_i] = -1
+            depth[start_i] = 0
+            stamp[start_i] = gen
+            stack = ws.queue
+            stack[0] = start_i
+            top = 1
+
+            while top:
+                if top > frontier_peak:
+                    frontier_peak = top
+                expanded += 1
+                top -= 1
+                current = stack[top]
+                if current == goal_i:
+                    return self.build_path(ws, goal_i)
+                if depth[current] >= max_depth:
+                    continue
+
+                next_depth = depth[current] + 1
+                following = neighbor_cache[current]
+                if following is None:
+                    following = neighbors(current)
+                for nxt in reversed(following):
+                    if stamp[nxt] != gen:
+                        stamp[nxt] = gen
+                        parent[nxt] = current
+                        depth[nxt] = next_depth
+                        stack[top] = nxt
+                        top += 1
+
+            return None
+        finally:
+            self.release(ws)
+            if stats is not None:
+                stats.nodes_expanded += expanded
+                stats.frontier_peak = max(stats.frontier_peak, frontier_peak)
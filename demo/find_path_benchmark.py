@@ -0,0 +1,234 @@
+import argparse
+import contextlib
+import gc
+import io
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from collections import namedtuple
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from algorithms.registry import algorithm_names, create_algorithm
+
+# Labirent boyutları (genişlik, yükseklik); ilki oyundaki 800x600 / 40 ızgarası
+MAZE_SIZES = [(20, 15), (40, 30), (80, 60)]
+NUM_QUERIES = 200
+NUM_REPEATS = 3   # Her sorgu için en iyi (en kısa) süre alınır; gürültüyü azaltır
+NUM_GHOSTS = 2
+SEED = 1234
+REGRESSION_THRESHOLD = 0.30  # Ortanca süre tabana göre %30'dan fazla artarsa gerileme
+
+DEFAULT_OUTPUT = os.path.join(project_root, 'results', 'find_path_benchmark.json')
+DEFAULT_BASELINE = os.path.join(project_root, 'demo', 'find_path_baseline.json')
+
+# Algoritmalara verilen karakter görünümleri (yalnızca .x ve .y okunur)
+Point = namedtuple('Point', ['x', 'y'])
+
+def make_maze(width, height, seed, wall_ratio=0.25):
+    """
+    Tohumlu rastgele labirent oluşturur
+
+    Dış duvarlar kapalıdır; iç hücreler wall_ratio olasılıkla duvardır. En büyük
+    bağlı bölge dışındaki boş hücreler duvara çevrilir, böylece her sorgunun
+    bir yolu vardır.
+    """
+    rng = random.Random(seed)
+    maze = [[1 if x in (0, width - 1) or y in (0, height - 1) or rng.random() < wall_ratio else 0
+             for x in range(width)] for y in range(height)]
+
+    # En büyük bağlı bölgeyi bul
+    seen = set()
+    largest = set()
+    for y in range(height):
+        for x in range(width):
+            if maze[y][x] or (x, y) in seen:
+                continue
+            region = {(x, y)}
+            stack = [(x, y)]
+            while stack:
+                cx, cy = stack.pop()
+                for nx, ny in ((cx, cy + 1), (cx + 1, cy), (cx, cy - 1), (cx - 1, cy)):
+                    if maze[ny][nx] == 0 and (nx, ny) not in region:
+                        region.add((nx, ny))
+                        stack.append((nx, ny))
+            seen |= region
+            if len(region) > len(largest):
+                largest = region
+
+    for y in range(height):
+        for x in range(width):
+            if maze[y][x] == 0 and (x, y) not in largest:
+                maze[y][x] = 1
+    return maze
+
+def make_queries(maze, num_queries, seed, num_ghosts=NUM_GHOSTS):
+    """Tohumlu (başlangıç, hedef, hayaletler) sorguları üretir; hepsi farklı boş hücrelerde"""
+    rng = random.Random(seed)
+    free = [(x, y) for y, row in enumerate(maze) for x, cell in enumerate(row) if cell == 0]
+    queries = []
+    for _ in range(num_queries):
+        cells = rng.sample(free, 2 + num_ghosts)
+        queries.append((cells[0], cells[1], cells[2:]))
+    return queries
+
+def percentile(sorted_values, q):
+    """Sıralı değerlerde en yakın sıra yöntemiyle yüzdelik"""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def benchmark_algorithm(name, maze, queries, seed=SEED, repeats=NUM_REPEATS):
+    """
+    Bir algoritmanın find_path çağrılarını sorgu kümesi üzerinde ölçer
+
+    Sorgu kümesi repeats kez çalıştırılır ve her sorgunun en kısa süresi
+    kullanılır; ölçüm sırasında çöp toplayıcı kapatılır.
+
+    Dönüş: median_us, p95_us, p99_us, mean_us, throughput (çağrı/s) ve
+    nodes_per_call anahtarlı sözlük
+    """
+    algorithm = create_algorithm(name, maze)
+    random.seed(seed)  # Stokastik algoritmalar (GA) için tekrarlanabilirlik
+
+    def call(start, goal, ghosts):
+        return algorithm.find_path(
+            start, goal,
+            pacman=Point(*start),
+            ghosts=[Point(*ghost) for ghost in ghosts],
+            coins=[Point(*goal)]
+        )
+
+    times = [float('inf')] * len(queries)
+    gc_was_enabled = gc.isenabled()
+    # Algoritmaların ayıklama çıktıları ölçümü ekrana boğmasın
+    with contextlib.redirect_stdout(io.StringIO()):
+        call(*queries[0])  # Isınma: model yükleme, çekirdek oluşturma
+        if algorithm.metrics is not None:
+            algorithm.metrics.reset()
+        gc.disable()
+        try:
+            for _ in range(repeats):
+                for i, (start, goal, ghosts) in enumerate(queries):
+                    started = time.perf_counter_ns()
+                    call(start, goal, ghosts)
+                    times[i] = min(times[i], time.perf_counter_ns() - started)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    times.sort()
+    total_s = sum(times) / 1e9
+    metrics = algorithm.metrics.summary() if algorithm.metrics is not None else {}
+    return {
+        'median_us': statistics.median(times) / 1e3,
+        'p95_us': percentile(times, 95) / 1e3,
+        'p99_us': percentile(times, 99) / 1e3,
+        'mean_us': statistics.fmean(times) / 1e3,
+        'throughput': len(times) / total_s if total_s > 0 else float('inf'),
+        'nodes_per_call': metrics.get('nodes_per_call'),
+    }
+
+def run_benchmarks(algorithms=None, sizes=None, num_queries=NUM_QUERIES, seed=SEED,
+                   repeats=NUM_REPEATS):
+    """
+    Tüm algoritmaları tüm labirent boyutlarında ölçer
+
+    Dönüş: {'meta': {...}, 'results': {algoritma: {'GxY': ölçümler}}}
+    """
+    algorithms = algorithms or algorithm_names()
+    sizes = sizes or MAZE_SIZES
+    results = {name: {} for name in algorithms}
+
+    for width, height in sizes:
+        maze = make_maze(width, height, seed)
+        queries = make_queries(maze, num_queries, seed + 1)
+        size_key = f"{width}x{height}"
+        for name in algorithms:
+            results[name][size_key] = benchmark_algorithm(name, maze, queries, seed, repeats)
+            r = results[name][size_key]
+            print(f"{name:<6} {size_key:>7} | ortanca {r['median_us']:>10.1f} µs | "
+                  f"p95 {r['p95_us']:>10.1f} µs | p99 {r['p99_us']:>10.1f} µs | "
+                  f"{r['throughput']:>10.0f} çağrı/s")
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'queries': num_queries,
+            'repeats': repeats,
+            'seed': seed,
+            'sizes': [f"{width}x{height}" for width, height in sizes],
+        },
+        'results': results,
+    }
+
+def compare_to_baseline(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Ortanca süreleri tabanla karşılaştırır
+
+    Dönüş: Gerilemelerin listesi [(algoritma, boyut, taban µs, şimdiki µs), ...]
+    """
+    regressions = []
+    print(f"\n{'Algoritma':<10} | {'Boyut':>7} | {'Taban µs':>10} | {'Şimdi µs':>10} | {'Oran':>6}")
+    print("-" * 60)
+    for name, sizes in report['results'].items():
+        for size_key, current in sizes.items():
+            base = baseline.get('results', {}).get(name, {}).get(size_key)
+            if base is None:
+                continue
+            ratio = current['median_us'] / base['median_us'] if base['median_us'] else 1.0
+            marker = " GERİLEME" if ratio > 1 + threshold else ""
+            print(f"{name:<10} | {size_key:>7} | {base['median_us']:>10.1f} | "
+                  f"{current['median_us']:>10.1f} | {ratio:>6.2f}{marker}")
+            if marker:
+                regressions.append((name, size_key, base['median_us'], current['median_us']))
+    return regressions
+
+def save_report(report, path):
+    """Raporu JSON olarak kaydeder"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="find_path mikro kıyaslama takımı")
+    parser.add_argument('--algorithms', nargs='*', help="Ölçülecek algoritmalar (varsayılan: hepsi)")
+    parser.add_argument('--queries', type=int, default=NUM_QUERIES, help="Boyut başına sorgu sayısı")
+    parser.add_argument('--repeats', type=int, default=NUM_REPEATS, help="Sorgu kümesinin tekrar sayısı")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Sonuç JSON dosyası")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Karşılaştırılacak taban JSON dosyası")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help="İzin verilen ortanca süre artışı (0.30 = %%30)")
+    parser.add_argument('--update-baseline', action='store_true', help="Sonuçları yeni taban olarak kaydet")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.algorithms, num_queries=args.queries, repeats=args.repeats)
+    save_report(report, args.output)
+    print(f"\nSonuçlar kaydedildi: {args.output}")
+
+    if args.update_baseline:
+        save_report(report, args.baseline)
+        print(f"Taban güncellendi: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("Taban dosyası yok; oluşturmak için --update-baseline kullanın.")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(report, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} gerileme bulundu (eşik %{args.threshold * 100:.0f}).")
+        return 1
+    print("\nGerileme yok.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
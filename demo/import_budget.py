@@ -0,0 +1,63 @@
+import os
+import statistics
+import subprocess
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modül -> (süre bütçesi ms, içe aktarımdan sonra yüklenmemesi gereken modüller)
+# Not: pygame NumPy'yi kendisi yüklediği için oyun modüllerinde NumPy yasaklanmaz;
+# sürenin büyük kısmı pygame'in kendi içe aktarımıdır.
+IMPORT_BUDGETS = {
+    "algorithms": (30, ["numpy", "sklearn"]),
+    "game": (300, ["sklearn", "matplotlib"]),
+    "main": (300, ["sklearn", "matplotlib"]),
+    "demo.demo": (350, ["sklearn", "matplotlib"]),
+}
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+heavy = [name for name in {forbidden!r} if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+def measure_import(module, forbidden, runs=5):
+    """
+    Modülü her seferinde temiz bir yorumlayıcıda içe aktarır
+
+    Dönüş: (ortanca süre ms, yanlışlıkla yüklenen ağır modüller)
+    """
+    times = []
+    heavy = []
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, forbidden=forbidden)],
+            cwd=project_root, env=env, capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        elapsed, loaded = output.split(" ", 1) if " " in output else (output, "")
+        times.append(float(elapsed))
+        heavy = [name for name in loaded.split(",") if name]
+    return statistics.median(times), heavy
+
+def check_import_budgets(budgets=None, runs=5):
+    """Tüm modüllerin içe aktarma süresini bütçeyle karşılaştırır; hepsi geçerse True"""
+    budgets = budgets or IMPORT_BUDGETS
+    ok = True
+    print(f"{'Modül':<12} | {'Süre (ms)':>10} | {'Bütçe (ms)':>10} | Durum")
+    print("-" * 60)
+    for module, (budget_ms, forbidden) in budgets.items():
+        elapsed, heavy = measure_import(module, forbidden, runs)
+        passed = elapsed <= budget_ms and not heavy
+        ok = ok and passed
+        status = "OK" if passed else "AŞILDI"
+        if heavy:
+            status += f" (yüklenen: {', '.join(heavy)})"
+        print(f"{module:<12} | {elapsed:>10.1f} | {budget_ms:>10} | {status}")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if check_import_budgets() else 1)
@@ -0,0 +1,33 @@
+import os
+import sys
+import time
+import pygame
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from game import Game
+
+def train_decision_tree(num_samples=1000000, num_workers=None, seed=None):
+    """
+    Karar ağacını büyük bir veri kümesiyle yeniden eğitir
+    
+    Parameters:
+    - num_samples: Üretilecek örnek sayısı
+    - num_workers: İşçi süreç sayısı (belirtilmezse CPU sayısı)
+    - seed: Tekrarlanabilir veri kümesi için tohum
+    """
+    pygame.init()
+    pygame.font.init()
+    
+    # Oyundaki labirenti kullan
+    game = Game()
+    dt = game.algorithms["DT"]
+    
+    start_time = time.time()
+    dt.retrain(num_samples=num_samples, num_workers=num_workers, seed=seed)
+    dt.export_tree_visualization()
+    print(f"Eğitim {time.time() - start_time:.1f} saniyede tamamlandı.")
+
+if __name__ == "__main__":
+    train_decision_tree()
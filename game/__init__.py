@@ -1 +1 @@
-from .game import Game, GameState
+from .game import ENGINE_VERSION, Game, GameState
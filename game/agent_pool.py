@@ -0,0 +1,138 @@
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from .planner import AgentView, StepPlan
+
+# İşçi sürecinde kalıcı algoritma örnekleri (labirent başlangıçta bir kez gönderilir)
+_worker_algorithms = None
+
+def _init_worker(maze):
+    """İşçi süreci başlatıcısı: labirent ve algoritma örneklerini bir kez oluşturur"""
+    global _worker_algorithms
+    from algorithms.registry import LazyAlgorithms
+    _worker_algorithms = LazyAlgorithms(maze)
+
+def _sync_walls(version, cells):
+    """İşçi: labirent kopyasını ana süreçteki sürüme getirir (cells: değişmiş hücrelerin güncel durumu)"""
+    maze = _worker_algorithms.maze
+    if maze.version != version:
+        maze.sync(version, cells)
+
+def _find_path(job):
+    """İşçi: tek bir ajanın yolunu bulur"""
+    algorithm_name, start, goal, kwargs, seed, walls = job
+    if walls is not None:
+        _sync_walls(*walls)
+    if algorithm_name not in _worker_algorithms:
+        return []
+    # Her istek ana süreçten gelen tohumla başlar; sonuçlar tekrarlanabilir olur
+    random.seed(seed)
+    return _worker_algorithms[algorithm_name].find_path(start, goal, **kwargs)
+
+class AgentPool:
+    """
+    Bir tick'teki ajanların find_path çağrılarını süreç havuzunda paralel çalıştırır
+
+    İşçiler labirentin ve algoritma örneklerinin kendi kopyalarını havuz
+    yaşadığı sürece tutar; her istekte yalnızca konumlar gönderilir. Tüm ajanlar
+    aynı anlık görüntüden planlar ve hamleler sonra birlikte uygulanır, bu
+    yüzden tick süresi ajanların toplamı yerine en yavaş ajan kadardır.
+
+    Labirent değişebiliyorsa (DynamicMaze) havuz ona abone olur ve değişen her
+    hücrenin yalnızca güncel durumunu tutar. Her istek labirent sürümünü ve bu
+    durumları taşır; sürümü geride kalan işçi hepsini kendi kopyasına uygular
+    (aynı durumdakiler atlanır). Böylece istek boyutu oyun süresiyle değil,
+    değişen farklı hücre sayısıyla büyür ve havuz labirent günlüğünü okumaz.
+    """
+
+    def __init__(self, maze, num_workers=None):
+        """
+        Parametreler:
+        - maze: Oyun labirenti
+        - num_workers: İşçi süreci sayısı (None ise CPU sayısı)
+        """
+        self.maze = maze
+        self.num_workers = num_workers or multiprocessing.cpu_count()
+        self._executor = None
+        self._walls = {}  # Değişmiş hücreler: (x, y) -> duvar mı (güncel durum)
+        subscribe = getattr(maze, 'subscribe', None)
+        if subscribe is not None:
+            subscribe(self._wall_changed)
+
+    def _wall_changed(self, x, y, wall):
+        """Labirent bildirimi: hücrenin güncel durumunu kaydeder"""
+        self._walls[(x, y)] = wall
+
+    def _get_executor(self):
+        # Havuz ilk kullanımda açılır; spawn, pygame ve iş parçacıklarıyla güvenlidir
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self.maze,)
+            )
+        return self._executor
+
+    def plan_step(self, snapshot):
+        """
+        Bir simülasyon adımının kararlarını paralel hesaplar
+
+        Sıralı plan_step'ten farkı: hayaletler Pac-Man'in bilinen bir sonraki
+        konumunu (yolu yoksa şu anki konumunu) hedefler ve diğer hayaletlerin
+        eski konumlarını görür.
+
+        Dönüş: StepPlan
+        """
+        executor = self._get_executor()
+        walls = None
+        if self._walls:
+            walls = (self.maze.version, [(x, y, wall) for (x, y), wall in self._walls.items()])
+        pacman = snapshot.pacman
+        pacman_path = list(snapshot.pacman_path)
+        coins = list(snapshot.coins)
+
+        pacman_future = None
+        if not snapshot.user_control:
+            if not pacman_path and coins:
+                nearest_coin = min(coins, key=lambda coin: abs(pacman.x - coin.x) + abs(pacman.y - coin.y))
+                pacman_future = executor.submit(_find_path, (
+                    snapshot.pacman_algorithm,
+                    (pacman.x, pacman.y),
+                    (nearest_coin.x, nearest_coin.y),
+                    {'pacman': pacman, 'ghosts': snapshot.ghosts, 'coins': coins},
+                    random.getrandbits(32),
+                    walls
+                ))
+            elif len(pacman_path) >= 2:
+                pacman = AgentView(*pacman_path[1])
+
+        ghost_futures = [
+            executor.submit(_find_path, (
+                snapshot.ghost_algorithm,
+                (ghost.x, ghost.y),
+                (pacman.x, pacman.y),
+                {'is_ghost': True, 'current_ghost_index': i, 'pacman': pacman,
+                 'ghosts': snapshot.ghosts, 'coins': coins},
+                random.getrandbits(32),
+                walls
+            ))
+            for i, ghost in enumerate(snapshot.ghosts)
+        ]
+
+        if pacman_future is not None:
+            pacman_path = pacman_future.result()
+
+        ghost_moves = []
+        for ghost, future in zip(snapshot.ghosts, ghost_futures):
+            ghost_path = future.result()
+            ghost_moves.append(ghost_path[1] if ghost_path and len(ghost_path) > 1 else (ghost.x, ghost.y))
+
+        return StepPlan(snapshot.key, pacman_path, ghost_moves)
+
+    def close(self):
+        """İşçi süreçlerini kapatır (sonraki plan_step havuzu yeniden açar)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -1,513 +1,949 @@
-import pygame
-import random
-
-from .character import Character, Coin, Button  
-from algorithms.astar import AStarAlgorithm
-from algorithms.bfs import BFSAlgorithm
-from algorithms.dfs import LimitedDFSAlgorithm
-from algorithms.genetic_algorithm import GeneticAlgorithm
-from algorithms.decision_tree import DecisionTreeAlgorithm
-
-class GameState:
-    """Oyun durumlarını temsil eden enum benzeri sınıf"""
-    MENU = "MENU"
-    PLAYING = "PLAYING"
-    GAME_OVER = "GAME_OVER"
-    GAME_WON = "GAME_WON"
-
-class Game:
-    """Pac-Man oyununu ve tüm oyun mantığını yönetir"""
-    
-    def __init__(self, screen_width=800, screen_height=600, cell_size=40):
-        # Ekran ve ızgara ayarları
-        self.screen_width = screen_width
-        self.screen_height = screen_height
-        self.cell_size = cell_size
-        self.grid_width = screen_width // cell_size
-        self.grid_height = screen_height // cell_size
-        
-        # Renkler
-        self.BLACK = (0, 0, 0)
-        self.YELLOW = (255, 255, 0)
-        self.RED = (255, 0, 0)
-        self.BLUE = (0, 0, 255)
-        self.WHITE = (255, 255, 255)
-        self.GOLD = (255, 215, 0)
-        self.GREEN = (0, 255, 0)
-        self.PURPLE = (128, 0, 128)
-        
-        # Oyun durumu ve algoritma seçimleri
-        self.state = GameState.MENU
-        self.pacman_algorithm = "A*"
-        self.ghost_algorithm = "A*"
-        self.score = 0
-        self.num_ghosts = 2
-        
-        # Kullanıcı kontrolü seçeneği
-        self.user_control = False
-        self.next_direction = None
-        
-        # Labirent oluştur
-        self.maze = self.create_maze()
-        
-        # Algoritma örneklerini oluştur
-        self.algorithms = {
-            "A*": AStarAlgorithm(self.maze),
-            "BFS": BFSAlgorithm(self.maze),
-            "DFS": LimitedDFSAlgorithm(self.maze, max_depth=10), 
-            "GA": GeneticAlgorithm(self.maze, population_size=50, chromosome_length=20, 
-                                 mutation_rate=0.1, elite_size=5, generations=5),
-            "DT": DecisionTreeAlgorithm(self.maze) 
-        }
-        
-        # Oyun öğelerini başlat
-        self.init_game()
-        self.create_menu_buttons()
-    
-    def create_maze(self):
-        """Labirent oluşturur"""
-        maze = [[0 for x in range(self.grid_width)] for y in range(self.grid_height)]
-        
-        # Dış duvarlar
-        for x in range(self.grid_width):
-            maze[0][x] = 1
-            maze[self.grid_height-1][x] = 1
-        for y in range(self.grid_height):
-            maze[y][0] = 1
-            maze[y][self.grid_width-1] = 1
-        
-        # İç duvarlar
-        for x in range(3, 8):
-            maze[4][x] = 1
-            maze[self.grid_height-5][x] = 1
-        
-        for x in range(self.grid_width-8, self.grid_width-3):
-            maze[4][x] = 1
-            maze[self.grid_height-5][x] = 1
-        
-        for y in range(3, 8):
-            maze[y][4] = 1
-            maze[y][self.grid_width-5] = 1
-            
-        return maze
-    
-    def init_game(self):
-        """Oyun öğelerini başlatır"""
-        # Pac-Man oluştur
-        self.pacman = Character(1, 1, self.YELLOW, self.cell_size)
-        
-        # Hayaletleri oluştur
-        self.ghosts = []
-        ghost_positions = [
-            (self.grid_width-2, self.grid_height-2),  # Sağ alt
-            (self.grid_width-2, 1),                   # Sağ üst
-            (1, self.grid_height-2)                   # Sol alt
-        ]
-        for x, y in ghost_positions[:self.num_ghosts]:
-            self.ghosts.append(Character(x, y, self.RED, self.cell_size))
-        
-        # Coinleri oluştur
-        self.coins = self.generate_valid_coins(15)
-        self.score = 0
-        self.next_direction = None
-    
-    def create_menu_buttons(self):
-        """Menü butonlarını oluşturur"""
-        button_width = 140
-        button_height = 50
-        button_spacing = 15
-        
-        # Pac-Man butonları için düzenleme
-        pacman_buttons_count = 6  # A*, BFS, DFS, GA, DT ve USER için
-        pacman_total_width = pacman_buttons_count * button_width + (pacman_buttons_count - 1) * button_spacing
-        pacman_start_x = (self.screen_width - pacman_total_width) // 2
-        
-        # Hayalet butonları için düzenleme
-        ghost_buttons_count = 4  # A*, BFS, DFS ve GA için
-        ghost_total_width = ghost_buttons_count * button_width + (ghost_buttons_count - 1) * button_spacing
-        ghost_start_x = (self.screen_width - ghost_total_width) // 2
-        
-        # Butonları oluştur
-        self.buttons = {
-            # Pac-Man butonları (üst sıra)
-            'pacman_astar': Button(pacman_start_x, 100, button_width, button_height, "Pacman: A*", (100, 200, 100)),
-            'pacman_bfs': Button(pacman_start_x + button_width + button_spacing, 100, button_width, button_height, "Pacman: BFS", (100, 200, 100)),
-            'pacman_dfs': Button(pacman_start_x + 2 * (button_width + button_spacing), 100, button_width, button_height, "Pacman: DFS", (100, 200, 100)),
-            'pacman_genetic': Button(pacman_start_x + 3 * (button_width + button_spacing), 100, button_width, button_height, "Pacman: GA", (100, 200, 100)),
-            'pacman_dt': Button(pacman_start_x + 4 * (button_width + button_spacing), 100, 
-                    button_width, button_height, "Pacman: DT", (100, 200, 100)),
-            'pacman_user': Button(pacman_start_x + 5 * (button_width + button_spacing), 100, 
-                    button_width, button_height, "Kullanıcı", self.PURPLE),
-            
-            # Hayalet butonları (alt sıra)
-            'ghost_astar': Button(ghost_start_x, 180, button_width, button_height, "Ghost: A*", (200, 100, 100)),
-            'ghost_bfs': Button(ghost_start_x + button_width + button_spacing, 180, button_width, button_height, "Ghost: BFS", (200, 100, 100)),
-            'ghost_dfs': Button(ghost_start_x + 2 * (button_width + button_spacing), 180, button_width, button_height, "Ghost: DFS", (200, 100, 100)),
-            'ghost_genetic': Button(ghost_start_x + 3 * (button_width + button_spacing), 180, button_width, button_height, "Ghost: GA", (200, 100, 100)),
-
-            # Başlat butonu (en alt)
-            'start': Button(self.screen_width//2 - button_width//2, 260, button_width, button_height, "Start", self.GREEN)
-        }
-    
-    def find_path(self, start, goal, algorithm_name, **kwargs):
-        """Seçilen algoritmayı kullanarak yol bulur"""
-        if algorithm_name in self.algorithms:
-            # Ekstra parametreleri ekle
-            kwargs.update({
-                'pacman': self.pacman,
-                'ghosts': self.ghosts,
-                'coins': self.coins
-            })
-            # İlgili algoritmanın find_path metodunu çağır
-            path = self.algorithms[algorithm_name].find_path(start, goal, **kwargs)
-            
-            # Debug bilgisi ekle
-            if algorithm_name == "DT" and path:
-                path_info = f"DT path: {path}"
-                print(path_info)
-                
-            return path
-        return []
-    
-    def generate_valid_coins(self, num_coins):
-        """Geçerli konumlarda coin'ler oluşturur"""
-        coins = []
-        while len(coins) < num_coins:
-            x = random.randint(1, self.grid_width-2)
-            y = random.randint(1, self.grid_height-2)
-            if (self.maze[y][x] == 0 and 
-                not any(coin.x == x and coin.y == y for coin in coins) and
-                not (x == 1 and y == 1)):
-                coins.append(Coin(x, y, self.cell_size))
-        return coins
-    
-    def find_nearest_coin(self):
-        """Pac-Man'e en yakın coin'i bulur"""
-        if not self.coins:
-            return None
-        
-        nearest_coin = None
-        min_distance = float('inf')
-        
-        for coin in self.coins:
-            # Manhattan mesafesi
-            distance = abs(self.pacman.x - coin.x) + abs(self.pacman.y - coin.y)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_coin = coin
-                
-        return nearest_coin
-    
-    def handle_menu_input(self, mouse_pos):
-        """Menüdeki tıklamaları işler"""
-        for key, button in self.buttons.items():
-            if button.is_clicked(mouse_pos):
-                if key == 'pacman_astar':
-                    self.pacman_algorithm = "A*"
-                    self.user_control = False
-                elif key == 'pacman_bfs':
-                    self.pacman_algorithm = "BFS"
-                    self.user_control = False
-                elif key == 'pacman_dfs':
-                    self.pacman_algorithm = "DFS"
-                    self.user_control = False
-                elif key == 'pacman_genetic':
-                    self.pacman_algorithm = "GA"
-                    self.user_control = False
-                elif key == 'pacman_dt':
-                    self.pacman_algorithm = "DT"
-                    self.user_control = False
-                elif key == 'pacman_user':
-                    self.pacman_algorithm = "USER"
-                    self.user_control = True
-                elif key == 'ghost_astar':
-                    self.ghost_algorithm = "A*"
-                elif key == 'ghost_bfs':
-                    self.ghost_algorithm = "BFS"
-                elif key == 'ghost_dfs':
-                    self.ghost_algorithm = "DFS"
-                elif key == 'ghost_genetic':
-                    self.ghost_algorithm = "GA"
-                elif key == 'start':
-                    self.state = GameState.PLAYING
-                    self.init_game()
-    
-    def handle_user_input(self, keys):
-        """Kullanıcı klavye girdilerini işler"""
-        if not self.user_control:
-            return
-        
-        # Kullanıcının yön tuşlarına basmasını kontrol et
-        if keys[pygame.K_UP]:
-            self.next_direction = (0, -1)  # Yukarı
-        elif keys[pygame.K_RIGHT]:
-            self.next_direction = (1, 0)   # Sağ
-        elif keys[pygame.K_DOWN]:
-            self.next_direction = (0, 1)   # Aşağı
-        elif keys[pygame.K_LEFT]:
-            self.next_direction = (-1, 0)  # Sol
-    
-    def update_pacman(self):
-        """Pac-Man'in hareketlerini günceller"""
-        # Debug bilgisi ekle
-        print(f"Mevcut pozisyon: ({self.pacman.x}, {self.pacman.y}), Mevcut yol: {self.pacman.path}")
-        
-        # Kullanıcı kontrolü aktifse
-        if self.user_control:
-            if self.next_direction:
-                dx, dy = self.next_direction
-                new_x, new_y = self.pacman.x + dx, self.pacman.y + dy
-                
-                # Geçerli bir hareket mi kontrol et (duvar değilse)
-                if (0 <= new_x < self.grid_width and 
-                    0 <= new_y < self.grid_height and 
-                    self.maze[new_y][new_x] == 0):
-                    self.pacman.move((new_x, new_y))
-                    
-                    # Coin toplama kontrolü
-                    for coin in self.coins[:]:
-                        if self.pacman.x == coin.x and self.pacman.y == coin.y:
-                            self.coins.remove(coin)
-                            self.score += 1
-                            print(f"Coin toplandı! Yeni skor: {self.score}")
-                            break
-                
-                self.next_direction = None  # Bir sonraki hareketi bekle
-            return
-        
-        # Yapay zeka kontrollü Pac-Man için
-        if not self.pacman.path:
-            nearest_coin = self.find_nearest_coin()
-            if nearest_coin:
-                # Yolu bul ve debug bilgisi ekle
-                start_pos = (self.pacman.x, self.pacman.y)
-                goal_pos = (nearest_coin.x, nearest_coin.y)
-                self.pacman.path = self.find_path(
-                    start_pos,
-                    goal_pos,
-                    self.pacman_algorithm
-                )
-                print(f"Yeni yol hesaplandı: {self.pacman_algorithm} algoritması kullanılarak {start_pos} -> {goal_pos}: {self.pacman.path}")
-            elif not self.coins:
-                self.state = GameState.GAME_WON
-                return
-        
-        # Yolun uzunluğunu ve içeriğini kontrol et
-        if self.pacman.path:
-            print(f"İşlenecek yol: {self.pacman.path}, Uzunluk: {len(self.pacman.path)}")
-            
-            # Eğer yol en az iki konum içeriyorsa (mevcut ve sonraki)
-            if len(self.pacman.path) >= 2:
-                next_pos = self.pacman.path[1]
-                print(f"Bir sonraki pozisyon: {next_pos}")
-                self.pacman.move(next_pos)
-                self.pacman.path = self.pacman.path[1:]
-                print(f"Hareket sonrası: ({self.pacman.x}, {self.pacman.y}), Kalan yol: {self.pacman.path}")
-            else:
-                # Eğer yol sadece bir konum içeriyorsa (sadece mevcut konum)
-                print("Yol çok kısa, yeni yol hesaplanacak")
-                self.pacman.path = []  # Yeni yol hesaplamak için yolu temizle
-                
-            # Coin toplama kontrolü
-            for coin in self.coins[:]:
-                if self.pacman.x == coin.x and self.pacman.y == coin.y:
-                    self.coins.remove(coin)
-                    self.score += 1
-                    self.pacman.path = []  # Yeni yol hesapla
-                    print(f"Coin toplandı! Yeni skor: {self.score}")
-                    break
-                
-    def update_ghosts(self):
-        """Hayaletlerin hareketlerini günceller"""
-        # Her hayaleti tek tek güncelle
-        for i, ghost in enumerate(self.ghosts):
-            # Ekstra parametreler
-            extra_params = {
-                'is_ghost': True,
-                'current_ghost_index': i
-            }
-            
-            # Daha tutarlı hareket için hayaletleri aynı anda güncelle
-            ghost_path = self.find_path(
-                (ghost.x, ghost.y),
-                (self.pacman.x, self.pacman.y),
-                self.ghost_algorithm,
-                **extra_params
-            )
-            
-            if ghost_path and len(ghost_path) > 1:
-                next_pos = ghost_path[1]
-                ghost.move(next_pos)
-            
-            # Ghost Pac-Man'i yakaladı mı kontrolü
-            if ghost.x == self.pacman.x and ghost.y == self.pacman.y:
-                self.state = GameState.GAME_OVER
-                break
-    
-    def draw_maze(self, screen):
-        """Labirenti ekrana çizer"""
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                if self.maze[y][x] == 1:
-                    pygame.draw.rect(screen, self.BLUE, 
-                                  (x * self.cell_size, y * self.cell_size, 
-                                   self.cell_size, self.cell_size))
-    
-    def draw_menu(self, screen):
-        """Menü ekranını çizer"""
-        # Başlık
-        title_font = pygame.font.Font(None, 48)
-        title_text = "Pacman with Multiple Search Algorithms"
-        title_surface = title_font.render(title_text, True, self.WHITE)
-        title_rect = title_surface.get_rect(center=(self.screen_width//2, 40))
-        screen.blit(title_surface, title_rect)
-
-        # Alt başlık: Algoritma seçimleri
-        subtitle_font = pygame.font.Font(None, 36)
-        pacman_subtitle = "Pacman Algoritması / Kullanıcı Kontrolü"
-        ghost_subtitle = "Hayalet Algoritması"
-        
-        pacman_surface = subtitle_font.render(pacman_subtitle, True, (150, 255, 150))
-        ghost_surface = subtitle_font.render(ghost_subtitle, True, (255, 150, 150))
-        
-        screen.blit(pacman_surface, (self.screen_width//2 - pacman_surface.get_width()//2, 70))
-        screen.blit(ghost_surface, (self.screen_width//2 - ghost_surface.get_width()//2, 155))
-
-        # Seçili algoritmaları göster
-        pacman_text = "Kullanıcı" if self.user_control else self.pacman_algorithm
-        selected_text = f"Seçilen: Pacman - {pacman_text}, Hayalet - {self.ghost_algorithm}"
-        selected_font = pygame.font.Font(None, 36)
-        selected_surface = selected_font.render(selected_text, True, self.GOLD)
-        selected_rect = selected_surface.get_rect(center=(self.screen_width//2, 340))
-        screen.blit(selected_surface, selected_rect)
-
-        # Kullanıcı kontrolü açıklaması
-        if self.user_control:
-            help_text = "Not: Oyun başladığında Pac-Man'i yön tuşları ile kontrol edebilirsiniz"
-            help_font = pygame.font.Font(None, 30)
-            help_surface = help_font.render(help_text, True, self.PURPLE)
-            help_rect = help_surface.get_rect(center=(self.screen_width//2, 380))
-            screen.blit(help_surface, help_rect)
-
-        # Butonları çiz
-        for key, button in self.buttons.items():
-            if (key == f'pacman_{self.pacman_algorithm.lower()}' or 
-                (key == 'pacman_user' and self.user_control) or 
-                key == f'ghost_{self.ghost_algorithm.lower()}'):
-                button.is_selected = True
-            else:
-                button.is_selected = False
-            button.draw(screen, self.WHITE, self.BLACK)
-    
-    def draw_game(self, screen):
-        """Oyun ekranını çizer"""
-        # Labirenti çiz
-        self.draw_maze(screen)
-        
-        # Coinleri çiz
-        for coin in self.coins:
-            coin.draw(screen, self.GOLD)
-        
-        # Pac-Man'i ve hayaletleri çiz
-        self.pacman.draw(screen)
-        for ghost in self.ghosts:
-            ghost.draw(screen)
-        
-        # Skor gösterimi
-        score_text = f"Skor: {self.score}"
-        score_surface = pygame.font.Font(None, 36).render(score_text, True, self.WHITE)
-        screen.blit(score_surface, (10, 10))
-        
-        # Algoritma bilgisi
-        pacman_text = "Kullanıcı" if self.user_control else self.pacman_algorithm
-        algo_text = f"Pacman: {pacman_text}, Hayalet: {self.ghost_algorithm}"
-        algo_surface = pygame.font.Font(None, 28).render(algo_text, True, self.WHITE)
-        screen.blit(algo_surface, (10, 40))
-        
-        # Kullanıcı kontrolü açıklaması ve kontroller
-        if self.user_control:
-            # Kontrol ipucu
-            hint_text = "Yön tuşları ile hareket edin"
-            hint_surface = pygame.font.Font(None, 28).render(hint_text, True, self.PURPLE)
-            screen.blit(hint_surface, (10, 70))
-            
-            # Kontrol tuşları sembolü
-            controls_surface = pygame.font.Font(None, 20).render("↑ ← ↓ →", True, self.PURPLE)
-            screen.blit(controls_surface, (10, 95))
-    
-    def draw_game_over(self, screen):
-        """Oyun sonu ekranını çizer (kaybetme)"""
-        text = f"GAME OVER! Score: {self.score}"
-        text_surface = pygame.font.Font(None, 74).render(text, True, self.RED)
-        text_rect = text_surface.get_rect(center=(self.screen_width//2, self.screen_height//2))
-        screen.blit(text_surface, text_rect)
-        
-        # Restart butonu
-        self.buttons['start'].text = "Restart"
-        self.buttons['start'].draw(screen, self.WHITE, self.BLACK)
-    
-    def draw_game_won(self, screen):
-        """Oyun sonu ekranını çizer (kazanma)"""
-        text = f"YOU WIN! Score: {self.score}"
-        text_surface = pygame.font.Font(None, 74).render(text, True, self.WHITE)
-        text_rect = text_surface.get_rect(center=(self.screen_width//2, self.screen_height//2))
-        screen.blit(text_surface, text_rect)
-        
-        # Restart butonu
-        self.buttons['start'].text = "Restart"
-        self.buttons['start'].draw(screen, self.WHITE, self.BLACK)
-    
-    def handle_events(self):
-        """Pygame olaylarını işler"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                
-                if self.state == GameState.MENU:
-                    self.handle_menu_input(mouse_pos)
-                elif self.state in [GameState.GAME_OVER, GameState.GAME_WON]:
-                    if self.buttons['start'].is_clicked(mouse_pos):
-                        self.state = GameState.MENU
-        
-        # Klavye girişlerini işle (oyun sırasında)
-        if self.state == GameState.PLAYING:
-            keys = pygame.key.get_pressed()
-            self.handle_user_input(keys)
-        
-        return True
-    
-    def update(self):
-        """Oyun durumunu günceller"""
-        if self.state == GameState.PLAYING:
-            self.update_pacman()
-            self.update_ghosts()
-    
-    def draw(self, screen):
-        """Oyun ekranını çizer"""
-        screen.fill(self.BLACK)
-        
-        if self.state == GameState.MENU:
-            self.draw_menu(screen)
-        elif self.state == GameState.PLAYING:
-            self.draw_game(screen)
-        elif self.state == GameState.GAME_OVER:
-            self.draw_game_over(screen)
-        elif self.state == GameState.GAME_WON:
-            self.draw_game_won(screen)
-            
-        pygame.display.flip()
-    
-    def run(self, screen, fps=15):
-        """Oyunu çalıştırır"""
-        running = True
-        clock = pygame.time.Clock()
-        
-        while running:
-            running = self.handle_events()
-            self.update()
-            self.draw(screen)
-            clock.tick(fps)  # FPS ayarı
-        
+import pygame
+import random
+import time
+
+from .character import Character, Coin, Button, render_text
+from .scheduler import FrameScheduler
+from .agent_pool import AgentPool
+from .planner import AgentView, BackgroundPlanner, CoinView, GameSnapshot, StepPlan
+from algorithms.game_state import LOST, WON, StateModel
+from algorithms.maze_grid import wall_test
+from algorithms.registry import LazyAlgorithms, get_algorithm_class
+
+# Oyun kuralları ya da hareket sırası değiştiğinde artırılır; önbelleğe alınmış
+# oyun sonuçları bu sürümle anahtarlandığı için eski kayıtlar kullanılmaz
+ENGINE_VERSION = 1
+
+class GameState:
+    """Oyun durumlarını temsil eden enum benzeri sınıf"""
+    MENU = "MENU"
+    PLAYING = "PLAYING"
+    GAME_OVER = "GAME_OVER"
+    GAME_WON = "GAME_WON"
+
+class Game:
+    """Pac-Man oyununu ve tüm oyun mantığını yönetir"""
+    
+    def __init__(self, screen_width=800, screen_height=600, cell_size=40, tick_budget_ms=None,
+                 agent_workers=None, scenario=None):
+        # Ekran ve ızgara ayarları
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.cell_size = cell_size
+        self.grid_width = screen_width // cell_size
+        self.grid_height = screen_height // cell_size
+        
+        # Dosyadan yüklenen labirent ve başlangıç yerleşimi (None ise yerleşik labirent)
+        self.scenario = scenario
+        if scenario is not None:
+            self.grid_height = len(scenario.maze)
+            self.grid_width = len(scenario.maze[0])
+        
+        # Renkler
+        self.BLACK = (0, 0, 0)
+        self.YELLOW = (255, 255, 0)
+        self.RED = (255, 0, 0)
+        self.BLUE = (0, 0, 255)
+        self.WHITE = (255, 255, 255)
+        self.GOLD = (255, 215, 0)
+        self.GREEN = (0, 255, 0)
+        self.PURPLE = (128, 0, 128)
+        
+        # Oyun durumu ve algoritma seçimleri
+        self.state = GameState.MENU
+        self.pacman_algorithm = "A*"
+        self.ghost_algorithm = "A*"
+        self.score = 0
+        self.num_ghosts = 2
+        
+        # Kullanıcı kontrolü seçeneği
+        self.user_control = False
+        self.next_direction = None
+        
+        # Tick başına yapay zeka süre bütçesi (None ise sınırsız)
+        self.scheduler = FrameScheduler(tick_budget_ms) if tick_budget_ms else None
+        
+        # Simülasyon sayaçları: arka plan planlarını doğru adımla eşleştirmek için
+        self._game_id = 0
+        self._sim_tick = 0
+        self._user_moved = None  # Kullanıcının Pac-Man'i en son hangi adımda hareket ettirildi
+        
+        # Labirent oluştur (senaryonun ızgarası listeye çevrilmeden kullanılır;
+        # zamanlanmış duvar değişiklikleri varsa değişebilen labirent olarak)
+        if scenario is not None and scenario.wall_events:
+            self.maze = scenario.dynamic_maze()
+            self.maze.subscribe(self._wall_changed)
+        else:
+            self.maze = scenario.maze if scenario is not None else self.create_maze()
+        self.is_wall = wall_test(self.maze)  # Tik başına hücre kontrolleri için
+        self._pending_walls = []
+        self.pacman = None
+        
+        # Çizim önbellekleri: statik labirent katmanı ve kirli dikdörtgen takibi
+        self._maze_surface = None
+        self._needs_full_redraw = True
+        self._drawn_cells = set()    # Son karede varlıkların çizildiği hücreler
+        self._coin_cells = set()     # Son karedeki coin hücreleri
+        self._coin_cells_key = None
+        self._current_coin_cells = set()
+        self._hud_key = None
+        self._hud_cells = set()      # HUD yazılarının kapladığı hücreler
+        
+        # Algoritma örnekleri (kayıt defterinden, ilk seçildiklerinde oluşturulur)
+        self.algorithms = LazyAlgorithms(self.maze)
+        
+        # Aşama süreleri (PhaseTimer atanırsa tick aşamaları ölçülür)
+        self.phase_timer = None
+        
+        # Ajanları paralel planlayan süreç havuzu (None ise sıralı planlama)
+        self.agent_pool = AgentPool(self.maze, agent_workers) if agent_workers else None
+        
+        # Oyun öğelerini başlat
+        self.init_game()
+        self.create_menu_buttons()
+    
+    def create_maze(self):
+        """Labirent oluşturur"""
+        maze = [[0 for x in range(self.grid_width)] for y in range(self.grid_height)]
+        
+        # Dış duvarlar
+        for x in range(self.grid_width):
+            maze[0][x] = 1
+            maze[self.grid_height-1][x] = 1
+        for y in range(self.grid_height):
+            maze[y][0] = 1
+            maze[y][self.grid_width-1] = 1
+        
+        # İç duvarlar
+        for x in range(3, 8):
+            maze[4][x] = 1
+            maze[self.grid_height-5][x] = 1
+        
+        for x in range(self.grid_width-8, self.grid_width-3):
+            maze[4][x] = 1
+            maze[self.grid_height-5][x] = 1
+        
+        for y in range(3, 8):
+            maze[y][4] = 1
+            maze[y][self.grid_width-5] = 1
+            
+        return maze
+    
+    def init_game(self):
+        """Oyun öğelerini başlatır"""
+        scenario = self.scenario
+        
+        # Önceki oyunun duvar değişikliklerini geri al ve zamanlamayı baştan kur
+        if hasattr(self.maze, 'revert'):
+            self.maze.revert()
+            # Günlüğü okuyan yok (çekirdek ve ajan havuzu abonedir); geçen oyunun kayıtlarını at
+            self.maze.compact()
+            self._pending_walls = sorted(scenario.wall_events)
+        
+        # Pac-Man oluştur
+        pacman_x, pacman_y = self.pacman_start()
+        self.pacman = Character(pacman_x, pacman_y, self.YELLOW, self.cell_size)
+        
+        # Hayaletleri oluştur
+        self.ghosts = []
+        if scenario is not None and scenario.ghost_starts is not None:
+            ghost_positions = scenario.ghost_starts
+        else:
+            ghost_positions = [
+                (self.grid_width-2, self.grid_height-2),  # Sağ alt
+                (self.grid_width-2, 1),                   # Sağ üst
+                (1, self.grid_height-2)                   # Sol alt
+            ]
+        for x, y in ghost_positions[:self.num_ghosts]:
+            self.ghosts.append(Character(x, y, self.RED, self.cell_size))
+        
+        # Coinleri oluştur
+        if scenario is not None and scenario.coins is not None:
+            self.coins = [Coin(x, y, self.cell_size) for x, y in scenario.coins]
+        else:
+            self.coins = self.generate_valid_coins(15)
+        self.score = 0
+        self.next_direction = None
+        self._needs_full_redraw = True
+        self._game_id += 1
+        self._sim_tick = 0
+        
+        # Önceki oyundan kalan yarım planları temizle
+        if self.scheduler is not None:
+            self.scheduler.reset()
+    
+    def pacman_start(self):
+        """Pac-Man'in başlangıç konumu (senaryoda verilmediyse sol üst köşe)"""
+        if self.scenario is not None and self.scenario.pacman_start is not None:
+            return tuple(self.scenario.pacman_start)
+        return (1, 1)
+    
+    def apply_wall_events(self, tick):
+        """
+        Senaryonun zamanı gelmiş (tik <= tick) duvar değişikliklerini uygular
+        
+        Pac-Man ya da bir hayaletin bulunduğu hücre kapanmaz; değişiklik hücre
+        boşalana kadar bekler.
+        """
+        if not self._pending_walls:
+            return
+        occupied = {(self.pacman.x, self.pacman.y)} | {(ghost.x, ghost.y) for ghost in self.ghosts}
+        waiting = []
+        for event in self._pending_walls:
+            at, x, y, wall = event
+            if at > tick or (wall and (x, y) in occupied):
+                waiting.append(event)
+            else:
+                self.maze.set_wall(x, y, wall)
+        self._pending_walls = waiting
+    
+    def _wall_changed(self, x, y, wall):
+        """Labirent bildirimi: çizim önbelleğini ve geçersiz kalan yolu bırakır"""
+        self._maze_surface = None
+        self._needs_full_redraw = True
+        if wall and self.pacman is not None and (x, y) in self.pacman.path:
+            self.pacman.path = []
+    
+    def create_menu_buttons(self):
+        """Menü butonlarını oluşturur"""
+        button_width = 140
+        button_height = 50
+        button_spacing = 15
+        
+        # Pac-Man butonları için düzenleme
+        pacman_buttons_count = 6  # A*, BFS, DFS, GA, DT ve USER için
+        pacman_total_width = pacman_buttons_count * button_width + (pacman_buttons_count - 1) * button_spacing
+        pacman_start_x = (self.screen_width - pacman_total_width) // 2
+        
+        # Hayalet butonları için düzenleme
+        ghost_buttons_count = 4  # A*, BFS, DFS ve GA için
+        ghost_total_width = ghost_buttons_count * button_width + (ghost_buttons_count - 1) * button_spacing
+        ghost_start_x = (self.screen_width - ghost_total_width) // 2
+        
+        # Butonları oluştur
+        self.buttons = {
+            # Pac-Man butonları (üst sıra)
+            'pacman_astar': Button(pacman_start_x, 100, button_width, button_height, "Pacman: A*", (100, 200, 100)),
+            'pacman_bfs': Button(pacman_start_x + button_width + button_spacing, 100, button_width, button_height, "Pacman: BFS", (100, 200, 100)),
+            'pacman_dfs': Button(pacman_start_x + 2 * (button_width + button_spacing), 100, button_width, button_height, "Pacman: DFS", (100, 200, 100)),
+            'pacman_genetic': Button(pacman_start_x + 3 * (button_width + button_spacing), 100, button_width, button_height, "Pacman: GA", (100, 200, 100)),
+            'pacman_dt': Button(pacman_start_x + 4 * (button_width + button_spacing), 100, 
+                    button_width, button_height, "Pacman: DT", (100, 200, 100)),
+            'pacman_user': Button(pacman_start_x + 5 * (button_width + button_spacing), 100, 
+                    button_width, button_height, "Kullanıcı", self.PURPLE),
+            
+            # Hayalet butonları (alt sıra)
+            'ghost_astar': Button(ghost_start_x, 180, button_width, button_height, "Ghost: A*", (200, 100, 100)),
+            'ghost_bfs': Button(ghost_start_x + button_width + button_spacing, 180, button_width, button_height, "Ghost: BFS", (200, 100, 100)),
+            'ghost_dfs': Button(ghost_start_x + 2 * (button_width + button_spacing), 180, button_width, button_height, "Ghost: DFS", (200, 100, 100)),
+            'ghost_genetic': Button(ghost_start_x + 3 * (button_width + button_spacing), 180, button_width, button_height, "Ghost: GA", (200, 100, 100)),
+
+            # Başlat butonu (en alt)
+            'start': Button(self.screen_width//2 - button_width//2, 260, button_width, button_height, "Start", self.GREEN)
+        }
+    
+    def find_path(self, start, goal, algorithm_name, **kwargs):
+        """Seçilen algoritmayı kullanarak yol bulur"""
+        if algorithm_name in self.algorithms:
+            # Ekstra parametreleri ekle (anlık görüntüden verilenler korunur)
+            kwargs.setdefault('pacman', self.pacman)
+            kwargs.setdefault('ghosts', self.ghosts)
+            kwargs.setdefault('coins', self.coins)
+            algorithm = self.algorithms[algorithm_name]
+            
+            if self.scheduler is not None:
+                # Süre bütçeli mod: planı ajanın süre dilimi kadar çalıştır
+                # Yarım plan hedef ve labirent sürümü aynı kaldıkça sürdürülür; her
+                # adımda yeniden planlananların (tek hamle, RaceMap) planı başlangıca
+                # ve hayalet konumlarına da bağlıdır
+                agent = ('ghost', kwargs['current_ghost_index']) if kwargs.get('is_ghost') else 'pacman'
+                key = (algorithm_name, goal, getattr(self.maze, 'version', 0))
+                if algorithm.replan_each_tick:
+                    key += (start, tuple((ghost.x, ghost.y) for ghost in kwargs['ghosts']))
+                path = self.scheduler.run(
+                    agent, key,
+                    lambda: algorithm.plan(start, goal, **kwargs),
+                    lambda: algorithm.fallback_path(start, goal),
+                    start
+                )
+            else:
+                # İlgili algoritmanın find_path metodunu çağır
+                path = algorithm.find_path(start, goal, **kwargs)
+            
+            # Debug bilgisi ekle
+            if algorithm_name == "DT" and path:
+                path_info = f"DT path: {path}"
+                print(path_info)
+                
+            return path
+        return []
+    
+    def generate_valid_coins(self, num_coins):
+        """Geçerli konumlarda coin'ler oluşturur"""
+        coins = []
+        start = self.pacman_start()
+        while len(coins) < num_coins:
+            x = random.randint(1, self.grid_width-2)
+            y = random.randint(1, self.grid_height-2)
+            if (not self.is_wall(x, y) and 
+                not any(coin.x == x and coin.y == y for coin in coins) and
+                (x, y) != start):
+                coins.append(Coin(x, y, self.cell_size))
+        return coins
+    
+    def find_nearest_coin(self, pacman=None, coins=None):
+        """Pac-Man'e en yakın coin'i bulur (varsayılan: oyundaki Pac-Man ve coinler)"""
+        pacman = self.pacman if pacman is None else pacman
+        coins = self.coins if coins is None else coins
+        if not coins:
+            return None
+        
+        nearest_coin = None
+        min_distance = float('inf')
+        
+        for coin in coins:
+            # Manhattan mesafesi
+            distance = abs(pacman.x - coin.x) + abs(pacman.y - coin.y)
+            if distance < min_distance:
+                min_distance = distance
+                nearest_coin = coin
+                
+        return nearest_coin
+    
+    def handle_menu_input(self, mouse_pos):
+        """Menüdeki tıklamaları işler"""
+        for key, button in self.buttons.items():
+            if button.is_clicked(mouse_pos):
+                if key == 'pacman_astar':
+                    self.pacman_algorithm = "A*"
+                    self.user_control = False
+                elif key == 'pacman_bfs':
+                    self.pacman_algorithm = "BFS"
+                    self.user_control = False
+                elif key == 'pacman_dfs':
+                    self.pacman_algorithm = "DFS"
+                    self.user_control = False
+                elif key == 'pacman_genetic':
+                    self.pacman_algorithm = "GA"
+                    self.user_control = False
+                elif key == 'pacman_dt':
+                    self.pacman_algorithm = "DT"
+                    self.user_control = False
+                elif key == 'pacman_user':
+                    self.pacman_algorithm = "USER"
+                    self.user_control = True
+                elif key == 'ghost_astar':
+                    self.ghost_algorithm = "A*"
+                elif key == 'ghost_bfs':
+                    self.ghost_algorithm = "BFS"
+                elif key == 'ghost_dfs':
+                    self.ghost_algorithm = "DFS"
+                elif key == 'ghost_genetic':
+                    self.ghost_algorithm = "GA"
+                elif key == 'start':
+                    self.state = GameState.PLAYING
+                    self.init_game()
+    
+    def handle_user_input(self, keys):
+        """Kullanıcı klavye girdilerini işler"""
+        if not self.user_control:
+            return
+        
+        # Kullanıcının yön tuşlarına basmasını kontrol et
+        if keys[pygame.K_UP]:
+            self.next_direction = (0, -1)  # Yukarı
+        elif keys[pygame.K_RIGHT]:
+            self.next_direction = (1, 0)   # Sağ
+        elif keys[pygame.K_DOWN]:
+            self.next_direction = (0, 1)   # Aşağı
+        elif keys[pygame.K_LEFT]:
+            self.next_direction = (-1, 0)  # Sol
+    
+    def update_pacman(self):
+        """Pac-Man'in hareketlerini günceller"""
+        # Debug bilgisi ekle
+        print(f"Mevcut pozisyon: ({self.pacman.x}, {self.pacman.y}), Mevcut yol: {self.pacman.path}")
+        
+        # Kullanıcı kontrolü aktifse
+        if self.user_control:
+            self.move_user_pacman()
+            return
+        
+        # Yapay zeka kontrollü Pac-Man için
+        if not self.pacman.path:
+            nearest_coin = self.find_nearest_coin()
+            if nearest_coin:
+                # Yolu bul ve debug bilgisi ekle
+                start_pos = (self.pacman.x, self.pacman.y)
+                goal_pos = (nearest_coin.x, nearest_coin.y)
+                started = time.perf_counter_ns()
+                self.pacman.path = self.find_path(
+                    start_pos,
+                    goal_pos,
+                    self.pacman_algorithm
+                )
+                if self.phase_timer is not None:
+                    self.phase_timer.record('pacman_plan', time.perf_counter_ns() - started)
+                print(f"Yeni yol hesaplandı: {self.pacman_algorithm} algoritması kullanılarak {start_pos} -> {goal_pos}: {self.pacman.path}")
+            elif not self.coins:
+                self.state = GameState.GAME_WON
+                return
+        
+        self.advance_pacman()
+    
+    def move_user_pacman(self):
+        """Kullanıcının seçtiği yönde Pac-Man'i bir adım ilerletir"""
+        if self.next_direction:
+            dx, dy = self.next_direction
+            new_x, new_y = self.pacman.x + dx, self.pacman.y + dy
+            
+            # Geçerli bir hareket mi kontrol et (duvar değilse)
+            if (0 <= new_x < self.grid_width and 
+                0 <= new_y < self.grid_height and 
+                not self.is_wall(new_x, new_y)):
+                self.pacman.move((new_x, new_y))
+                
+                # Coin toplama kontrolü
+                for coin in self.coins[:]:
+                    if self.pacman.x == coin.x and self.pacman.y == coin.y:
+                        self.coins.remove(coin)
+                        self.score += 1
+                        print(f"Coin toplandı! Yeni skor: {self.score}")
+                        break
+            
+            self.next_direction = None  # Bir sonraki hareketi bekle
+    
+    def move_user_step(self):
+        """
+        Kullanıcı kontrolünde Pac-Man'i geçerli simülasyon adımı için bir kez hareket ettirir
+        
+        Hayaletler Pac-Man'in bu adımdaki yeni konumunu kovaladığından (update ile
+        aynı sıra), anlık görüntü bu hareketten sonra alınmalıdır.
+        """
+        key = (self._game_id, self._sim_tick)
+        if self.user_control and self._user_moved != key:
+            self._user_moved = key
+            self.move_user_pacman()
+    
+    def advance_pacman(self):
+        """Pac-Man'i yolundaki bir sonraki konuma taşır ve coin toplar"""
+        # Yolun uzunluğunu ve içeriğini kontrol et
+        if self.pacman.path:
+            print(f"İşlenecek yol: {self.pacman.path}, Uzunluk: {len(self.pacman.path)}")
+            
+            # Eğer yol en az iki konum içeriyorsa (mevcut ve sonraki)
+            if len(self.pacman.path) >= 2:
+                next_pos = self.pacman.path[1]
+                print(f"Bir sonraki pozisyon: {next_pos}")
+                self.pacman.move(next_pos)
+                self.pacman.path = self.pacman.path[1:]
+                print(f"Hareket sonrası: ({self.pacman.x}, {self.pacman.y}), Kalan yol: {self.pacman.path}")
+            else:
+                # Eğer yol sadece bir konum içeriyorsa (sadece mevcut konum)
+                print("Yol çok kısa, yeni yol hesaplanacak")
+                self.pacman.path = []  # Yeni yol hesaplamak için yolu temizle
+                
+            # Coin toplama kontrolü
+            for coin in self.coins[:]:
+                if self.pacman.x == coin.x and self.pacman.y == coin.y:
+                    self.coins.remove(coin)
+                    self.score += 1
+                    self.pacman.path = []  # Yeni yol hesapla
+                    print(f"Coin toplandı! Yeni skor: {self.score}")
+                    break
+            
+            # Tepkisel planlayıcılar (ör. çekişmeli arama) yalnızca bir hamle döndürür
+            if self.pacman_algorithm in self.algorithms and \
+                    get_algorithm_class(self.pacman_algorithm).replan_each_tick:
+                self.pacman.path = []
+                
+    def update_ghosts(self):
+        """Hayaletlerin hareketlerini günceller"""
+        timer = self.phase_timer
+        
+        # Her hayaleti tek tek güncelle
+        for i, ghost in enumerate(self.ghosts):
+            self.update_ghost(i, ghost)
+            
+            # Ghost Pac-Man'i yakaladı mı kontrolü
+            if timer is None:
+                caught = self.check_ghost_collision(ghost)
+            else:
+                started = time.perf_counter_ns()
+                caught = self.check_ghost_collision(ghost)
+                timer.record('collision', time.perf_counter_ns() - started)
+            if caught:
+                break
+    
+    def update_ghost(self, index, ghost):
+        """Tek bir hayaletin yolunu planlar ve onu bir adım ilerletir"""
+        # Ekstra parametreler
+        extra_params = {
+            'is_ghost': True,
+            'current_ghost_index': index
+        }
+        
+        timer = self.phase_timer
+        started = time.perf_counter_ns() if timer is not None else 0
+        ghost_path = self.find_path(
+            (ghost.x, ghost.y),
+            (self.pacman.x, self.pacman.y),
+            self.ghost_algorithm,
+            **extra_params
+        )
+        if timer is not None:
+            timer.record(f'ghost_{index}_plan', time.perf_counter_ns() - started)
+        
+        if ghost_path and len(ghost_path) > 1:
+            next_pos = ghost_path[1]
+            ghost.move(next_pos)
+    
+    def check_ghost_collision(self, ghost):
+        """Hayalet Pac-Man'i yakaladıysa oyunu bitirir; yakaladıysa True"""
+        if ghost.x == self.pacman.x and ghost.y == self.pacman.y:
+            self.state = GameState.GAME_OVER
+            return True
+        return False
+    
+    def snapshot(self):
+        """Planlama için oyun durumunun değişmez bir kopyasını döndürür"""
+        return GameSnapshot(
+            key=(self._game_id, self._sim_tick),
+            pacman=AgentView(self.pacman.x, self.pacman.y),
+            pacman_path=tuple(self.pacman.path),
+            ghosts=tuple(AgentView(ghost.x, ghost.y) for ghost in self.ghosts),
+            coins=tuple(CoinView(coin.x, coin.y) for coin in self.coins),
+            pacman_algorithm=self.pacman_algorithm,
+            ghost_algorithm=self.ghost_algorithm,
+            user_control=self.user_control
+        )
+    
+    def compact_state(self):
+        """
+        Oyunun ileri bakış için sıkıştırılmış durumu
+        
+        Model labirenti ve şu anki coin yerleşimini sabitler; durum (CompactState)
+        O(1)'de kopyalanıp model.step ile ilerletilebilir.
+        
+        Dönüş: (StateModel, CompactState)
+        """
+        model, state = StateModel.from_views(self.maze, self.pacman, self.ghosts, self.coins)
+        state.score = self.score
+        return model, state
+    
+    def restore_state(self, model, state):
+        """compact_state ile alınmış (ya da ondan türetilmiş) bir durumu oyuna geri yükler"""
+        self.pacman.move(model.position(state.pacman))
+        self.pacman.path = []
+        for ghost, cell in zip(self.ghosts, state.ghosts):
+            ghost.move(model.position(cell))
+        self.coins = [Coin(x, y, self.cell_size) for x, y in model.coin_positions(state)]
+        self.score = state.score
+        if state.status == WON:
+            self.state = GameState.GAME_WON
+        elif state.status == LOST:
+            self.state = GameState.GAME_OVER
+        else:
+            self.state = GameState.PLAYING
+        self._needs_full_redraw = True
+    
+    def plan_step(self, snapshot):
+        """
+        Bir simülasyon adımının yapay zeka kararlarını anlık görüntüden hesaplar
+        
+        update_pacman ve update_ghosts ile aynı sırayı izler: önce Pac-Man'in yolu,
+        sonra hayaletler sırayla Pac-Man'in yeni konumuna doğru planlanır. Oyun
+        nesnelerini değiştirmediği için arka plan iş parçacığında çalışabilir.
+        Kullanıcı kontrolünde anlık görüntü move_user_step'ten sonra alınmalıdır.
+        
+        Dönüş: StepPlan (Pac-Man'in yolu ve hayaletlerin yeni konumları)
+        """
+        if self.agent_pool is not None:
+            return self.agent_pool.plan_step(snapshot)
+        
+        if self.scheduler is not None:
+            num_agents = len(snapshot.ghosts) + (0 if snapshot.user_control else 1)
+            self.scheduler.begin_tick(num_agents)
+        
+        pacman = snapshot.pacman
+        pacman_path = list(snapshot.pacman_path)
+        coins = list(snapshot.coins)
+        if not snapshot.user_control:
+            if not pacman_path:
+                nearest_coin = self.find_nearest_coin(pacman, coins)
+                if nearest_coin:
+                    pacman_path = self.find_path(
+                        (pacman.x, pacman.y),
+                        (nearest_coin.x, nearest_coin.y),
+                        snapshot.pacman_algorithm,
+                        pacman=pacman, ghosts=snapshot.ghosts, coins=coins
+                    )
+            # Hayaletler Pac-Man'in bu adımdaki yeni konumunu kovalar
+            if len(pacman_path) >= 2:
+                pacman = AgentView(*pacman_path[1])
+        
+        ghosts = list(snapshot.ghosts)
+        for i, ghost in enumerate(ghosts):
+            ghost_path = self.find_path(
+                (ghost.x, ghost.y),
+                (pacman.x, pacman.y),
+                snapshot.ghost_algorithm,
+                is_ghost=True, current_ghost_index=i,
+                pacman=pacman, ghosts=tuple(ghosts), coins=coins
+            )
+            if ghost_path and len(ghost_path) > 1:
+                ghosts[i] = AgentView(*ghost_path[1])
+        
+        return StepPlan(snapshot.key, pacman_path, [(ghost.x, ghost.y) for ghost in ghosts])
+    
+    def apply_step(self, plan):
+        """plan_step ile hesaplanan hamleleri uygulayarak oyunu bir adım ilerletir"""
+        if self.user_control:
+            # Anlık görüntüden önce yapılmadıysa kullanıcının hamlesi şimdi uygulanır
+            self.move_user_step()
+        self._sim_tick += 1
+        
+        if not self.user_control:
+            self.pacman.path = list(plan.pacman_path)
+            if not self.pacman.path and not self.coins:
+                self.state = GameState.GAME_WON
+            else:
+                self.advance_pacman()
+        
+        for ghost, next_pos in zip(self.ghosts, plan.ghost_moves):
+            ghost.move(next_pos)
+            if self.check_ghost_collision(ghost):
+                break
+        
+        self.apply_wall_events(self._sim_tick)
+    
+    def draw_maze(self, screen):
+        """Labirenti ekrana çizer"""
+        is_wall = self.is_wall
+        for y in range(self.grid_height):
+            for x in range(self.grid_width):
+                if is_wall(x, y):
+                    pygame.draw.rect(screen, self.BLUE, 
+                                  (x * self.cell_size, y * self.cell_size, 
+                                   self.cell_size, self.cell_size))
+    
+    def get_maze_surface(self):
+        """Labirentin statik katmanını (zemin + duvarlar) bir kez çizip önbellekler"""
+        if self._maze_surface is None:
+            surface = pygame.Surface((self.screen_width, self.screen_height))
+            surface.fill(self.BLACK)
+            self.draw_maze(surface)
+            # Ekran varsa piksel biçimini eşle ki blit hızlı olsun
+            self._maze_surface = surface.convert() if pygame.display.get_surface() else surface
+        return self._maze_surface
+    
+    def get_coin_cells(self):
+        """Coin hücrelerinin kümesi; yalnızca coin listesi değiştiğinde yeniden hesaplanır"""
+        key = (id(self.coins), len(self.coins))
+        if key != self._coin_cells_key:
+            self._coin_cells_key = key
+            self._current_coin_cells = {(coin.x, coin.y) for coin in self.coins}
+        return self._current_coin_cells
+    
+    def cell_rect(self, cell):
+        """Hücrenin ekrandaki dikdörtgeni"""
+        return pygame.Rect(cell[0] * self.cell_size, cell[1] * self.cell_size,
+                           self.cell_size, self.cell_size)
+    
+    def rect_cells(self, rect):
+        """Bir ekran dikdörtgeninin kapladığı hücreler"""
+        return {(x, y)
+                for y in range(rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1)
+                for x in range(rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1)}
+    
+    def draw_menu(self, screen):
+        """Menü ekranını çizer"""
+        # Başlık
+        title_text = "Pacman with Multiple Search Algorithms"
+        title_surface = render_text(title_text, 48, self.WHITE)
+        title_rect = title_surface.get_rect(center=(self.screen_width//2, 40))
+        screen.blit(title_surface, title_rect)
+
+        # Alt başlık: Algoritma seçimleri
+        pacman_subtitle = "Pacman Algoritması / Kullanıcı Kontrolü"
+        ghost_subtitle = "Hayalet Algoritması"
+        
+        pacman_surface = render_text(pacman_subtitle, 36, (150, 255, 150))
+        ghost_surface = render_text(ghost_subtitle, 36, (255, 150, 150))
+        
+        screen.blit(pacman_surface, (self.screen_width//2 - pacman_surface.get_width()//2, 70))
+        screen.blit(ghost_surface, (self.screen_width//2 - ghost_surface.get_width()//2, 155))
+
+        # Seçili algoritmaları göster
+        pacman_text = "Kullanıcı" if self.user_control else self.pacman_algorithm
+        selected_text = f"Seçilen: Pacman - {pacman_text}, Hayalet - {self.ghost_algorithm}"
+        selected_surface = render_text(selected_text, 36, self.GOLD)
+        selected_rect = selected_surface.get_rect(center=(self.screen_width//2, 340))
+        screen.blit(selected_surface, selected_rect)
+
+        # Kullanıcı kontrolü açıklaması
+        if self.user_control:
+            help_text = "Not: Oyun başladığında Pac-Man'i yön tuşları ile kontrol edebilirsiniz"
+            help_surface = render_text(help_text, 30, self.PURPLE)
+            help_rect = help_surface.get_rect(center=(self.screen_width//2, 380))
+            screen.blit(help_surface, help_rect)
+
+        # Butonları çiz
+        for key, button in self.buttons.items():
+            if (key == f'pacman_{self.pacman_algorithm.lower()}' or 
+                (key == 'pacman_user' and self.user_control) or 
+                key == f'ghost_{self.ghost_algorithm.lower()}'):
+                button.is_selected = True
+            else:
+                button.is_selected = False
+            button.draw(screen, self.WHITE, self.BLACK)
+    
+    def draw_game(self, screen):
+        """
+        Oyun ekranını çizer
+        
+        Statik labirent önbellekten kopyalanır. İlk karede tüm ekran, sonraki
+        karelerde yalnızca varlıkların eski ve yeni hücreleri (ve gerekirse HUD)
+        yeniden çizilir.
+        
+        Dönüş: Ekranda güncellenmesi gereken dikdörtgenlerin listesi
+        """
+        maze_surface = self.get_maze_surface()
+        coin_cells = self.get_coin_cells()
+        entity_cells = {(self.pacman.x, self.pacman.y)}
+        entity_cells.update((ghost.x, ghost.y) for ghost in self.ghosts)
+        pacman_text = "Kullanıcı" if self.user_control else self.pacman_algorithm
+        hud_key = (self.score, pacman_text, self.ghost_algorithm, self.user_control)
+        
+        full_redraw = self._needs_full_redraw
+        if full_redraw:
+            # Labirenti çiz
+            screen.blit(maze_surface, (0, 0))
+            dirty_cells = None
+            hud_dirty = True
+        else:
+            # Varlıkların ayrıldığı/girdiği hücreler ve toplanan coinler
+            dirty_cells = self._drawn_cells | entity_cells | (self._coin_cells - coin_cells)
+            hud_dirty = hud_key != self._hud_key or not dirty_cells.isdisjoint(self._hud_cells)
+            if hud_dirty:
+                dirty_cells |= self._hud_cells
+            for cell in dirty_cells:
+                rect = self.cell_rect(cell)
+                screen.blit(maze_surface, rect, rect)
+        
+        # Coinleri çiz
+        if full_redraw:
+            for coin in self.coins:
+                coin.draw(screen, self.GOLD)
+        else:
+            for coin in self.coins:
+                if (coin.x, coin.y) in dirty_cells:
+                    coin.draw(screen, self.GOLD)
+        
+        # Pac-Man'i ve hayaletleri çiz
+        self.pacman.draw(screen)
+        for ghost in self.ghosts:
+            ghost.draw(screen)
+        
+        # HUD yalnızca değiştiyse veya altı yeniden çizildiyse
+        dirty_rects = [screen.get_rect()] if full_redraw else [self.cell_rect(cell) for cell in dirty_cells]
+        if hud_dirty:
+            hud_rect = self.draw_hud(screen)
+            self._hud_cells = self.rect_cells(hud_rect)
+            dirty_rects.append(hud_rect)
+        
+        self._needs_full_redraw = False
+        self._drawn_cells = entity_cells
+        self._coin_cells = coin_cells
+        self._hud_key = hud_key
+        return dirty_rects
+    
+    def draw_hud(self, screen):
+        """Skor ve algoritma bilgisini çizer; kapladığı alanı döndürür"""
+        # Skor gösterimi
+        score_text = f"Skor: {self.score}"
+        score_surface = render_text(score_text, 36, self.WHITE)
+        hud_rect = screen.blit(score_surface, (10, 10))
+        
+        # Algoritma bilgisi
+        pacman_text = "Kullanıcı" if self.user_control else self.pacman_algorithm
+        algo_text = f"Pacman: {pacman_text}, Hayalet: {self.ghost_algorithm}"
+        algo_surface = render_text(algo_text, 28, self.WHITE)
+        hud_rect.union_ip(screen.blit(algo_surface, (10, 40)))
+        
+        # Kullanıcı kontrolü açıklaması ve kontroller
+        if self.user_control:
+            # Kontrol ipucu
+            hint_text = "Yön tuşları ile hareket edin"
+            hint_surface = render_text(hint_text, 28, self.PURPLE)
+            hud_rect.union_ip(screen.blit(hint_surface, (10, 70)))
+            
+            # Kontrol tuşları sembolü
+            controls_surface = render_text("↑ ← ↓ →", 20, self.PURPLE)
+            hud_rect.union_ip(screen.blit(controls_surface, (10, 95)))
+        
+        return hud_rect
+    
+    def draw_game_over(self, screen):
+        """Oyun sonu ekranını çizer (kaybetme)"""
+        text = f"GAME OVER! Score: {self.score}"
+        text_surface = render_text(text, 74, self.RED)
+        text_rect = text_surface.get_rect(center=(self.screen_width//2, self.screen_height//2))
+        screen.blit(text_surface, text_rect)
+        
+        # Restart butonu
+        self.buttons['start'].text = "Restart"
+        self.buttons['start'].draw(screen, self.WHITE, self.BLACK)
+    
+    def draw_game_won(self, screen):
+        """Oyun sonu ekranını çizer (kazanma)"""
+        text = f"YOU WIN! Score: {self.score}"
+        text_surface = render_text(text, 74, self.WHITE)
+        text_rect = text_surface.get_rect(center=(self.screen_width//2, self.screen_height//2))
+        screen.blit(text_surface, text_rect)
+        
+        # Restart butonu
+        self.buttons['start'].text = "Restart"
+        self.buttons['start'].draw(screen, self.WHITE, self.BLACK)
+    
+    def handle_events(self):
+        """Pygame olaylarını işler"""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            elif event.type == pygame.VIDEOEXPOSE:
+                # Pencere yeniden görünür oldu: bir sonraki karede tam çizim
+                self._needs_full_redraw = True
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_pos = pygame.mouse.get_pos()
+                
+                if self.state == GameState.MENU:
+                    self.handle_menu_input(mouse_pos)
+                elif self.state in [GameState.GAME_OVER, GameState.GAME_WON]:
+                    if self.buttons['start'].is_clicked(mouse_pos):
+                        self.state = GameState.MENU
+        
+        # Klavye girişlerini işle (oyun sırasında)
+        if self.state == GameState.PLAYING:
+            keys = pygame.key.get_pressed()
+            self.handle_user_input(keys)
+        
+        return True
+    
+    def update(self):
+        """Oyun durumunu günceller"""
+        if self.state == GameState.PLAYING:
+            if self.agent_pool is not None:
+                # Paralel mod: tüm ajanlar aynı durumdan planlar, hamleler birlikte uygulanır
+                self.move_user_step()
+                self.apply_step(self.plan_step(self.snapshot()))
+                return
+            
+            self._sim_tick += 1
+            if self.scheduler is not None:
+                # Bütçeyi bu tick'te plan yapacak ajanlar arasında paylaştır
+                num_agents = len(self.ghosts) + (0 if self.user_control else 1)
+                self.scheduler.begin_tick(num_agents)
+            self.update_pacman()
+            self.update_ghosts()
+            self.apply_wall_events(self._sim_tick)
+    
+    def update_background(self, planner):
+        """
+        Arka plan planlayıcısının kararlarıyla bir simülasyon adımı atmayı dener
+        
+        Geçerli adımın planı hazır değilse istek gönderilir ve beklenmeden dönülür.
+        Adım atıldıktan sonra bir sonraki adımın planlaması hemen başlatılır.
+        
+        Dönüş: Adım atıldıysa (veya oyun sürmüyorsa) True, plan henüz hazır değilse False
+        """
+        if self.state != GameState.PLAYING:
+            return True
+        
+        key = (self._game_id, self._sim_tick)
+        plan = planner.poll()
+        if plan is None or plan.key != key:
+            if not planner.pending(key):
+                # Kullanıcı kontrolünde hayaletler Pac-Man'in bu adımdaki hamlesinden sonra planlanır
+                self.move_user_step()
+                planner.submit(self.snapshot())
+            return False
+        
+        self.apply_step(plan)
+        if self.state == GameState.PLAYING and not self.user_control:
+            planner.submit(self.snapshot())
+        return True
+    
+    def draw(self, screen):
+        """Oyun ekranını çizer"""
+        if self.state == GameState.PLAYING:
+            started = time.perf_counter_ns()
+            
+            # Oyun sırasında yalnızca değişen alanları güncelle
+            dirty_rects = self.draw_game(screen)
+            if screen is pygame.display.get_surface():
+                pygame.display.update(dirty_rects)
+            
+            if self.phase_timer is not None:
+                self.phase_timer.record('render', time.perf_counter_ns() - started)
+            return
+        
+        # Menü ve oyun sonu ekranları tam çizilir; oyuna dönüşte de tam çizim gerekir
+        self._needs_full_redraw = True
+        screen.fill(self.BLACK)
+        
+        if self.state == GameState.MENU:
+            self.draw_menu(screen)
+        elif self.state == GameState.GAME_OVER:
+            self.draw_game_over(screen)
+        elif self.state == GameState.GAME_WON:
+            self.draw_game_won(screen)
+        
+        if screen is pygame.display.get_surface():
+            pygame.display.flip()
+    
+    def run(self, screen, fps=15, render_fps=60, background_planning=True):
+        """
+        Oyunu çalıştırır
+        
+        Simülasyon saniyede fps adım ilerler (sabit zaman adımı); olaylar ve çizim
+        render_fps hızında işlenir. background_planning açıksa yapay zeka kararları
+        ayrı bir iş parçacığında hesaplanır, böylece yavaş bir algoritma girdiyi ve
+        çizimi dondurmaz; karar hazır olana kadar simülasyon adımı ertelenir.
+        """
+        running = True
+        clock = pygame.time.Clock()
+        step_time = 1.0 / fps
+        next_step = time.perf_counter()
+        planner = BackgroundPlanner(self.plan_step) if background_planning else None
+        
+        try:
+            while running:
+                running = self.handle_events()
+                
+                # Sabit zaman adımı: sırası gelmişse tek bir simülasyon adımı
+                now = time.perf_counter()
+                if now >= next_step:
+                    if planner is None:
+                        self.update()
+                        stepped = True
+                    else:
+                        stepped = self.update_background(planner)
+                    if stepped:
+                        # Geride kalınan adımlar toplu oynatılmaz, zamanlama yeniden kurulur
+                        next_step = max(next_step + step_time, now)
+                
+                self.draw(screen)
+                clock.tick(render_fps)  # Çizim hızı
+        finally:
+            if planner is not None:
+                planner.close()
+            if self.agent_pool is not None:
+                self.agent_pool.close()
+        
+        if self.scheduler is not None:
+            print(f"Süre bütçesi: {self.scheduler.ticks} tick, "
+                  f"{self.scheduler.deadline_misses} kaçırılan süre sınırı, "
+                  f"{self.scheduler.fallbacks} yedek hamle")
+        
         return False
\ No newline at end of file
@@ -0,0 +1,208 @@
+import json
+import os
+import struct
+
+import numpy as np
+
+from algorithms.dynamic_maze import DynamicMaze
+from algorithms.maze_grid import DEFAULT_TILE, TiledGrid, tile_shape
+
+# İkili labirent dosyası (.pmz):
+#   başlık   : sihirli bayt, sürüm, karo kenarı, genişlik, yükseklik, senaryo uzunluğu
+#   karolar  : DATA_OFFSET'ten itibaren (karo satırı, karo sütunu) sırasıyla, her
+#              karo tile x tile bayt, satır öncelikli
+#   senaryo  : karolardan sonra isteğe bağlı JSON (Pac-Man, hayalet ve coin konumları,
+#              zamanlanmış duvar değişiklikleri)
+MAGIC = b'PMAZ'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sHHIII')
+DATA_OFFSET = 64  # Karolar hizalı bir konumdan başlar
+
+# Bu kadar ve daha fazla hücreli ikili labirentler belleğe eşlenir
+MMAP_THRESHOLD = 1 << 20
+
+# Metin biçimindeki karakterler
+WALL_CHARS = '#1'
+FLOOR_CHARS = '. 0'
+PACMAN_CHAR = 'P'
+GHOST_CHAR = 'G'
+COIN_CHAR = 'o'
+
+class MazeFormatError(ValueError):
+    """Labirent dosyası okunamadı (bozuk başlık, bilinmeyen karakter...)"""
+
+class Scenario:
+    """
+    Bir labirent ve isteğe bağlı başlangıç yerleşimi
+
+    Verilmeyen konumlar (None) için Game kendi varsayılanlarını kullanır.
+    """
+
+    def __init__(self, maze, pacman_start=None, ghost_starts=None, coins=None, wall_events=None):
+        """
+        Parametreler:
+        - maze: TiledGrid (ya da iç içe liste)
+        - pacman_start: Pac-Man'in (x, y) başlangıcı
+        - ghost_starts: Hayaletlerin [(x, y), ...] başlangıçları
+        - coins: Coin konumları [(x, y), ...]
+        - wall_events: Zamanlanmış duvar değişiklikleri [(tik, x, y, duvar mı), ...]
+          (kapılar, yıkılabilir duvarlar); Game bunları DynamicMaze ile uygular
+        """
+        self.maze = maze
+        self.pacman_start = pacman_start
+        self.ghost_starts = ghost_starts
+        self.coins = coins
+        self.wall_events = wall_events
+        self._dynamic_maze = None
+
+    def dynamic_maze(self):
+        """
+        Labirentin DynamicMaze sarmalayıcısı (senaryo başına bir tane)
+
+        Oyunlar aynı sarmalayıcıyı paylaşır ve başlarken değişiklikleri geri
+        alır; böylece arama çekirdeği ve onarılan tablolar oyunlar arasında
+        yeniden kullanılır. Izgara yerinde değişir (eşlenmiş dosyada mode='c').
+        """
+        if self._dynamic_maze is None:
+            self._dynamic_maze = DynamicMaze(self.maze)
+        return self._dynamic_maze
+
+    def layout(self):
+        """Yerleşimin JSON'a yazılabilir biçimi (yalnızca verilen alanlar)"""
+        layout = {}
+        if self.pacman_start is not None:
+            layout['pacman'] = list(self.pacman_start)
+        if self.ghost_starts is not None:
+            layout['ghosts'] = [list(pos) for pos in self.ghost_starts]
+        if self.coins is not None:
+            layout['coins'] = [list(pos) for pos in self.coins]
+        if self.wall_events is not None:
+            layout['walls'] = [[tick, x, y, int(wall)] for tick, x, y, wall in self.wall_events]
+        return layout
+
+    def _set_layout(self, layout):
+        if 'pacman' in layout:
+            self.pacman_start = tuple(layout['pacman'])
+        if 'ghosts' in layout:
+            self.ghost_starts = [tuple(pos) for pos in layout['ghosts']]
+        if 'coins' in layout:
+            self.coins = [tuple(pos) for pos in layout['coins']]
+        if 'walls' in layout:
+            self.wall_events = [(tick, x, y, bool(wall)) for tick, x, y, wall in layout['walls']]
+
+def load_text_maze(path, tile=DEFAULT_TILE):
+    """
+    Metin labirenti okur: '#' / '1' duvar, '.' / ' ' / '0' zemin; 'P' Pac-Man,
+    'G' hayalet ve 'o' coin konumlarını da işaretler (altları zemindir)
+
+    Kısa satırlar duvarla tamamlanır. Dönüş: Scenario
+    """
+    with open(path, encoding='utf-8') as f:
+        lines = [line.rstrip('\r\n') for line in f]
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if not lines:
+        raise MazeFormatError(f"{path}: boş labirent")
+
+    width = max(len(line) for line in lines)
+    grid = np.ones((len(lines), width), dtype=np.uint8)
+    pacman, ghosts, coins = None, [], []
+    for y, line in enumerate(lines):
+        for x, char in enumerate(line):
+            if char in WALL_CHARS:
+                continue
+            if char == PACMAN_CHAR:
+                pacman = (x, y)
+            elif char == GHOST_CHAR:
+                ghosts.append((x, y))
+            elif char == COIN_CHAR:
+                coins.append((x, y))
+            elif char not in FLOOR_CHARS:
+                raise MazeFormatError(f"{path}:{y + 1}: bilinmeyen karakter {char!r}")
+            grid[y, x] = 0
+
+    return Scenario(TiledGrid.from_array(grid, tile), pacman, ghosts or None, coins or None)
+
+def save_binary_maze(path, scenario, tile=DEFAULT_TILE):
+    """
+    Senaryoyu ikili biçimde yazar; labirent karolar halinde saklanır
+
+    Parametreler:
+    - scenario: Scenario ya da yalnızca labirent (TiledGrid, dizi, liste)
+    """
+    if not isinstance(scenario, Scenario):
+        scenario = Scenario(scenario)
+    maze = scenario.maze
+    if not isinstance(maze, TiledGrid) or maze.tile != tile:
+        maze = TiledGrid.from_array(maze, tile)
+    layout = json.dumps(scenario.layout(), separators=(',', ':')).encode('utf-8')
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, tile, maze.width, maze.height, len(layout)))
+        f.write(b'\0' * (DATA_OFFSET - _HEADER.size))
+        # Büyük haritalar karo satırı karo satırı yazılır
+        for band in maze.tiles:
+            f.write(np.ascontiguousarray(band, dtype=np.uint8).tobytes())
+        f.write(layout)
+
+def load_binary_maze(path, mmap=None, mode='c'):
+    """
+    İkili labirent okur
+
+    Parametreler:
+    - mmap: True ise karolar belleğe eşlenir, False ise okunur; None ise
+      MMAP_THRESHOLD hücreden büyük labirentler eşlenir
+    - mode: Eşlemede np.memmap kipi ('c' değişiklikleri dosyaya yazmaz)
+
+    Dönüş: Scenario
+    """
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise MazeFormatError(f"{path}: başlık eksik")
+        magic, version, tile, width, height, layout_size = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise MazeFormatError(f"{path}: labirent dosyası değil")
+        if version != FORMAT_VERSION:
+            raise MazeFormatError(f"{path}: desteklenmeyen sürüm {version}")
+        if not tile or not width or not height:
+            raise MazeFormatError(f"{path}: geçersiz boyut")
+
+        shape = tile_shape(width, height, tile)
+        data_size = int(np.prod(shape))
+        if os.path.getsize(path) < DATA_OFFSET + data_size + layout_size:
+            raise MazeFormatError(f"{path}: dosya kısa")
+
+        if mmap is None:
+            mmap = width * height >= MMAP_THRESHOLD
+        if mmap:
+            maze = TiledGrid.open(path, width, height, tile, DATA_OFFSET, mode)
+        else:
+            f.seek(DATA_OFFSET)
+            tiles = np.frombuffer(f.read(data_size), dtype=np.uint8).reshape(shape).copy()
+            maze = TiledGrid(tiles, width, height)
+
+        f.seek(DATA_OFFSET + data_size)
+        layout = f.read(layout_size)
+
+    scenario = Scenario(maze)
+    if layout:
+        scenario._set_layout(json.loads(layout))
+    return scenario
+
+def load_maze(path, tile=DEFAULT_TILE, mmap=None, mode='c'):
+    """
+    Dosya içeriğine göre ikili ya da metin labirent okur
+
+    Parametreler:
+    - tile: Metin labirentin karo kenarı (ikili dosya kendi karo kenarını taşır)
+    - mmap, mode: İkili dosyada load_binary_maze'e aktarılır; metin dosyasında
+      labirent zaten bellekte kurulduğundan yok sayılır
+
+    Dönüş: Scenario
+    """
+    with open(path, 'rb') as f:
+        is_binary = f.read(len(MAGIC)) == MAGIC
+    if is_binary:
+        return load_binary_maze(path, mmap, mode)
+    return load_text_maze(path, tile)
@@ -0,0 +1,90 @@
+import threading
+from collections import namedtuple
+
+# Değişmez konum görünümleri: algoritmalar yalnızca .x ve .y okur
+AgentView = namedtuple('AgentView', ['x', 'y'])
+CoinView = namedtuple('CoinView', ['x', 'y'])
+
+# Planlama için oyun durumunun değişmez kopyası
+# key: (oyun numarası, simülasyon adımı); sonuç yalnızca aynı adımda uygulanır
+GameSnapshot = namedtuple('GameSnapshot', [
+    'key', 'pacman', 'pacman_path', 'ghosts', 'coins',
+    'pacman_algorithm', 'ghost_algorithm', 'user_control'
+])
+
+# Bir simülasyon adımı için planlanan hamleler
+StepPlan = namedtuple('StepPlan', ['key', 'pacman_path', 'ghost_moves'])
+
+class BackgroundPlanner:
+    """
+    Yapay zeka kararlarını ayrı bir iş parçacığında hesaplayan planlayıcı
+
+    Ana döngü her adımda bir GameSnapshot gönderir ve sonraki karelerde sonucu
+    yoklar; bu sırada olay işleme ve çizim beklemeden devam eder. Yalnızca en
+    son istek tutulur, eskisi henüz başlamadıysa yenisiyle değiştirilir.
+    """
+
+    def __init__(self, plan_step):
+        """
+        Parametreler:
+        - plan_step: GameSnapshot alıp StepPlan döndüren fonksiyon
+        """
+        self._plan_step = plan_step
+        self._cond = threading.Condition()
+        self._request = None
+        self._active_key = None  # Şu an hesaplanan ya da bekleyen isteğin anahtarı
+        self._result = None
+        self._error = None
+        self._running = True
+        self._thread = threading.Thread(target=self._work, name="ai-planner", daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot):
+        """Yeni bir planlama isteği gönderir"""
+        with self._cond:
+            self._request = snapshot
+            self._active_key = snapshot.key
+            self._cond.notify()
+
+    def pending(self, key):
+        """Bu anahtar için bir istek bekliyor ya da hesaplanıyor mu"""
+        with self._cond:
+            return self._active_key == key
+
+    def poll(self):
+        """Hazır sonucu döndürür (yoksa None); işçideki hata burada yeniden yükseltilir"""
+        with self._cond:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            result, self._result = self._result, None
+            return result
+
+    def close(self, timeout=1.0):
+        """İş parçacığını durdurur; süren bir plan bitene kadar en fazla timeout bekler"""
+        with self._cond:
+            self._running = False
+            self._request = None
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while self._running and self._request is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                snapshot, self._request = self._request, None
+
+            try:
+                plan = self._plan_step(snapshot)
+                error = None
+            except Exception as exc:
+                plan, error = None, exc
+
+            with self._cond:
+                if self._active_key == snapshot.key:
+                    self._active_key = None
+                    self._result = plan
+                    self._error = error
@@ -0,0 +1,344 @@
+import hashlib
+import json
+import multiprocessing
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+# Grafik çizim kodu değiştiğinde artırılır; eski grafikler yeniden çizilir
+REPORT_VERSION = 1
+
+# Bir grafik işi: çizim fonksiyonu, çıktı dosyası ve fonksiyonun tek girdisi olan veri
+ChartJob = namedtuple('ChartJob', ['renderer', 'filename', 'data'])
+
+GHOST_COLORS = ['#ff6666', '#66b3ff', '#99ff99', '#ffcc99']
+
+def safe_name(name):
+    """Algoritma adını dosya adında kullanılabilir hale getirir"""
+    name = name.replace('*', '_star').replace('?', '_q')
+    for char in ':"<>|\\/':
+        name = name.replace(char, '_')
+    return name
+
+def _pyplot():
+    # Yalnızca dosyaya çizilir; ekran arka ucu gerekmez ve işçilerde güvenlidir
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+def _update_digest(digest, value):
+    """Veriyi türüne göre kanonik biçimde özete ekler (sözlükler anahtar sırasıyla)"""
+    if isinstance(value, np.ndarray):
+        digest.update(f"nd{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'{')
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+        digest.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'[')
+        for item in value:
+            _update_digest(digest, item)
+        digest.update(b']')
+    else:
+        digest.update(repr(value).encode())
+        digest.update(b',')
+
+def job_digest(job):
+    """Grafiğin girdilerinin özeti: çizim fonksiyonu, rapor sürümü ve veri"""
+    digest = hashlib.sha256()
+    _update_digest(digest, (REPORT_VERSION, job.renderer.__module__, job.renderer.__qualname__, job.data))
+    return digest.hexdigest()
+
+def wall_layer(maze, color=(0.0, 0.0, 1.0), alpha=1.0):
+    """Duvarları tek bir RGBA görüntü katmanı olarak döndürür (boş hücreler saydam)"""
+    walls = np.asarray(maze) == 1
+    layer = np.zeros(walls.shape + (4,))
+    layer[walls] = (*color, alpha)
+    return layer
+
+def _render(job):
+    """İşçi: tek bir grafiği çizer"""
+    job.renderer(job.data, job.filename)
+    return job.filename
+
+def render_charts(jobs, manifest_path, workers=None):
+    """
+    Grafik işlerini çizer; girdisi son çizimden beri değişmeyenleri atlar
+
+    Her grafiğin girdi özeti manifest_path'teki JSON dosyasında tutulur. Çizilmesi
+    gereken birden fazla grafik varsa süreç havuzunda paralel çizilir.
+
+    Parametreler:
+    - jobs: ChartJob listesi
+    - manifest_path: Özetlerin saklandığı dosya
+    - workers: İşçi süreci sayısı (None ise CPU sayısı; 1 ise bu süreçte çizilir)
+
+    Dönüş: (çizilen, atlanan) grafik sayıları
+    """
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    pending = []
+    for job in jobs:
+        digest = job_digest(job)
+        if manifest.get(job.filename) == digest and os.path.exists(job.filename):
+            continue
+        pending.append((job, digest))
+
+    def done(job, digest):
+        manifest[job.filename] = digest
+
+    workers = min(workers or multiprocessing.cpu_count(), len(pending))
+    try:
+        if workers <= 1:
+            for job, digest in pending:
+                _render(job)
+                done(job, digest)
+        else:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {executor.submit(_render, job): (job, digest) for job, digest in pending}
+                for future in as_completed(futures):
+                    future.result()
+                    done(*futures[future])
+    finally:
+        # Yarıda kesilse bile tamamlanan grafikler bir dahaki sefere atlanır
+        os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+
+    return len(pending), len(jobs) - len(pending)
+
+def bar_chart(data, filename):
+    """
+    Hayalet algoritmasına göre gruplanmış çubuk grafik
+
+    data: pacman_algorithms, values (hayalet algoritması -> değerler), title,
+    ylabel ve ylim (None ise otomatik)
+    """
+    plt = _pyplot()
+    plt.figure(figsize=(14, 8))
+
+    # Pac-Man algoritmalarını ayarla
+    x = np.arange(len(data['pacman_algorithms']))
+    width = 0.2  # Çubuk genişliği
+
+    # Her hayalet algoritması için çubuk ekle
+    num_ghosts = len(data['values'])
+    for i, (ghost_algo, values) in enumerate(data['values'].items()):
+        offset = width * (i - num_ghosts/2 + 0.5)
+        plt.bar(x + offset, values, width, label=f'Ghost: {ghost_algo}', color=GHOST_COLORS[i % len(GHOST_COLORS)])
+
+    # Grafik ayarları
+    plt.xlabel('Pac-Man Algorithm')
+    plt.ylabel(data['ylabel'])
+    plt.title(data['title'])
+    plt.xticks(x, data['pacman_algorithms'])
+    plt.legend()
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    if data['ylim'] is not None:
+        plt.ylim(0, data['ylim'])
+
+    # Kaydet
+    plt.tight_layout()
+    plt.savefig(filename)
+    plt.close()
+
+def radar_chart(data, filename):
+    """
+    Bir Pac-Man algoritmasının hayalet algoritmalarına karşı performansı
+
+    data: pacman_algo ve series (hayalet algoritması -> [coin %, hayatta kalma %, kazanma %])
+    """
+    plt = _pyplot()
+    plt.figure(figsize=(10, 8))
+
+    # Metrikler ve açılar
+    metrics = ['Coin Collection', 'Survival', 'Win Rate']
+    angles = np.linspace(0, 2*np.pi, len(metrics), endpoint=False).tolist()
+    angles += angles[:1]  # Grafiği kapatmak için ilk açıyı tekrarla
+
+    ax = plt.subplot(111, polar=True)
+    for ghost_algo, values in data['series'].items():
+        values = list(values) + list(values[:1])
+        ax.plot(angles, values, linewidth=2, label=f'Ghost: {ghost_algo}')
+        ax.fill(angles, values, alpha=0.1)
+
+    # Grafik ayarları
+    ax.set_theta_offset(np.pi / 2)  # Başlangıç açısı (üst kısım)
+    ax.set_theta_direction(-1)  # Saat yönünde
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(metrics)
+    ax.set_ylim(0, 100)
+    ax.grid(True)
+    plt.title(f"Performance Comparison of Pac-Man {data['pacman_algo']} Algorithm", size=15)
+    plt.legend(loc='upper right')
+
+    # Kaydet
+    plt.tight_layout()
+    plt.savefig(filename)
+    plt.close()
+
+def heatmap_chart(data, filename):
+    """
+    Bir algoritmanın konum ziyaret sıklığı ısı haritası
+
+    data: algo, heatmap (2B ziyaret sayıları) ve maze
+    """
+    plt = _pyplot()
+    plt.figure(figsize=(12, 10))
+
+    # Normalize et
+    heatmap = data['heatmap']
+    max_val = np.max(heatmap) if np.max(heatmap) > 0 else 1
+    plt.imshow(heatmap / max_val, cmap='hot', interpolation='nearest')
+    plt.colorbar(label='Visit Frequency (Normalised)')
+
+    # Labirent duvarları tek bir görüntü katmanı
+    plt.imshow(wall_layer(data['maze']), interpolation='nearest')
+
+    # Grafik ayarları
+    plt.title(f"{data['algo']} Algorithm Location Visit Heat Map")
+    plt.xlabel('X')
+    plt.ylabel('Y')
+    plt.grid(False)
+
+    # Kaydet
+    plt.tight_layout()
+    plt.savefig(filename)
+    plt.close()
+
+def percentile_chart(data, filename):
+    """
+    Pac-Man algoritmalarının adım süresi yüzdelikleri
+
+    data: algorithms ve percentiles (p50/p95/p99/max -> algoritma başına ms)
+    """
+    plt = _pyplot()
+    plt.figure(figsize=(12, 8))
+
+    # Her algoritma için yüzdelik çubukları yan yana
+    x = np.arange(len(data['algorithms']))
+    width = 0.2
+    colors = {'p50': 'skyblue', 'p95': 'orange', 'p99': 'red', 'max': 'dimgray'}
+    for offset, (name, values) in enumerate(data['percentiles'].items()):
+        plt.bar(x + (offset - 1.5) * width, values, width, label=name,
+                color=colors[name], edgecolor='black', alpha=0.8)
+
+    # Grafik ayarları
+    plt.xticks(x, data['algorithms'])
+    plt.xlabel('Algorithm')
+    plt.ylabel('Step Duration (ms, logarithmic scale)')
+    plt.yscale('log')
+    plt.title('Pac-Man Step Duration Percentiles by Algorithm')
+    plt.legend()
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    # Kaydet
+    plt.tight_layout()
+    plt.savefig(filename)
+    plt.close()
+
+def phase_latency_chart(data, filename):
+    """
+    Her aşama için kombinasyon başına p50/p95/p99 gecikme grafiği
+
+    data: labels (kombinasyon etiketleri) ve summaries (aşama -> kombinasyon başına
+    LatencyHistogram.summary())
+    """
+    plt = _pyplot()
+    phases = list(data['summaries'])
+    x = np.arange(len(data['labels']))
+    width = 0.27
+
+    fig, axes = plt.subplots(len(phases), 1, figsize=(max(12, len(x) * 0.8), 4 * len(phases)),
+                             squeeze=False)
+    for ax, phase in zip(axes[:, 0], phases):
+        summaries = data['summaries'][phase]
+        for offset, (name, color) in enumerate([('p50', 'skyblue'), ('p95', 'orange'), ('p99', 'red')]):
+            ax.bar(x + (offset - 1) * width, [s[f'{name}_ms'] for s in summaries], width,
+                   label=name, color=color, edgecolor='black', alpha=0.8)
+        ax.scatter(x, [s['max_ms'] for s in summaries], marker='_', s=200, color='black', label='max')
+        ax.set_title(f'{phase} latency')
+        ax.set_ylabel('ms (log)')
+        ax.set_yscale('log')
+        ax.set_xticks(x)
+        ax.set_xticklabels(data['labels'], fontsize=8)
+        ax.grid(axis='y', linestyle='--', alpha=0.7)
+        ax.legend(loc='upper right')
+
+    plt.tight_layout()
+    plt.savefig(filename)
+    plt.close()
+
+def path_chart(data, filename):
+    """
+    Bir algoritmanın Pac-Man yolunu labirent üzerinde gösterir
+
+    data: algo, trial, path ((n, 2) konum dizisi) ve maze
+    """
+    plt = _pyplot()
+    from matplotlib.collections import LineCollection
+
+    path = np.asarray(data['path'])
+    maze = np.asarray(data['maze'])
+    grid_height, grid_width = maze.shape
+    plt.figure(figsize=(12, 10))
+
+    # Labirent duvarları tek bir görüntü katmanı (y ekseni yukarı)
+    plt.imshow(wall_layer(maze, alpha=0.7), origin='lower', interpolation='nearest',
+               extent=(-0.5, grid_width - 0.5, -0.5, grid_height - 0.5))
+
+    # Noktaları çiz
+    points = path
+    plt.scatter(points[:,0], points[:,1], c=range(len(points)),
+               cmap='viridis', alpha=0.5, s=10)
+
+    # Yolu çiz (gradyan renkli)
+    segments = np.stack([points[:-1], points[1:]], axis=1)
+    norm = plt.Normalize(0, len(segments))
+    lc = LineCollection(segments, cmap='viridis', norm=norm)
+    lc.set_array(np.arange(len(segments)))
+    lc.set_linewidth(2)
+    plt.gca().add_collection(lc)
+    plt.colorbar(lc, label='Step Order')
+
+    # Başlangıç ve bitiş noktalarını işaretle
+    plt.scatter(path[0][0], path[0][1], color='green', s=150, marker='o',
+               label='Start', zorder=5)
+    plt.scatter(path[-1][0], path[-1][1], color='red', s=150, marker='X',
+               label='Finish', zorder=5)
+
+    # Yön oklarını ekle
+    arrow_indices = np.linspace(0, len(path)-2, min(20, len(path)-1), dtype=int)
+    for i in arrow_indices:
+        dx = path[i+1][0] - path[i][0]
+        dy = path[i+1][1] - path[i][1]
+        plt.arrow(path[i][0], path[i][1], dx*0.6, dy*0.6,
+                head_width=0.2, head_length=0.3, fc='black', ec='black', zorder=4)
+
+    # Grafik ayarları
+    plt.title(f"{data['algo']} Algorithm Path Tracking (Trial {data['trial']+1})")
+    plt.xlabel('X')
+    plt.ylabel('Y')
+    plt.grid(True, linestyle='--', alpha=0.3)
+    plt.legend()
+
+    # Grafiği kare yapıp eksen sınırlarını ayarla
+    plt.axis('equal')
+    plt.xlim(-1, grid_width+1)
+    plt.ylim(-1, grid_height+1)
+
+    # Kaydet
+    plt.tight_layout()
+    plt.savefig(filename)
+    plt.close()
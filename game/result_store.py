@@ -0,0 +1,228 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    pacman_algo TEXT NOT NULL,
+    ghost_algo TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    config TEXT NOT NULL,
+    spec TEXT NOT NULL DEFAULT '',
+    coins_collected INTEGER NOT NULL,
+    survival_steps INTEGER NOT NULL,
+    game_won INTEGER NOT NULL,
+    path BLOB,
+    phases TEXT,
+    metrics TEXT,
+    created_at REAL NOT NULL
+);
+"""
+
+_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS games_job_spec ON games (pacman_algo, ghost_algo, seed, config, spec);
+"""
+
+_OUTCOME_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outcomes (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    path BLOB,
+    phases TEXT,
+    metrics TEXT,
+    created_at REAL NOT NULL
+);
+"""
+
+def config_key(config):
+    """Simülasyon ayarlarını karşılaştırılabilir, kanonik bir JSON metnine çevirir"""
+    return json.dumps(config, sort_keys=True, separators=(',', ':'))
+
+def outcome_key(**inputs):
+    """
+    Bir oyunun sonucunu belirleyen girdilerin içerik özeti (SHA-256)
+
+    Girdiler (labirent, tohum, coin yerleşimi, algoritmalar ve parametreleri,
+    motor sürümü...) kanonik JSON'a çevrilip özetlenir; herhangi biri değişirse
+    anahtar da değişir.
+    """
+    return hashlib.sha256(config_key(inputs).encode('utf-8')).hexdigest()
+
+def _dump(value):
+    """Sütun değeri: bytes (ör. kodlanmış yol) olduğu gibi, diğerleri JSON metni olarak"""
+    if value is None or isinstance(value, bytes):
+        return value
+    return json.dumps(value)
+
+def _load(value):
+    """_dump'ın tersi; JSON metni çözülür, bytes olduğu gibi döner"""
+    return json.loads(value) if isinstance(value, str) else value
+
+def _connect(path):
+    """SQLite dosyasını (gerekirse dizinini oluşturarak) WAL kipinde açar"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA journal_mode=WAL")
+    return connection
+
+class ResultStore:
+    """
+    Simülasyon sonuçları için yalnızca eklemeli SQLite deposu
+
+    Her biten oyun tek bir satır olarak hemen diske yazılır. (pacman_algo,
+    ghost_algo, seed, config, spec) benzersizdir; aynı iş iki kez kaydedilmez,
+    bu sayede yarıda kalan taramalar kaldığı yerden sürdürülebilir ve farklı
+    çalıştırmaların sonuçları aynı dosyada birleşir. spec, eşleşmedeki
+    algoritmaların tanımının (sınıf ve parametreler) özetidir; bir algoritma
+    değişince onun eşleşmeleri yeni iş sayılır.
+    """
+
+    def __init__(self, path):
+        """
+        Parametreler:
+        - path: SQLite dosyasının yolu (yoksa oluşturulur)
+        """
+        self.path = path
+        self.connection = _connect(path)
+        self.connection.executescript(_SCHEMA)
+        self._migrate()
+        self.connection.executescript(_INDEXES)
+
+    def _migrate(self):
+        """spec sütunu olmayan eski dosyalara sütunu ekler ve eski iş indeksini kaldırır"""
+        columns = {row['name'] for row in self.connection.execute("PRAGMA table_info(games)")}
+        if 'spec' not in columns:
+            with self.connection:
+                self.connection.execute("ALTER TABLE games ADD COLUMN spec TEXT NOT NULL DEFAULT ''")
+                self.connection.execute("DROP INDEX IF EXISTS games_job")
+
+    def add_game(self, pacman_algo, ghost_algo, seed, config, result, path=None, phases=None, metrics=None,
+                 spec=''):
+        """
+        Bir oyunun sonucunu kaydeder
+
+        Parametreler:
+        - config: config_key çıktısı
+        - result: coins_collected, survival_steps ve game_won anahtarlı sözlük
+        - path: Pac-Man'in ziyaret ettiği konumlar; game.trajectory.encode_path
+          çıktısı (bytes) ya da [(x, y), ...] listesi
+        - phases: Aşama adı -> LatencyHistogram.to_dict()
+        - metrics: Algoritma adı -> AlgorithmMetrics.to_dict()
+        - spec: Eşleşmedeki algoritmaların tanımının özeti (outcome_key çıktısı)
+
+        Dönüş: Satır eklendiyse True, bu iş zaten kayıtlıysa False
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO games (pacman_algo, ghost_algo, seed, config, spec, coins_collected, "
+                "survival_steps, game_won, path, phases, metrics, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (pacman_algo, ghost_algo, seed, config, spec,
+                 result['coins_collected'], result['survival_steps'], int(result['game_won']),
+                 _dump(path), _dump(phases), _dump(metrics),
+                 time.time())
+            )
+        return cursor.rowcount > 0
+
+    def has_game(self, pacman_algo, ghost_algo, seed, config, spec=''):
+        """Bu iş daha önce kaydedilmiş mi"""
+        row = self.connection.execute(
+            "SELECT 1 FROM games WHERE pacman_algo = ? AND ghost_algo = ? AND seed = ? AND config = ? "
+            "AND spec = ?",
+            (pacman_algo, ghost_algo, seed, config, spec)
+        ).fetchone()
+        return row is not None
+
+    def completed_jobs(self, config):
+        """Bu ayarlarla kaydedilmiş işler: {(pacman_algo, ghost_algo, seed, spec), ...}"""
+        rows = self.connection.execute(
+            "SELECT pacman_algo, ghost_algo, seed, spec FROM games WHERE config = ?", (config,))
+        return {tuple(row) for row in rows}
+
+    def games(self, config=None, pacman_algo=None, ghost_algo=None):
+        """
+        Kayıtlı oyunları ekleme sırasıyla döndürür
+
+        phases ve metrics sütunları çözülmüş olarak gelir (yoksa None); path
+        kaydedildiği gibi (kodlanmış yol ya da eski kayıtlarda liste) gelir.
+        """
+        query = "SELECT * FROM games"
+        conditions, params = [], []
+        for column, value in (('config', config), ('pacman_algo', pacman_algo), ('ghost_algo', ghost_algo)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY id"
+
+        for row in self.connection.execute(query, params):
+            game = dict(row)
+            for column in ('path', 'phases', 'metrics'):
+                game[column] = _load(game[column])
+            game['game_won'] = bool(game['game_won'])
+            yield game
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class OutcomeCache:
+    """
+    Deterministik eşleşmeler için içerik adresli sonuç önbelleği
+
+    Anahtar outcome_key çıktısıdır; aynı girdilerle oynanan oyun yeniden simüle
+    edilmez. Oyun deposundan ayrı bir dosyada tutulur: depo silinip tarama
+    baştan başlatıldığında da önbellek korunur.
+    """
+
+    def __init__(self, path):
+        """
+        Parametreler:
+        - path: SQLite dosyasının yolu (yoksa oluşturulur)
+        """
+        self.path = path
+        self.connection = _connect(path)
+        self.connection.executescript(_OUTCOME_SCHEMA)
+
+    def get(self, key):
+        """
+        Önbellekteki oyun sonucunu döndürür
+
+        Dönüş: result, path, phases ve metrics anahtarlı sözlük; yoksa None
+        """
+        row = self.connection.execute(
+            "SELECT result, path, phases, metrics FROM outcomes WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return {column: _load(row[column]) for column in ('result', 'path', 'phases', 'metrics')}
+
+    def put(self, key, result, path=None, phases=None, metrics=None):
+        """Deterministik bir oyunun sonucunu outcome_key anahtarıyla önbelleğe yazar"""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO outcomes (key, result, path, phases, metrics, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, _dump(result),
+                 _dump(path), _dump(phases), _dump(metrics),
+                 time.time())
+            )
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
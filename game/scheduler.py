@@ -0,0 +1,110 @@
+import time
+
+class FrameScheduler:
+    """
+    Tick başına yapay zeka hesaplama bütçesini ajanlar arasında paylaştıran zamanlayıcı
+
+    Algoritmaların plan() üreteçlerini kendilerine düşen süre dilimi dolana kadar
+    ilerletir. Süre dolduğunda o ana kadarki en iyi hamle kullanılır, hiç hamle
+    yoksa yedek fonksiyon çağrılır. Yarım kalan plan, anahtarı (ör. hedef ve
+    labirent sürümü) değişmediyse sonraki tick'te kaldığı yerden devam ettirilir;
+    ajan bu arada ilerlediyse yol ajanın şu anki konumundan kırpılır.
+    """
+
+    def __init__(self, tick_budget_ms):
+        """
+        Parametreler:
+        - tick_budget_ms: Bir tick'te tüm ajanlara ayrılan toplam süre (milisaniye)
+        """
+        self.tick_budget = tick_budget_ms / 1000.0
+
+        # İstatistikler
+        self.ticks = 0
+        self.deadline_misses = 0  # Süre dilimi içinde bitmeyen plan sayısı
+        self.fallbacks = 0        # Hazır hamle olmadığı için yedeğe düşülen sayı
+
+        self._tick_deadline = None
+        self._agents_left = 1
+        self._pending = {}  # ajan -> (anahtar, plan üreteci, en iyi ara yol)
+
+    def begin_tick(self, num_agents):
+        """Yeni bir tick başlatır; bütçe num_agents ajan arasında paylaştırılacak"""
+        self.ticks += 1
+        self._tick_deadline = time.perf_counter() + self.tick_budget
+        self._agents_left = max(1, num_agents)
+
+    def run(self, agent, key, make_plan, fallback, start=None):
+        """
+        Bir ajanın planını kendi süre dilimi içinde çalıştırır
+
+        Parametreler:
+        - agent: Ajan kimliği (ör. 'pacman' veya ('ghost', 0))
+        - key: Planın geçerli olduğu durum; önceki tick'ten farklıysa yarım plan atılır
+        - make_plan: Yeni bir plan üreteci oluşturan fonksiyon
+        - fallback: Hazır hamle yoksa yol döndüren fonksiyon
+        - start: Ajanın şu anki konumu; verilirse yollar buradan başlatılır, bu
+          konumu içermeyen yollar kullanılmaz
+
+        Dönüş: Yol listesi [(x1, y1), (x2, y2), ...]
+        """
+        now = time.perf_counter()
+        if self._tick_deadline is None:
+            self.begin_tick(1)
+
+        # Kalan süreyi henüz çalışmamış ajanlar arasında eşit böl
+        slice_end = now + max(0.0, self._tick_deadline - now) / self._agents_left
+        self._agents_left = max(1, self._agents_left - 1)
+
+        # Aynı anahtar için yarım kalmış bir plan varsa devam et
+        pending = self._pending.pop(agent, None)
+        if pending is not None and pending[0] == key:
+            _, plan, best = pending
+            best = _from_start(best, start)
+            fresh = False
+        else:
+            plan, best, fresh = make_plan(), None, True
+
+        while True:
+            try:
+                while True:
+                    partial = _from_start(next(plan), start)
+                    if partial and len(partial) >= 2:
+                        best = partial
+                    if time.perf_counter() >= slice_end:
+                        break
+            except StopIteration as stop:
+                path = _from_start(stop.value or [], start)
+                if path is not None or fresh:
+                    return path or []
+                # Devam eden plan ajanın artık üzerinde olmadığı bir yol buldu: baştan planla
+                plan, best, fresh = make_plan(), None, True
+                continue
+            break
+
+        # Süre doldu: planı sakla ve en iyi ara sonucu kullan
+        self.deadline_misses += 1
+        self._pending[agent] = (key, plan, best)
+        if best:
+            return best
+
+        self.fallbacks += 1
+        return fallback()
+
+    def reset(self):
+        """Yarım kalan planları ve istatistikleri temizler"""
+        self._pending.clear()
+        self._tick_deadline = None
+        self.ticks = 0
+        self.deadline_misses = 0
+        self.fallbacks = 0
+
+def _from_start(path, start):
+    """Yolu start'tan itibaren kırpar; start yolda yoksa None (start None ise yol aynen)"""
+    if start is None or not path:
+        return path
+    if path[0] == start:
+        return path
+    try:
+        return path[path.index(start):]
+    except ValueError:
+        return None
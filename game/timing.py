@@ -0,0 +1,127 @@
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS  # Her ikinin kuvveti aralığı 16 kovaya bölünür (%6.25 hata)
+
+def bucket_index(value):
+    """Nanosaniye değerinin logaritmik kova indeksi"""
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + ((value >> shift) & (SUB_BUCKETS - 1))
+
+def bucket_bounds(index):
+    """Kovanın kapsadığı [alt, üst] değer aralığı"""
+    if index < SUB_BUCKETS:
+        return index, index
+    shift = index // SUB_BUCKETS - 1
+    low = (SUB_BUCKETS + index % SUB_BUCKETS) << shift
+    return low, low + (1 << shift) - 1
+
+class LatencyHistogram:
+    """
+    Birleştirilebilir logaritmik kovalı gecikme histogramı (nanosaniye)
+
+    Her ikinin kuvveti aralığı SUB_BUCKETS eşit kovaya bölünür; yüzdelikler
+    en fazla %6.25 göreli hatayla, en küçük ve en büyük değer ise tam tutulur.
+    Aynı kova yapısını paylaştıkları için histogramlar kova kova toplanarak
+    birleştirilir (oyunlar, denemeler ya da süreçler arasında).
+    """
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = {}  # kova indeksi -> sayı
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value):
+        """Bir ölçüm ekler (nanosaniye, tam sayı)"""
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """Başka bir histogramı bununla birleştirir"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentile(self, q):
+        """q. yüzdelik (0-100); kovanın orta noktası, [min, max] aralığına sıkıştırılmış"""
+        if not self.count:
+            return 0
+        rank = max(1, -(-q * self.count // 100))  # En yakın sıra
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                return min(max((low + high) // 2, self.min), self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def summary(self):
+        """count, mean_ms, p50_ms, p95_ms, p99_ms ve max_ms anahtarlı sözlük"""
+        return {
+            'count': self.count,
+            'mean_ms': self.mean() / 1e6,
+            'p50_ms': self.percentile(50) / 1e6,
+            'p95_ms': self.percentile(95) / 1e6,
+            'p99_ms': self.percentile(99) / 1e6,
+            'max_ms': self.max / 1e6,
+        }
+
+    def to_dict(self):
+        """JSON'a yazılabilir biçim"""
+        return {'counts': {str(index): count for index, count in self.counts.items()},
+                'count': self.count, 'total': self.total, 'min': self.min, 'max': self.max}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data['counts'].items()}
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.min = data['min']
+        histogram.max = data['max']
+        return histogram
+
+class PhaseTimer:
+    """
+    Tick aşamalarının (Pac-Man planlaması, hayalet planlamaları, çarpışma, çizim)
+    süre histogramları
+
+    Game.phase_timer'a atandığında oyun ilgili aşamaları perf_counter_ns ile ölçüp
+    buraya kaydeder; None iken hiçbir ölçüm yapılmaz.
+    """
+
+    def __init__(self):
+        self.histograms = {}  # aşama adı -> LatencyHistogram
+
+    def record(self, phase, elapsed_ns):
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = LatencyHistogram()
+        histogram.record(elapsed_ns)
+
+    def merge(self, other):
+        """Başka bir zamanlayıcının histogramlarını aşama aşama ekler"""
+        for phase, histogram in other.histograms.items():
+            self.histograms.setdefault(phase, LatencyHistogram()).merge(histogram)
+        return self
+
+    def summary(self):
+        """Aşama adı -> LatencyHistogram.summary() sözlüğü"""
+        return {phase: histogram.summary() for phase, histogram in sorted(self.histograms.items())}
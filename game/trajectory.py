@@ -0,0 +1,200 @@
+import random
+
+import numpy as np
+
+def encode_path(path):
+    """
+    Yolu baytlara çevirir: başlangıç konumu (2 x uint16) ve adım farkları (int8 çiftleri)
+
+    TrajectoryBuffer'ın iç biçimidir; kodlanmış yol add ile çözülmeden eklenir.
+
+    Parametreler:
+    - path: Konumlar [(x, y), ...] ya da (n, 2) dizi
+
+    Dönüş: bytes (boş yol için b'')
+    """
+    positions = np.asarray(path, dtype=np.int64).reshape(-1, 2)
+    if not len(positions):
+        return b''
+    deltas = np.diff(positions, axis=0)
+    _check_deltas(deltas)
+    return positions[0].astype('<u2').tobytes() + deltas.astype(np.int8).tobytes()
+
+def decode_path(blob):
+    """encode_path çıktısını konumlara, (n, 2) int64 diziye çevirir"""
+    if not len(blob):
+        return np.empty((0, 2), dtype=np.int64)
+    start, deltas = _split_encoded(blob)
+    return _positions(start, deltas)
+
+def _split_encoded(blob):
+    """Kodlanmış yolu (başlangıç, adım farkları) görünümlerine ayırır (kopyalamadan)"""
+    data = np.frombuffer(blob, dtype=np.uint8)
+    if len(data) < 4 or len(data) % 2:
+        raise ValueError("Geçersiz kodlanmış yol")
+    return data[:4].view('<u2'), data[4:].view(np.int8).reshape(-1, 2)
+
+def _positions(start, deltas):
+    positions = np.empty((len(deltas) + 1, 2), dtype=np.int64)
+    positions[0] = start
+    np.cumsum(deltas, axis=0, dtype=np.int64, out=positions[1:])
+    positions[1:] += positions[0]
+    return positions
+
+def _check_deltas(deltas):
+    if len(deltas) and np.abs(deltas).max() > 127:
+        raise ValueError("Bir adımdaki konum farkı int8 aralığını aşıyor")
+
+class TrajectoryBuffer:
+    """
+    Yolların (konum dizilerinin) sıkıştırılmış, dizi tabanlı deposu
+
+    Her yol başlangıç konumu (uint16) ve adım farkları (int8) olarak tek bir
+    büyüyebilen tamponda tutulur; yuva başına başlangıç, konum ve uzunluk
+    dizileri tampondaki yeri gösterir. Bir adım en fazla bir hücre olduğundan
+    her adım 2 bayt yer kaplar.
+
+    reservoir_size verilirse her grup (anahtarın ilk öğesi, ör. algoritma)
+    için rezervuar örneklemesiyle en fazla o kadar yol tutulur; her yolun
+    tutulma olasılığı eşittir.
+    """
+
+    def __init__(self, reservoir_size=None, seed=0):
+        """
+        Parametreler:
+        - reservoir_size: Grup başına tutulacak en fazla yol (None ise hepsi)
+        - seed: Rezervuar örneklemesinin tohumu
+        """
+        self.reservoir_size = reservoir_size
+        self._rng = random.Random(seed)
+        self._deltas = np.empty((1024, 2), dtype=np.int8)
+        self._used = 0   # Tamponun dolu kısmı (adım)
+        self._dead = 0   # Rezervuardan çıkarılan yolların hâlâ yer kaplayan adımları
+        self._starts = np.empty((64, 2), dtype=np.uint16)
+        self._offsets = np.empty(64, dtype=np.int64)
+        self._lengths = np.empty(64, dtype=np.int64)
+        self._slots = {}       # anahtar -> yuva
+        self._free_slots = []
+        self._groups = {}      # grup -> rezervuardaki anahtarlar
+        self._seen = {}        # grup -> eklenmeye çalışılan yol sayısı
+
+    def add(self, key, path):
+        """
+        Bir yolu ekler
+
+        Parametreler:
+        - key: (grup, ...) biçiminde anahtar, ör. (algoritma, deneme)
+        - path: Konumlar [(x, y), ...], (n, 2) dizi ya da encode_path çıktısı (bytes)
+
+        Dönüş: Yol tutulduysa True, rezervuara girmediyse False
+        """
+        if isinstance(path, (bytes, bytearray, memoryview)):
+            if not len(path):
+                return False
+            start, deltas = _split_encoded(path)
+        else:
+            positions = np.asarray(path, dtype=np.int64).reshape(-1, 2)
+            if not len(positions):
+                return False
+            start, deltas = positions[0], np.diff(positions, axis=0)
+            _check_deltas(deltas)
+
+        if key in self._slots:
+            # Aynı anahtar: rezervuardaki yeri korunur, yalnızca yolu değişir
+            self._release(key)
+        else:
+            group = key[0]
+            members = self._groups.setdefault(group, [])
+            seen = self._seen[group] = self._seen.get(group, 0) + 1
+            if self.reservoir_size is None or len(members) < self.reservoir_size:
+                members.append(key)
+            else:
+                index = self._rng.randrange(seen)
+                if index >= self.reservoir_size:
+                    return False
+                self._release(members[index])
+                members[index] = key
+
+        slot = self._new_slot()
+        self._reserve(len(deltas))
+        self._deltas[self._used:self._used + len(deltas)] = deltas
+        self._starts[slot] = start
+        self._offsets[slot] = self._used
+        self._lengths[slot] = len(deltas) + 1
+        self._used += len(deltas)
+        self._slots[key] = slot
+        return True
+
+    def get(self, key):
+        """Yolun konumları, (n, 2) int64 dizi"""
+        slot = self._slots[key]
+        offset, length = self._offsets[slot], self._lengths[slot]
+        return _positions(self._starts[slot], self._deltas[offset:offset + length - 1])
+
+    def length(self, key):
+        """Yoldaki konum sayısı (çözmeden)"""
+        return int(self._lengths[self._slots[key]])
+
+    def keys(self):
+        return list(self._slots)
+
+    def items(self):
+        for key in self._slots:
+            yield key, self.get(key)
+
+    def seen(self, group):
+        """Gruba eklenmeye çalışılan toplam yol sayısı (rezervuara girmeyenler dahil)"""
+        return self._seen.get(group, 0)
+
+    @property
+    def nbytes(self):
+        """Tamponların kapladığı bellek (bayt)"""
+        return self._deltas.nbytes + self._starts.nbytes + self._offsets.nbytes + self._lengths.nbytes
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __iter__(self):
+        return iter(self._slots)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def _new_slot(self):
+        if self._free_slots:
+            return self._free_slots.pop()
+        slot = len(self._slots)
+        if slot == len(self._offsets):
+            capacity = 2 * len(self._offsets)
+            self._starts = np.resize(self._starts, (capacity, 2))
+            self._offsets = np.resize(self._offsets, capacity)
+            self._lengths = np.resize(self._lengths, capacity)
+        return slot
+
+    def _release(self, key):
+        slot = self._slots.pop(key)
+        self._free_slots.append(slot)
+        self._dead += self._lengths[slot] - 1
+
+    def _reserve(self, count):
+        """count adımlık yer açar; ölü adımlar yarıyı geçtiyse önce tamponu sıkıştırır"""
+        if self._dead * 2 > self._used:
+            self._compact()
+        if self._used + count > len(self._deltas):
+            capacity = max(2 * len(self._deltas), self._used + count)
+            deltas = np.empty((capacity, 2), dtype=np.int8)
+            deltas[:self._used] = self._deltas[:self._used]
+            self._deltas = deltas
+
+    def _compact(self):
+        """Canlı yolları tamponun başına ardışık olarak taşır"""
+        deltas = np.empty_like(self._deltas)
+        used = 0
+        for slot in self._slots.values():
+            offset, steps = self._offsets[slot], self._lengths[slot] - 1
+            deltas[used:used + steps] = self._deltas[offset:offset + steps]
+            self._offsets[slot] = used
+            used += steps
+        self._deltas = deltas
+        self._used = used
+        self._dead = 0
@@ -1,27 +1,37 @@
-import pygame
-from game import Game
-
-def main():
-    # Pygame'i başlat
-    pygame.init()
-    pygame.font.init()
-    
-    # Ekran ve oyun ayarları
-    SCREEN_WIDTH = 1200
-    SCREEN_HEIGHT = 900
-    CELL_SIZE = 40
-    FPS = 15
-    
-    # Ekranı oluştur
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("Pacman with Multiple Search Algorithms")
-    
-    # Oyunu oluştur ve çalıştır
-    game = Game(SCREEN_WIDTH, SCREEN_HEIGHT, CELL_SIZE)
-    game.run(screen, FPS)
-    
-    # Oyun çıkışında Pygame'i kapat
-    pygame.quit()
-
-if __name__ == "__main__":
+import sys
+
+import pygame
+from game import Game
+from game.maze_loader import load_maze
+
+def main():
+    # Pygame'i başlat
+    pygame.init()
+    pygame.font.init()
+    
+    # Ekran ve oyun ayarları
+    SCREEN_WIDTH = 1200
+    SCREEN_HEIGHT = 900
+    CELL_SIZE = 40
+    FPS = 15         # Simülasyon adımı / saniye
+    RENDER_FPS = 60  # Çizim ve girdi hızı
+    AI_BUDGET_MS = 40  # Tick başına yapay zeka hesaplama bütçesi
+    AI_WORKERS = 0     # >0 ise ajanlar bu kadar süreçte paralel planlanır
+    
+    # Ekranı oluştur
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Pacman with Multiple Search Algorithms")
+    
+    # İsteğe bağlı labirent dosyası: python main.py mazes/arena.pmz
+    scenario = load_maze(sys.argv[1]) if len(sys.argv) > 1 else None
+    
+    # Oyunu oluştur ve çalıştır
+    game = Game(SCREEN_WIDTH, SCREEN_HEIGHT, CELL_SIZE, tick_budget_ms=AI_BUDGET_MS,
+                agent_workers=AI_WORKERS, scenario=scenario)
+    game.run(screen, FPS, RENDER_FPS)
+    
+    # Oyun çıkışında Pygame'i kapat
+    pygame.quit()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
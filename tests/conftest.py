@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Testler proje kökünden içe aktarır (algorithms, game)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
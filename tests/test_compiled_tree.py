@@ -0,0 +1,85 @@
+import os
+import pickle
+import struct
+
+import numpy as np
+import pytest
+
+from algorithms import decision_tree
+from algorithms.compiled_tree import MODEL_MAGIC, UNKNOWN_MAZE, CompiledTree, ModelFormatError, maze_hash
+from algorithms.decision_tree import DecisionTreeAlgorithm
+
+MAZE = [[1] * 6] + [[1, 0, 0, 0, 0, 1] for _ in range(4)] + [[1] * 6]
+
+def _classifier():
+    sklearn_tree = pytest.importorskip('sklearn.tree')
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 6, (400, 9))
+    y = rng.integers(0, 4, 400)
+    return sklearn_tree.DecisionTreeClassifier(max_depth=6, random_state=0).fit(X, y), X
+
+@pytest.fixture(autouse=True)
+def _empty_model_cache():
+    decision_tree._MODEL_CACHE.clear()
+    yield
+    decision_tree._MODEL_CACHE.clear()
+
+def test_round_trip_matches_sklearn(tmp_path):
+    classifier, X = _classifier()
+    path = tmp_path / 'model.dtm'
+    CompiledTree.from_sklearn(classifier).save(path, 'maze', 'schema')
+
+    tree = CompiledTree.load(path, schema_digest='schema')
+    assert tree.metadata['maze_hash'] == 'maze'
+    assert (tree.predict(X) == classifier.predict(X)).all()
+    assert [tree.predict_one(row) for row in X.tolist()] == classifier.predict(X).tolist()
+
+def test_load_rejects_other_schema_and_foreign_files(tmp_path):
+    classifier, _ = _classifier()
+    path = tmp_path / 'model.dtm'
+    CompiledTree.from_sklearn(classifier).save(path, 'maze', 'schema')
+    with pytest.raises(ModelFormatError):
+        CompiledTree.load(path, schema_digest='other')
+
+    foreign = tmp_path / 'foreign.dtm'
+    foreign.write_bytes(b'not a model')
+    with pytest.raises(ModelFormatError):
+        CompiledTree.load(foreign)
+
+def test_load_rejects_truncated_and_corrupt_files(tmp_path):
+    classifier, _ = _classifier()
+    path = tmp_path / 'model.dtm'
+    CompiledTree.from_sklearn(classifier).save(path, 'maze', 'schema')
+    data = path.read_bytes()
+
+    broken = tmp_path / 'broken.dtm'
+    for size in (len(MODEL_MAGIC) + 2, len(MODEL_MAGIC) + 20, len(data) - 1):
+        broken.write_bytes(data[:size])
+        with pytest.raises(ModelFormatError):
+            CompiledTree.load(broken)
+    broken.write_bytes(MODEL_MAGIC + struct.pack('<I', 4) + b'\xff\xfe{}')
+    with pytest.raises(ModelFormatError):
+        CompiledTree.load(broken)
+
+def test_save_over_mapped_model(tmp_path):
+    classifier, X = _classifier()
+    path = tmp_path / 'model.dtm'
+    tree = CompiledTree.from_sklearn(classifier)
+    tree.save(path, 'maze', 'schema')
+
+    mapped = CompiledTree.load(path)
+    mapped.save(path, 'maze', 'schema')
+    assert (mapped.predict(X) == classifier.predict(X)).all()
+    assert (CompiledTree.load(path).predict(X) == classifier.predict(X)).all()
+    assert os.listdir(tmp_path) == ['model.dtm']
+
+def test_legacy_pickle_is_tagged_unknown_maze(tmp_path):
+    classifier, X = _classifier()
+    with open(tmp_path / 'model.pkl', 'wb') as f:
+        pickle.dump(classifier, f)
+
+    algorithm = DecisionTreeAlgorithm(MAZE)
+    assert algorithm.load_model(str(tmp_path / 'model.pkl'))
+    tree = CompiledTree.load(tmp_path / 'model.dtm')
+    assert tree.metadata['maze_hash'] == UNKNOWN_MAZE != maze_hash(MAZE)
+    assert (tree.predict(X) == classifier.predict(X)).all()
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from algorithms.decision_tree import DecisionTreeAlgorithm
+from algorithms.dt_dataset import FirstMoveTable, sample_batch
+
+def _corridor(length):
+    # Tek sıra koridor, çevresi duvar
+    return [[1] * (length + 2), [1] + [0] * length + [1], [1] * (length + 2)]
+
+def test_sample_batch_fills_a_maze_with_just_enough_free_cells():
+    maze = _corridor(5)
+    table = FirstMoveTable(maze)
+    static = DecisionTreeAlgorithm.compute_static_features(maze)
+    rows = sample_batch(table, static, np.random.default_rng(0), 500, max_ghosts=3)
+    assert len(rows) == 500
+    assert set(rows[:, -1].tolist()) <= {1, 3}  # Koridorda yalnızca SAĞ/SOL
+
+    with pytest.raises(ValueError):
+        sample_batch(table, static, np.random.default_rng(0), 10, max_ghosts=4)
+    single = _corridor(1)
+    with pytest.raises(ValueError):
+        sample_batch(FirstMoveTable(single), DecisionTreeAlgorithm.compute_static_features(single),
+                     np.random.default_rng(0), 10, max_ghosts=1)
+
+def test_first_move_table_rejects_mazes_over_the_size_limit():
+    maze = _corridor(5)
+    assert FirstMoveTable(maze, max_bytes=25).labels.shape == (5, 5)
+    with pytest.raises(ValueError):
+        FirstMoveTable(maze, max_bytes=24)
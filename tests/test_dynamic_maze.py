@@ -0,0 +1,72 @@
+import random
+
+import numpy as np
+import pytest
+
+from algorithms.decision_tree import DecisionTreeAlgorithm
+from algorithms.dynamic_maze import DynamicMaze
+
+def _random_grid(rng, width=9, height=7, wall_ratio=0.3):
+    return [[1 if rng.random() < wall_ratio else 0 for _ in range(width)] for _ in range(height)]
+
+def test_decision_tree_move_features_follow_wall_changes():
+    rng = random.Random(0)
+    maze = DynamicMaze(_random_grid(rng))
+    algorithm = DecisionTreeAlgorithm(maze)
+    for _ in range(50):
+        maze.set_wall(rng.randrange(9), rng.randrange(7), rng.random() < 0.5)
+
+    fresh = DecisionTreeAlgorithm.compute_static_features(maze)
+    assert (algorithm.static_features == fresh).all()
+    x, y = 4, 3
+    features = algorithm.generate_features((x, y), (0, 0), [], [])
+    assert features[5:] == fresh[y, x].tolist()
+
+def test_revert_restores_walls_after_compaction():
+    rng = random.Random(1)
+    grid = _random_grid(rng)
+    original = [list(row) for row in grid]
+    maze = DynamicMaze(grid)
+    for _ in range(30):
+        maze.set_wall(rng.randrange(9), rng.randrange(7), rng.random() < 0.5)
+        if rng.random() < 0.3:
+            maze.compact(rng.randint(0, maze.version))
+
+    middle = maze.version
+    maze.compact(middle)
+    with pytest.raises(ValueError):
+        maze.changes_since(middle - 1)
+    maze.set_wall(0, 0, not maze.is_wall(0, 0))
+    assert maze.changes_since(middle) == [(0, 0, maze.is_wall(0, 0))]
+
+    maze.revert()
+    assert maze.grid == original
+    maze.compact()
+    assert maze.changes_since(maze.version) == []
+    maze.revert()
+    assert maze.grid == original
+
+def test_sync_brings_a_copy_to_the_same_walls():
+    rng = random.Random(2)
+    grid = _random_grid(rng)
+    maze = DynamicMaze([list(row) for row in grid])
+    copy = DynamicMaze([list(row) for row in grid])
+    current = {}
+    maze.subscribe(lambda x, y, wall: current.__setitem__((x, y), wall))
+    for _ in range(3):
+        for _ in range(10):
+            maze.set_wall(rng.randrange(9), rng.randrange(7), rng.random() < 0.5)
+        copy.sync(maze.version, [(x, y, wall) for (x, y), wall in current.items()])
+        assert copy.grid == maze.grid and copy.version == maze.version
+
+def test_array_is_cached_until_a_wall_changes():
+    maze = DynamicMaze([[0, 1], [0, 0]])
+    first = np.asarray(maze)
+    assert np.asarray(maze) is first and not first.flags.writeable
+    copy = np.array(maze)
+    copy[0, 0] = 1
+    assert np.asarray(maze)[0, 0] == 0
+
+    maze.set_wall(0, 0)
+    assert first[0, 0] == 0  # Eski dizi değişmez
+    assert np.asarray(maze) is not first and np.asarray(maze)[0, 0] == 1
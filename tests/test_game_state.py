@@ -0,0 +1,44 @@
+from algorithms import game_state
+from algorithms.dynamic_maze import DynamicMaze
+from algorithms.game_state import UNREACHABLE, StateModel
+
+def _grid():
+    grid = [[1] * 9] + [[1] + [0] * 7 + [1] for _ in range(5)] + [[1] * 9]
+    grid[3][2:7] = [1, 1, 1, 1, 1]
+    return grid
+
+def _bfs(model, source):
+    dist = [UNREACHABLE] * model.kernel.size
+    dist[source] = 0
+    frontier = [source]
+    while frontier:
+        following = []
+        for cell in frontier:
+            for neighbor in model.kernel.grid_neighbors(cell):
+                if model.kernel.passable[neighbor] and dist[neighbor] == UNREACHABLE:
+                    dist[neighbor] = dist[cell] + 1
+                    following.append(neighbor)
+        frontier = following
+    return dist
+
+def test_distance_tables_are_lru(monkeypatch):
+    monkeypatch.setattr(game_state, '_MAX_DISTANCE_TABLES', 3)
+    model = StateModel(_grid(), [])
+    a, b, c, d = (model.cell(pos) for pos in [(1, 1), (7, 1), (1, 5), (7, 5)])
+    for cell in (a, b, c):
+        model.distances(cell)
+    model.distances(a)  # a en son kullanılan olur
+    model.distances(d)  # en eski (b) atılır
+    assert list(model._distances) == [c, a, d]
+
+def test_distance_tables_are_repaired_after_wall_changes():
+    maze = DynamicMaze(_grid())
+    model = StateModel(maze, [])
+    sources = [model.cell(pos) for pos in [(1, 1), (7, 5), (4, 2)]]
+    for source in sources:
+        model.distances(source)
+
+    maze.set_wall(4, 3, False)  # Orta duvarda bir kapı açılır
+    maze.set_wall(4, 1, True)
+    for source in sources:
+        assert model.distances(source) == _bfs(model, source)
@@ -0,0 +1,61 @@
+import contextlib
+import io
+import os
+import random
+import time
+
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pygame = pytest.importorskip('pygame')
+
+from game import Game, GameState
+from game.planner import BackgroundPlanner
+
+DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+
+def _trajectory(mode, ghost_algorithm, steps=40, user_control=True):
+    """Aynı tohum ve aynı kullanıcı girdileriyle oynanan oyunun adım adım durumu"""
+    pygame.init()
+    random.seed(7)
+    moves = random.Random(11)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = Game(800, 600, 40)
+        game.user_control = user_control
+        game.ghost_algorithm = ghost_algorithm
+        game.state = GameState.PLAYING
+        game.init_game()
+        planner = BackgroundPlanner(game.plan_step) if mode == 'thread' else None
+        states = []
+        try:
+            for _ in range(steps):
+                if game.state != GameState.PLAYING:
+                    break
+                game.next_direction = moves.choice(DIRECTIONS)
+                if mode == 'sync':
+                    game.update()
+                elif mode == 'step':
+                    game.move_user_step()
+                    game.apply_step(game.plan_step(game.snapshot()))
+                else:
+                    while not game.update_background(planner):
+                        time.sleep(0.0005)
+                states.append(((game.pacman.x, game.pacman.y),
+                               tuple((ghost.x, ghost.y) for ghost in game.ghosts),
+                               game.score, game.state))
+        finally:
+            if planner is not None:
+                planner.close()
+    return states
+
+@pytest.mark.parametrize('ghost_algorithm', ['A*', 'BFS'])
+def test_user_control_ghosts_chase_post_move_position(ghost_algorithm):
+    expected = _trajectory('sync', ghost_algorithm)
+    assert len(expected) > 5
+    assert _trajectory('step', ghost_algorithm) == expected
+    assert _trajectory('thread', ghost_algorithm) == expected
+
+def test_ai_control_modes_agree():
+    expected = _trajectory('sync', 'A*', user_control=False)
+    assert _trajectory('step', 'A*', user_control=False) == expected
+    assert _trajectory('thread', 'A*', user_control=False) == expected
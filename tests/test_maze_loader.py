@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from algorithms.dynamic_maze import DynamicMaze
+from algorithms.maze_grid import TiledGrid, wall_test
+from game.maze_loader import MazeFormatError, Scenario, load_maze, save_binary_maze
+
+TEXT_MAZE = """\
+#######
+#P.o..#
+#.###G#
+#o....#
+#######
+"""
+
+def _grid(maze):
+    return np.asarray(maze).astype(np.uint8)
+
+def test_text_maze_round_trips_through_binary(tmp_path):
+    text = tmp_path / 'arena.txt'
+    text.write_text(TEXT_MAZE, encoding='utf-8')
+    scenario = load_maze(str(text), mmap=True)  # mmap metin dosyasında yok sayılır
+    assert scenario.pacman_start == (1, 1)
+    assert scenario.ghost_starts == [(5, 2)]
+    assert scenario.coins == [(3, 1), (1, 3)]
+
+    scenario.wall_events = [(20, 2, 3, True)]
+    binary = tmp_path / 'arena.pmz'
+    save_binary_maze(str(binary), scenario, tile=4)
+    for mmap in (False, True):
+        loaded = load_maze(str(binary), mmap=mmap)
+        assert isinstance(loaded.maze, TiledGrid)
+        assert (_grid(loaded.maze) == _grid(scenario.maze)).all()
+        assert loaded.maze[1][1] == 0 and loaded.maze[2][2] == 1
+        assert tuple(loaded.pacman_start) == (1, 1)
+        assert [tuple(pos) for pos in loaded.coins] == [(3, 1), (1, 3)]
+        assert [tuple(event) for event in loaded.wall_events] == [(20, 2, 3, True)]
+
+def test_memory_mapped_maze_is_not_written_back(tmp_path):
+    path = tmp_path / 'big.pmz'
+    grid = np.zeros((70, 90), dtype=np.uint8)
+    grid[::7, :] = 1
+    save_binary_maze(str(path), Scenario(grid), tile=16)
+    loaded = load_maze(str(path), mmap=True)
+    loaded.maze.set_cell(3, 3, 1)
+    assert loaded.maze[3][3] == 1
+    assert load_maze(str(path)).maze[3][3] == 0
+
+def test_bad_files_raise_format_errors(tmp_path):
+    path = tmp_path / 'broken.pmz'
+    path.write_bytes(b'PMAZ')
+    with pytest.raises(MazeFormatError):
+        load_maze(str(path))
+    path.write_text('#?#\n', encoding='utf-8')
+    with pytest.raises(MazeFormatError):
+        load_maze(str(path))
+
+def test_wall_test_matches_indexing_for_every_maze_kind():
+    grid = [[1, 1, 1, 1, 1], [1, 0, 0, 1, 1], [1, 1, 0, 0, 1]]
+    tiled = TiledGrid.from_array(np.array(grid, dtype=np.uint8), tile=2)
+    for maze in (grid, tiled, DynamicMaze(tiled)):
+        is_wall = wall_test(maze)
+        assert [[is_wall(x, y) for x in range(5)] for y in range(3)] == \
+            [[bool(cell) for cell in row] for row in grid]
@@ -0,0 +1,45 @@
+from algorithms.dynamic_maze import DynamicMaze
+from algorithms.mcts import MonteCarloTreeSearchAlgorithm
+from game.planner import AgentView, CoinView
+from game.scheduler import FrameScheduler
+
+def _open_grid(width=9, height=7):
+    return [[1] * width] + [[1] + [0] * (width - 2) + [1] for _ in range(height - 2)] + [[1] * width]
+
+def _plan(scheduler, algorithm, index, pacman, ghosts, coins):
+    start = (ghosts[index].x, ghosts[index].y)
+    key = (index, start, algorithm.maze.version, tuple(coins))
+    return scheduler.run(
+        ('ghost', index), key,
+        lambda: algorithm.plan(start, (pacman.x, pacman.y), pacman=pacman, ghosts=ghosts,
+                               coins=coins, is_ghost=True, current_ghost_index=index),
+        lambda: [start], start)
+
+def test_two_ghosts_share_one_instance_under_the_scheduler():
+    maze = DynamicMaze(_open_grid())
+    algorithm = MonteCarloTreeSearchAlgorithm(maze, iterations=64, batch_size=4, seed=0)
+    scheduler = FrameScheduler(1)
+    pacman = AgentView(4, 3)
+    ghosts = [AgentView(1, 1), AgentView(7, 5)]
+    layouts = [[CoinView(2, 3), CoinView(6, 3)], [CoinView(4, 5)]]
+    for tick in range(40):
+        scheduler.begin_tick(2)
+        if tick == 20:
+            maze.set_wall(4, 2)
+        # Hayaletler farklı coin yerleşimleri görür: her biri kendi modelini kurar
+        # ve yarım kalan arama diğerininkiyle değil, başladığı modelle sürmeli
+        paths = [_plan(scheduler, algorithm, index, pacman, ghosts, layouts[index]) for index in range(2)]
+        for ghost, path in zip(ghosts, paths):
+            assert path[0] == (ghost.x, ghost.y)
+            for (x0, y0), (x1, y1) in zip(path, path[1:]):
+                assert abs(x1 - x0) + abs(y1 - y0) <= 1 and not maze.is_wall(x1, y1)
+    assert scheduler.deadline_misses > 0  # Planlar tick'ler boyunca sürdürüldü
+    algorithm.find_path((7, 5), (4, 3), pacman=pacman, ghosts=ghosts, coins=layouts[1],
+                        is_ghost=True, current_ghost_index=1)
+
+    # Saklanan alt ağaçlar, bağlamın modelini kuran hayaletin yerleşimine aittir
+    context = algorithm._context
+    assert context.version == maze.version and context.roots
+    for turn in context.roots:
+        state = context.model.state_from_views(pacman, ghosts, layouts[turn - 1])
+        assert state is not None
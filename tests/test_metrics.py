@@ -0,0 +1,42 @@
+from algorithms.astar import AStarAlgorithm, SafeAStarAlgorithm
+from algorithms.bfs import BFSAlgorithm
+from algorithms.dfs import LimitedDFSAlgorithm
+
+MAZE = [[1] * 12] + [[1] + [0] * 10 + [1] for _ in range(8)] + [[1] * 12]
+
+def _drain(plan):
+    while True:
+        try:
+            next(plan)
+        except StopIteration as stop:
+            return stop.value
+
+def test_plan_records_same_work_as_find_path():
+    for cls in (AStarAlgorithm, BFSAlgorithm, SafeAStarAlgorithm, LimitedDFSAlgorithm):
+        algorithm = cls(MAZE)
+        path = algorithm.find_path((1, 1), (10, 8))
+        expected = algorithm.metrics.last_nodes
+        assert expected > 0
+
+        assert _drain(algorithm.plan((1, 1), (10, 8))) == path
+        assert algorithm.metrics.calls == 2
+        assert algorithm.metrics.last_nodes == expected
+        assert algorithm.metrics.last_path_length == len(path)
+
+def test_interleaved_plans_keep_their_own_counters():
+    algorithm = AStarAlgorithm(MAZE, yield_every=4)
+    algorithm.find_path((1, 1), (10, 8))
+    first = algorithm.metrics.last_nodes
+    algorithm.find_path((10, 1), (1, 8))
+    second = algorithm.metrics.last_nodes
+    algorithm.metrics.reset()
+
+    a = algorithm.plan((1, 1), (10, 8))
+    b = algorithm.plan((10, 1), (1, 8))
+    next(a)
+    next(b)
+    _drain(a)
+    assert algorithm.metrics.last_nodes == first
+    _drain(b)
+    assert algorithm.metrics.last_nodes == second
+    assert algorithm.metrics.calls == 2
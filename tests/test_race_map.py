@@ -0,0 +1,31 @@
+from algorithms.dynamic_maze import DynamicMaze
+from algorithms.metrics import CallStats
+from algorithms.race_map import RaceMap
+
+def _corridor():
+    # 9x3: tek sıra koridor, çevresi duvar
+    return [[1] * 9, [1] + [0] * 7 + [1], [1] * 9]
+
+def test_safe_cells_are_those_pacman_reaches_first():
+    race = RaceMap.for_positions(_corridor(), (2, 1), [(6, 1)], danger_radius=3, unsafe_cost=20)
+    # Pac-Man önce hareket eder: 4. sütuna 2, hayalet 2 adımda varır -> eşitlikte güvensiz
+    assert [race.is_safe((x, 1)) for x in range(1, 8)] == [True, True, True, False, False, False, False]
+    assert race.margin((3, 1)) == 2 and race.margin((1, 1)) == 4
+    assert race.danger((3, 1)) == 1 and race.danger((1, 1)) == 0
+    assert race.danger((4, 1)) == 20
+    assert not race.is_safe((0, 0)) and race.danger((0, 0)) == 20  # Duvar: ulaşılamaz
+
+def test_race_map_is_reused_within_a_tick_and_rebuilt_after_wall_changes():
+    maze = DynamicMaze(_corridor())
+    stats = CallStats()
+    first = RaceMap.for_positions(maze, (1, 1), [(7, 1)], stats=stats)
+    hits = stats.cache_hits
+    assert RaceMap.for_positions(maze, (1, 1), [(7, 1)], stats=stats) is first
+    assert stats.cache_hits == hits + 1
+    assert RaceMap.for_positions(maze, (2, 1), [(7, 1)]) is not first
+
+    maze.set_wall(4, 1)
+    blocked = RaceMap.for_positions(maze, (1, 1), [(7, 1)])
+    assert blocked is not first
+    assert blocked.is_safe((3, 1)) and blocked.margin((3, 1)) is None
+    assert not blocked.is_safe((5, 1))
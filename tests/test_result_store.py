@@ -0,0 +1,101 @@
+import contextlib
+import io
+import os
+import sqlite3
+
+import pytest
+
+from game.result_store import OutcomeCache, ResultStore, config_key, outcome_key
+
+RESULT = {'coins_collected': 3, 'survival_steps': 40, 'game_won': False}
+
+def test_completed_jobs_resume(tmp_path):
+    config = config_key({'max_steps': 10})
+    with ResultStore(str(tmp_path / 'games.sqlite')) as store:
+        assert store.add_game('A*', 'BFS', 0, config, RESULT, path=[(1, 1), (1, 2)], spec='s1')
+        assert not store.add_game('A*', 'BFS', 0, config, RESULT, spec='s1')
+        # Aynı iş, değişmiş algoritma tanımıyla yeni bir iştir
+        assert store.add_game('A*', 'BFS', 0, config, RESULT, spec='s2')
+        assert store.completed_jobs(config) == {('A*', 'BFS', 0, 's1'), ('A*', 'BFS', 0, 's2')}
+        assert store.completed_jobs(config_key({'max_steps': 11})) == set()
+        assert store.has_game('A*', 'BFS', 0, config, 's1')
+
+    with ResultStore(str(tmp_path / 'games.sqlite')) as store:
+        games = list(store.games(config=config))
+        assert [game['spec'] for game in games] == ['s1', 's2']
+        assert games[0]['path'] == [[1, 1], [1, 2]]
+
+def test_store_without_spec_column_is_migrated(tmp_path):
+    path = str(tmp_path / 'old.sqlite')
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE games (id INTEGER PRIMARY KEY, pacman_algo TEXT NOT NULL, ghost_algo TEXT NOT NULL,
+            seed INTEGER NOT NULL, config TEXT NOT NULL, coins_collected INTEGER NOT NULL,
+            survival_steps INTEGER NOT NULL, game_won INTEGER NOT NULL, path TEXT, phases TEXT,
+            metrics TEXT, created_at REAL NOT NULL);
+        CREATE UNIQUE INDEX games_job ON games (pacman_algo, ghost_algo, seed, config);
+        INSERT INTO games VALUES (1, 'A*', 'BFS', 0, 'c', 1, 2, 0, NULL, NULL, NULL, 0);
+    """)
+    connection.close()
+
+    with ResultStore(path) as store:
+        assert store.completed_jobs('c') == {('A*', 'BFS', 0, '')}
+        assert store.add_game('A*', 'BFS', 0, 'c', RESULT, spec='new')
+
+def test_outcome_cache_is_a_separate_file(tmp_path):
+    key = outcome_key(seed=1, maze=[[0]])
+    with OutcomeCache(str(tmp_path / 'outcomes.sqlite')) as cache:
+        assert cache.get(key) is None
+        cache.put(key, RESULT, path=[(0, 0)], metrics={'A*': {'calls': 1}})
+
+    with OutcomeCache(str(tmp_path / 'outcomes.sqlite')) as cache:
+        cached = cache.get(key)
+    assert cached['result'] == RESULT
+    assert cached['path'] == [[0, 0]]
+    assert cached['metrics'] == {'A*': {'calls': 1}}
+
+def _sweep(store_path, outcome_path, monkeypatch):
+    """Küçük bir tarama çalıştırır; simüle edilen eşleşmeleri ve önbellekten gelen oyun sayısını döndürür"""
+    from demo.demo import GameSimulation
+
+    played = []
+    run_single = GameSimulation.run_single_simulation
+    def spy(self, pacman_algo, ghost_algo, seed=None):
+        played.append((pacman_algo, ghost_algo))
+        return run_single(self, pacman_algo, ghost_algo, seed)
+    monkeypatch.setattr(GameSimulation, 'run_single_simulation', spy)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation = GameSimulation(max_steps=15, num_trials=1, num_coins=5, store_path=str(store_path),
+                                    outcome_cache_path=str(outcome_path))
+        simulation.pacman_algorithms = ['A*', 'BFS', 'DFS', 'GA']
+        simulation.ghost_algorithms = ['A*', 'GA']
+        simulation.run_all_simulations()
+        loaded = simulation.load_results()
+    simulation.store.close()
+    simulation.outcomes.close()
+    return played, simulation.cached_games, loaded
+
+def test_sweep_reruns_only_changed_algorithms(tmp_path, monkeypatch):
+    pytest.importorskip('pygame')
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    from algorithms import registry
+
+    store, outcomes = tmp_path / 'games.sqlite', tmp_path / 'outcomes.sqlite'
+    played, cached, loaded = _sweep(store, outcomes, monkeypatch)
+    assert len(played) == 8 and cached == 0 and loaded == 8
+
+    # GA parametreleri değişti: aynı depoda yalnızca GA eşleşmeleri yeniden oynanır
+    module, class_name, params = registry.ALGORITHMS['GA']
+    monkeypatch.setitem(registry.ALGORITHMS, 'GA', (module, class_name, {**params, 'generations': 2}))
+    played, cached, loaded = _sweep(store, outcomes, monkeypatch)
+    assert sorted(played) == sorted([('A*', 'GA'), ('BFS', 'GA'), ('DFS', 'GA'),
+                                     ('GA', 'A*'), ('GA', 'GA')])
+    assert cached == 0
+    assert loaded == 8  # Eski GA oyunları özete katılmaz
+
+    # Depo sıfırlandı: deterministik eşleşmeler ayrı dosyadaki önbellekten gelir
+    played, cached, loaded = _sweep(tmp_path / 'fresh.sqlite', outcomes, monkeypatch)
+    assert len(played) == 8
+    assert cached == 3
+    assert loaded == 8
@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+
+from algorithms.dynamic_maze import DynamicMaze
+from algorithms.maze_grid import TiledGrid
+from algorithms.search_kernel import SearchKernel
+
+def _random_grid(rng, width, height, wall_ratio=0.3):
+    return [[1 if rng.random() < wall_ratio else 0 for _ in range(width)] for _ in range(height)]
+
+def _expected_neighbors(grid, kernel, cell):
+    x, y = kernel.position(cell)
+    if grid[y][x]:
+        return []
+    return [n for n in kernel.grid_neighbors(cell) if not grid[n // kernel.width][n % kernel.width]]
+
+def test_numpy_and_list_tables_match():
+    rng = random.Random(0)
+    for _ in range(10):
+        grid = _random_grid(rng, rng.randint(1, 20), rng.randint(1, 20))
+        from_lists = SearchKernel(grid)
+        from_tiles = SearchKernel(TiledGrid.from_array(np.array(grid, dtype=np.uint8), tile=4))
+        assert from_lists.open_dirs == from_tiles.open_dirs
+        assert from_lists.passable == from_tiles.passable
+        assert from_lists.xs == from_tiles.xs and from_lists.ys == from_tiles.ys
+        for cell in range(from_lists.size):
+            assert from_lists.neighbors(cell) == _expected_neighbors(grid, from_lists, cell)
+
+def test_repaired_distance_fields_match_fresh_bfs():
+    rng = random.Random(1)
+    for _ in range(100):
+        width, height = rng.randint(3, 12), rng.randint(3, 12)
+        maze = DynamicMaze(_random_grid(rng, width, height))
+        kernel = SearchKernel(maze)
+        sources = rng.sample(range(kernel.size), rng.randint(1, 3))
+        dist = kernel.distance_field(sources)
+        version = kernel.version
+        for _ in range(rng.randint(1, 5)):
+            for _ in range(rng.randint(1, 3)):
+                maze.set_wall(rng.randrange(width), rng.randrange(height), rng.random() < 0.5)
+            kernel.repair_distance_field(dist, sources, kernel.changes_since(version))
+            version = kernel.version
+
+            fresh = SearchKernel([list(row) for row in maze.grid])
+            assert dist == fresh.distance_field(sources)
+            assert kernel.open_dirs == fresh.open_dirs
+
+def test_search_sees_wall_changes_after_neighbors_were_cached():
+    maze = DynamicMaze([[0] * 5 for _ in range(3)])
+    kernel = SearchKernel(maze)
+
+    def search(start, goal):
+        gen = kernel.bfs(start, goal)
+        try:
+            while True:
+                next(gen)
+        except StopIteration as stop:
+            return stop.value
+
+    assert len(search((0, 1), (4, 1))) == 5
+    for y in range(3):
+        maze.set_wall(2, y)
+    assert search((0, 1), (4, 1)) == []
+    maze.set_wall(2, 0, False)
+    path = search((0, 1), (4, 1))
+    assert len(path) == 7 and (2, 0) in path
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from game.trajectory import TrajectoryBuffer, decode_path, encode_path
+
+def _random_walk(rng, length, size=40):
+    steps = np.array([(0, 1), (1, 0), (0, -1), (-1, 0), (0, 0)])
+    positions = np.cumsum(steps[rng.integers(0, 5, length - 1)], axis=0) + size
+    return np.vstack([[size, size], positions])
+
+def test_encode_decode_round_trip():
+    rng = np.random.default_rng(0)
+    for length in (1, 2, 17, 500):
+        path = _random_walk(rng, length)
+        blob = encode_path(path)
+        assert len(blob) == 4 + 2 * (length - 1)
+        assert (decode_path(blob) == path).all()
+    assert encode_path([]) == b''
+    assert decode_path(b'').shape == (0, 2)
+
+def test_encode_rejects_large_steps_and_bad_blobs():
+    with pytest.raises(ValueError):
+        encode_path([(0, 0), (200, 0)])
+    with pytest.raises(ValueError):
+        decode_path(b'\x01\x00\x02')
+
+def test_buffer_accepts_encoded_and_plain_paths():
+    rng = np.random.default_rng(1)
+    buffer = TrajectoryBuffer()
+    paths = {('A*', trial): _random_walk(rng, int(rng.integers(1, 300))) for trial in range(50)}
+    for index, (key, path) in enumerate(paths.items()):
+        buffer.add(key, encode_path(path) if index % 2 else path.tolist())
+    assert len(buffer) == len(paths)
+    for key, path in paths.items():
+        assert buffer.length(key) == len(path)
+        assert (buffer.get(key) == path).all()
+
+    # Aynı anahtar yeniden eklenince eski yolun yerini alır; ölü adımlar sıkıştırılır
+    for key in list(paths)[:40]:
+        paths[key] = _random_walk(rng, 5)
+        buffer.add(key, encode_path(paths[key]))
+    assert all((buffer.get(key) == path).all() for key, path in paths.items())
+
+def test_reservoir_keeps_uniform_sample_per_group():
+    buffer = TrajectoryBuffer(reservoir_size=10, seed=3)
+    kept = np.zeros(100)
+    for trial in range(100):
+        buffer.add(('GA', trial), [(trial % 30, 0), (trial % 30, 1)])
+    buffer.add(('A*', 0), [(1, 1)])
+    assert buffer.seen('GA') == 100
+    assert sum(1 for key in buffer if key[0] == 'GA') == 10
+    assert ('A*', 0) in buffer
+
+    # Çok sayıda tekrarda her yolun tutulma sıklığı yaklaşık eşittir
+    for seed in range(300):
+        buffer = TrajectoryBuffer(reservoir_size=10, seed=seed)
+        for trial in range(100):
+            buffer.add(('GA', trial), encode_path([(0, 0), (0, 1)]))
+        for key in buffer:
+            kept[key[1]] += 1
+    assert kept.sum() == 3000
+    assert kept.min() > 10 and kept.max() < 60
+
+def test_readding_a_kept_key_to_a_full_reservoir_replaces_its_path():
+    buffer = TrajectoryBuffer(reservoir_size=3, seed=0)
+    for trial in range(20):
+        buffer.add(('GA', trial), [(trial, 0), (trial, 1)])
+    kept = sorted(buffer)
+    assert len(kept) == 3
+    for key in kept:
+        assert buffer.add(key, [(5, 5), (6, 5), (6, 6)])
+    assert sorted(buffer) == kept
+    assert buffer.seen('GA') == 20
+    for key in kept:
+        assert buffer.get(key).tolist() == [[5, 5], [6, 5], [6, 6]]